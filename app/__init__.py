@@ -7,6 +7,8 @@ from flask import Flask, g, jsonify, request
 from flask_cors import CORS
 from flask_jwt_extended import JWTManager, jwt_required, get_jwt_identity
 
+# cli
+from .cli import register_cli
 # containers
 from .containers import Container
 # controllers
@@ -15,7 +17,7 @@ from .controllers.group_controller import group_bp
 from .controllers.task_controller import task_bp
 from .controllers.user_controller import user_bp
 # infrastructure
-from .infrastructure.database.db_connection import SessionLocal, engine
+from .infrastructure.database.db_connection import init_engine, warm_up_pool
 from .infrastructure.database.models import Base
 
 load_dotenv()
@@ -47,6 +49,21 @@ def create_app():
         expose_headers=["X-CSRF-TOKEN"],
         allow_headers=["X-CSRF-TOKEN", "Content-Type"])
     
+    # إعداد محرك قاعدة البيانات ومجموعة الاتصالات
+    engine = init_engine(
+        pool_class=os.getenv('DB_POOL_CLASS', 'QueuePool'),
+        pool_size=int(os.getenv('DB_POOL_SIZE', 5)),
+        max_overflow=int(os.getenv('DB_MAX_OVERFLOW', 10)),
+        pool_timeout=float(os.getenv('DB_POOL_TIMEOUT', 30)),
+        pool_recycle=int(os.getenv('DB_POOL_RECYCLE', -1)),
+        pool_pre_ping=os.getenv('DB_POOL_PRE_PING', 'False') == 'True'
+    )
+    
+    # تسخين المجموعة: فتح الاتصالات مسبقاً عند بدء التشغيل
+    warm_up_connections = int(os.getenv('DB_POOL_WARMUP', 0))
+    if warm_up_connections:
+        warm_up_pool(engine, warm_up_connections)
+    
     # إنشاء قاعدة البيانات (يمكن تفعيلها عند الحاجة فقط)
     #Base.metadata.create_all(bind=engine)
     
@@ -54,11 +71,7 @@ def create_app():
     container = Container()
     app.container = container
     
-    # إدارة جلسة قاعدة البيانات
-    @app.before_request
-    def create_session():
-        g.db_session = SessionLocal()
-        
+    # إدارة جلسة قاعدة البيانات: تُنشأ عند الحاجة عبر Container.db_session
     @app.teardown_appcontext
     def shutdown_session(exception=None):
         db_session = g.pop('db_session', None)
@@ -77,6 +90,9 @@ def create_app():
     app.register_blueprint(group_bp, url_prefix="/api/group")
     app.register_blueprint(task_bp, url_prefix="/api/task")
     
+    # أوامر الصيانة (flask purge-tokens)
+    register_cli(app)
+    
     from flask_jwt_extended import verify_jwt_in_request, get_jwt_identity,get_jwt
 
     @app.route("/api/test", methods=["GET", "POST"])
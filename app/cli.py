@@ -0,0 +1,53 @@
+import click
+from flask import current_app
+from flask.cli import with_appcontext
+
+
+@click.command("purge-tokens")
+@click.option("--batch-size", type=int, default=None, help="Rows deleted per transaction.")
+@with_appcontext
+def purge_tokens_command(batch_size):
+    # حذف توكنات التحقق وإعادة التعيين المنتهية أو المستخدمة على دفعات
+    report = current_app.container.purge_expired_tokens_usecase().execute(batch_size=batch_size)
+
+    for name, deleted in report.deleted.items():
+        click.echo(f"{name}: {deleted} rows deleted")
+    click.echo(f"Total: {report.total_deleted} rows in {report.elapsed_seconds:.3f}s ({report.batches} batches)")
+
+
+@click.command("archive-tasks")
+@click.option("--older-than-days", type=int, default=None, help="Archive tasks deleted or completed before this many days ago.")
+@click.option("--batch-size", type=int, default=None, help="Rows moved per transaction.")
+@with_appcontext
+def archive_tasks_command(older_than_days, batch_size):
+    # نقل المهام المحذوفة أو المكتملة القديمة إلى archived_tasks على دفعات
+    report = current_app.container.archive_tasks_usecase().execute(
+        older_than_days=older_than_days,
+        batch_size=batch_size
+    )
+
+    click.echo(
+        f"Archived {report.archived} tasks finished before {report.cutoff:%Y-%m-%d %H:%M} UTC "
+        f"in {report.elapsed_seconds:.3f}s ({report.batches} batches)"
+    )
+
+
+@click.command("reconcile-counters")
+@click.option("--dry-run", is_flag=True, help="Report drift without repairing it.")
+@with_appcontext
+def reconcile_counters_command(dry_run):
+    # مقارنة عدادات المهام المحفوظة بالقيم الفعلية وإصلاح المنحرف منها
+    report = current_app.container.reconcile_task_counters_usecase().execute(dry_run=dry_run)
+
+    for name, items in report.drift.items():
+        for item in items:
+            key = "user_id" if name == "users" else "group_id"
+            suffix = " (group no longer exists, skipped)" if item.get("orphaned") else ""
+            click.echo(f"{name} {item[key]}: stored {item['stored']} actual {item['actual']}{suffix}")
+    click.echo(f"Drift: {report.total_drift} rows, repaired {report.repaired} in {report.elapsed_seconds:.3f}s")
+
+
+def register_cli(app):
+    app.cli.add_command(purge_tokens_command)
+    app.cli.add_command(archive_tasks_command)
+    app.cli.add_command(reconcile_counters_command)
@@ -57,4 +57,20 @@ ERROR_MESSAGES = {
     
     # ✅ Task
     "TASK_NOT_FOUND": "Task not found.",
+    "EMPTY_BATCH": "At least one task is required.",
+    "BATCH_TOO_LARGE": "A batch can contain at most {max_batch_size} tasks.",
+    "INVALID_TASK_STATE": "Task state must be one of: completed, uncompleted, deleted.",
+    "SEARCH_QUERY_REQUIRED": "Search query must contain at least one word.",
+    "DUE_RANGE_REQUIRED": "Both start and end are required.",
+    "INVALID_DUE_RANGE": "Start must be before end.",
+    "INVALID_DATETIME": "Dates must be ISO 8601 strings, e.g. 2025-01-31T09:00:00Z.",
+    "INVALID_TIMEZONE": "Unknown time zone, expected an IANA name such as Asia/Riyadh.",
+
+    # ✅ Pagination
+    "INVALID_CURSOR": "Pagination cursor is invalid.",
+    "INVALID_LIMIT": "Limit must be between 1 and {max_limit}.",
+
+    # ✅ Maintenance
+    "INVALID_BATCH_SIZE": "Batch size must be a positive integer.",
+    "INVALID_ARCHIVE_AGE": "Archive age must be zero or more days.",
 }
@@ -0,0 +1,4 @@
+PAGINATION = {
+    "DEFAULT_LIMIT": 50,
+    "MAX_LIMIT": 200,
+}
@@ -0,0 +1,11 @@
+TASK_STATES = {
+    "COMPLETED": "completed",
+    "UNCOMPLETED": "uncompleted",
+    "DELETED": "deleted",
+}
+
+BULK_OUTCOMES = {
+    "UPDATED": "updated",
+    "NOT_FOUND": "not_found",
+    "ALREADY_IN_STATE": "already_in_state",
+}
@@ -4,6 +4,9 @@ from dependency_injector import containers, providers
 from dotenv import load_dotenv
 from flask import g
 
+# infrastructure
+from .infrastructure.database.db_connection import SessionLocal
+from .infrastructure.database.unit_of_work import UnitOfWork
 # repos
 from .repositories.group_repository import GroupRepository
 from .repositories.task_repository import TaskRepository
@@ -11,6 +14,7 @@ from .repositories.user_repository import UserRepository
 # services
 from .services.mail_service import MailService
 from .services.password_hashing_service import PasswordHashingService
+from .services.read_cache_service import ReadCacheService
 from .services.token_service import TokenService
 # use cases
 from .use_cases.groups.create_group_usecase import CreateGroupUseCase
@@ -19,17 +23,31 @@ from .use_cases.groups.get_group_usecase import GetGroupUseCase
 from .use_cases.groups.update_group_usecase import UpdateGroupUseCase
 
 from .use_cases.tasks.get_tasks_usecase import GetTaskUseCase
+from .use_cases.tasks.get_task_stats_usecase import GetTaskStatsUseCase
+from .use_cases.tasks.get_data_version_usecase import GetDataVersionUseCase
+from .use_cases.tasks.archive_tasks_usecase import ArchiveTasksUseCase
+from .use_cases.tasks.reconcile_task_counters_usecase import ReconcileTaskCountersUseCase
+from .use_cases.tasks.get_archived_tasks_usecase import \
+    GetArchivedTasksUseCase
+from .use_cases.tasks.get_due_tasks_usecase import GetDueTasksUseCase
+from .use_cases.tasks.get_overdue_tasks_usecase import GetOverdueTasksUseCase
+from .use_cases.tasks.bulk_update_task_state_usecase import \
+    BulkUpdateTaskStateUseCase
 from .use_cases.tasks.create_task_usecase import CreateTaskUseCase
+from .use_cases.tasks.create_tasks_batch_usecase import CreateTasksBatchUseCase
 from .use_cases.tasks.delete_task_usecase import DeleteTaskUseCase
 from .use_cases.tasks.mark_task_completed_usecase import \
     MarkTaskCompletedUseCase
 from .use_cases.tasks.mark_task_uncompleted_usecase import \
     MarkTaskUncompletedUseCase
+from .use_cases.tasks.search_tasks_usecase import SearchTasksUseCase
 from .use_cases.users.create_email_usecase import \
     CreateVerifiedEmailTokenUseCase
 from .use_cases.users.forgot_password_usecase import ForgotPasswordUseCase
 from .use_cases.users.get_user_usecase import GetUserUseCase
 from .use_cases.users.login_usecase import LoginUseCase
+from .use_cases.users.purge_expired_tokens_usecase import \
+    PurgeExpiredTokensUseCase
 from .use_cases.users.register_user_usecase import RegisterUserUseCase
 from .use_cases.users.reset_password_usecase import ResetPasswordUseCase
 from .use_cases.users.reset_username_usecase import ResetUsernameUseCase
@@ -37,11 +55,25 @@ from .use_cases.users.verified_email_usecase import VerifiedEmailUseCase
 
 load_dotenv()
 
+
+def get_db_session():
+    if "db_session" not in g:
+        g.db_session = SessionLocal()
+    return g.db_session
+
+
 class Container(containers.DeclarativeContainer):
 
     wiring_config = containers.WiringConfiguration(packages=[".controllers"])
 
-    db_session = providers.Factory(lambda: g.db_session)
+    # الجلسة تُنشأ عند أول مستودع يحتاجها فقط، والطلبات التي لا تلمس قاعدة البيانات لا تفتح جلسة
+    db_session = providers.Factory(get_db_session)
+
+    # معاملة واحدة لكل حالة استخدام كتابة على جلسة الطلب نفسها
+    unit_of_work = providers.Factory(
+        UnitOfWork,
+        session=db_session
+    )
 
     # ========== Repositories ==========
 
@@ -82,6 +114,14 @@ class Container(containers.DeclarativeContainer):
         token_expire_minutes=int(os.getenv("JWT_EXPIRE_MINUTES", 30))
     )
 
+    # ذاكرة قوائم المهام والمجموعات لكل مستخدم، مشتركة بين طلبات العملية الواحدة
+    read_cache = providers.Singleton(
+        ReadCacheService,
+        max_entries=int(os.getenv("READ_CACHE_MAX_ENTRIES", 1024)),
+        ttl_seconds=float(os.getenv("READ_CACHE_TTL_SECONDS", 30)),
+        enabled=os.getenv("READ_CACHE_ENABLED", "False") == "True"
+    )
+
     # ========== Use Cases ==========
 
     # --- Users ---
@@ -101,6 +141,7 @@ class Container(containers.DeclarativeContainer):
     register_user_usecase = providers.Factory(
         RegisterUserUseCase,
         user_repo=user_repository,
+        uow=unit_of_work,
         hashing_service=password_hashing_service,
         token_service=token_service,
         mail_service=mail_service,
@@ -110,6 +151,7 @@ class Container(containers.DeclarativeContainer):
     forgot_password_usecase = providers.Factory(
         ForgotPasswordUseCase,
         user_repo=user_repository,
+        uow=unit_of_work,
         token_service=token_service,
         mail_service=mail_service,
         base_url=os.getenv("APP_BASE_URL", "http://localhost:5000")
@@ -118,6 +160,7 @@ class Container(containers.DeclarativeContainer):
     create_verified_email_usecase = providers.Factory(
         CreateVerifiedEmailTokenUseCase,
         user_repo=user_repository,
+        uow=unit_of_work,
         token_service=token_service,
         mail_service=mail_service,
         base_url=os.getenv("APP_BASE_URL", "http://localhost:5000")
@@ -126,64 +169,150 @@ class Container(containers.DeclarativeContainer):
     reset_password_usecase = providers.Factory(
         ResetPasswordUseCase,
         user_repo=user_repository,
+        uow=unit_of_work,
         token_service=token_service,
         hashing_service=password_hashing_service
     )
 
     reset_username_usecase = providers.Factory(
         ResetUsernameUseCase,
-        user_repo=user_repository
+        user_repo=user_repository,
+        uow=unit_of_work
     )
 
     verified_email_usecase = providers.Factory(
         VerifiedEmailUseCase,
         user_repo=user_repository,
+        uow=unit_of_work,
         token_service=token_service
     )
 
+    purge_expired_tokens_usecase = providers.Factory(
+        PurgeExpiredTokensUseCase,
+        user_repo=user_repository,
+        uow=unit_of_work,
+        batch_size=int(os.getenv("TOKEN_PURGE_BATCH_SIZE", 1000))
+    )
+
     # --- Tasks ---
     create_task_usecase = providers.Factory(
         CreateTaskUseCase,
-        task_repository=task_repository
+        task_repository=task_repository,
+        uow=unit_of_work,
+        read_cache=read_cache
+    )
+
+    create_tasks_batch_usecase = providers.Factory(
+        CreateTasksBatchUseCase,
+        task_repository=task_repository,
+        uow=unit_of_work,
+        max_batch_size=int(os.getenv("TASK_BATCH_MAX_SIZE", 100)),
+        read_cache=read_cache
     )
 
     delete_task_usecase = providers.Factory(
         DeleteTaskUseCase,
-        task_repository=task_repository
+        task_repository=task_repository,
+        uow=unit_of_work,
+        read_cache=read_cache
     )
 
     mark_task_completed_usecase = providers.Factory(
         MarkTaskCompletedUseCase,
-        task_repository=task_repository
+        task_repository=task_repository,
+        uow=unit_of_work,
+        read_cache=read_cache
     )
 
     mark_task_uncompleted_usecase = providers.Factory(
         MarkTaskUncompletedUseCase,
-        task_repository=task_repository
+        task_repository=task_repository,
+        uow=unit_of_work,
+        read_cache=read_cache
+    )
+    
+    bulk_update_task_state_usecase = providers.Factory(
+        BulkUpdateTaskStateUseCase,
+        task_repository=task_repository,
+        uow=unit_of_work,
+        max_batch_size=int(os.getenv("TASK_BATCH_MAX_SIZE", 100)),
+        read_cache=read_cache
     )
     
     get_task_usecase = providers.Factory(
         GetTaskUseCase, 
-        task_repository=task_repository    
+        task_repository=task_repository,
+        read_cache=read_cache
+    )
+
+    archive_tasks_usecase = providers.Factory(
+        ArchiveTasksUseCase,
+        task_repository=task_repository,
+        uow=unit_of_work,
+        older_than_days=int(os.getenv("TASK_ARCHIVE_AFTER_DAYS", 90)),
+        batch_size=int(os.getenv("TASK_ARCHIVE_BATCH_SIZE", 1000))
+    )
+
+    reconcile_task_counters_usecase = providers.Factory(
+        ReconcileTaskCountersUseCase,
+        task_repository=task_repository,
+        uow=unit_of_work
+    )
+
+    get_archived_tasks_usecase = providers.Factory(
+        GetArchivedTasksUseCase,
+        task_repository=task_repository
+    )
+
+    get_due_tasks_usecase = providers.Factory(
+        GetDueTasksUseCase,
+        task_repository=task_repository
+    )
+
+    get_overdue_tasks_usecase = providers.Factory(
+        GetOverdueTasksUseCase,
+        task_repository=task_repository
+    )
+
+    get_task_stats_usecase = providers.Factory(
+        GetTaskStatsUseCase,
+        task_repository=task_repository
+    )
+
+    search_tasks_usecase = providers.Factory(
+        SearchTasksUseCase,
+        task_repository=task_repository
+    )
+
+    get_data_version_usecase = providers.Factory(
+        GetDataVersionUseCase,
+        task_repository=task_repository
     )
 
     # --- Groups ---
     create_group_usecase = providers.Factory(
         CreateGroupUseCase, 
-        group_repository=group_repository
+        group_repository=group_repository,
+        uow=unit_of_work,
+        read_cache=read_cache
     )
     
     delete_group_usecase = providers.Factory(
         DeleteGroupUseCase,
-        group_repository=group_repository
+        group_repository=group_repository,
+        uow=unit_of_work,
+        read_cache=read_cache
     )
 
     get_group_usecase = providers.Factory(
         GetGroupUseCase, 
-        group_repository=group_repository
+        group_repository=group_repository,
+        read_cache=read_cache
     )
 
     update_group_usecase = providers.Factory(
         UpdateGroupUseCase, 
-        group_repository=group_repository
+        group_repository=group_repository,
+        uow=unit_of_work,
+        read_cache=read_cache
     )
@@ -1,5 +1,7 @@
 from functools import wraps
-from flask import jsonify
+from flask import current_app, g, jsonify, make_response, request
+from flask_jwt_extended import get_jwt
+
 
 def handle_api_exceptions(f):
     @wraps(f)
@@ -32,3 +34,35 @@ def handle_api_exceptions(f):
             }), 500
     
     return decorated_function
+
+
+def _not_modified(etag: str):
+    response = current_app.response_class(status=304)
+    response.set_etag(etag)
+    response.headers["Cache-Control"] = "private, no-cache"
+    return response
+
+
+def _tagged(result, etag: str):
+    response = make_response(result)
+    if response.status_code == 200:
+        response.set_etag(etag)
+        response.headers["Cache-Control"] = "private, no-cache"
+    return response
+
+
+def conditional_on_data_version(f):
+    # ETag لقوائم المستخدم من data_version: طلب If-None-Match مطابق يُجاب بـ 304 دون تحميل الصفوف أو تسلسلها
+    @wraps(f)
+    def decorated_function(*args, **kwargs):
+        user_id = get_jwt()['user_id']
+        # يُقرأ الإصدار قبل تحميل القائمة: كتابة تقع بينهما تجعل الوسم أقدم من البيانات فلا يُرد 304 قديم
+        g.data_version = current_app.container.get_data_version_usecase().execute(user_id)
+        etag = f"{user_id}.{g.data_version}"
+
+        if request.if_none_match.contains(etag):
+            return _not_modified(etag)
+
+        return _tagged(f(*args, **kwargs), etag)
+
+    return decorated_function
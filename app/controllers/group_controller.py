@@ -6,14 +6,19 @@ from app.use_cases.groups.delete_group_usecase import DeleteGroupUseCase
 from app.use_cases.groups.get_group_usecase import GetGroupUseCase
 from app.use_cases.groups.update_group_usecase import UpdateGroupUseCase
 from dependency_injector.wiring import Provide, inject
-from flask import Blueprint, jsonify, request
+from flask import Blueprint, g, jsonify, request
 from flask_jwt_extended import get_jwt, jwt_required
 
-from ._decorator import handle_api_exceptions
+from ._decorator import conditional_on_data_version, handle_api_exceptions
 
 group_bp = Blueprint('group', __name__, url_prefix='/api/group')
 
 
+def _include_tasks_arg() -> bool:
+    # ?include_tasks=false يعيد ملخص المجموعات مع العدادات فقط بدون المهام
+    return request.args.get("include_tasks", "true").lower() != "false"
+
+
 @group_bp.route("/", methods=["POST"])
 @inject
 @jwt_required()
@@ -45,37 +50,53 @@ def delete_group(group_id, delete_usecase: DeleteGroupUseCase = Provide[Containe
     """حذف مجموعة (Soft Delete)"""
     user_id = get_jwt().get('user_id')
 
-    group = delete_usecase.execute(group_id, user_id)
+    deleted_tasks = delete_usecase.execute(group_id, user_id)
 
-    if not group:
+    if deleted_tasks is None:
         return jsonify({"done": False, "message": ERROR_MESSAGES["GROUP_NOT_FOUND"]}), 404
 
-    return jsonify({"done": True, "message": SUCCESS_MESSAGES["GROUP_DELETED_SUCCESS"]}), 200
+    return jsonify({
+        "done": True,
+        "message": SUCCESS_MESSAGES["GROUP_DELETED_SUCCESS"],
+        "deleted_tasks": deleted_tasks
+    }), 200
 
 
 @group_bp.route("/", methods=["GET"])
 @inject
 @jwt_required()
 @handle_api_exceptions
+@conditional_on_data_version
 def get_all_groups(get_usecase: GetGroupUseCase = Provide[Container.get_group_usecase]):
     """جلب جميع المجموعات للمستخدم"""
     user_id = get_jwt().get('user_id')
-    groups = get_usecase.get_all_groups(user_id)
-    if not groups:
+    page = get_usecase.get_all_groups(
+        user_id,
+        limit=request.args.get("limit", type=int),
+        cursor=request.args.get("cursor"),
+        include_tasks=_include_tasks_arg(),
+        data_version=g.data_version
+    )
+    if not page.items:
         return jsonify({"done": False, "message": ERROR_MESSAGES["GROUP_NOT_FOUND"]}), 404
     
-    return jsonify([group.to_dict() for group in groups]), 200
+    return jsonify({
+        "done": True,
+        "data": [group.to_dict() for group in page.items],
+        "next_cursor": page.next_cursor
+    }), 200
 
 
 @group_bp.route("/completed", methods=["GET"])
 @inject
 @jwt_required()
 @handle_api_exceptions
+@conditional_on_data_version
 def get_completed_groups(get_usecase: GetGroupUseCase = Provide[Container.get_group_usecase]):
     """جلب المجموعات المكتملة"""
     user_id = get_jwt().get('user_id')
 
-    groups = get_usecase.get_completed_groups(user_id)
+    groups = get_usecase.get_completed_groups(user_id, include_tasks=_include_tasks_arg())
     
     if not groups:
         return jsonify({"done": False, "message": ERROR_MESSAGES["GROUP_NOT_FOUND"]}), 404
@@ -87,11 +108,12 @@ def get_completed_groups(get_usecase: GetGroupUseCase = Provide[Container.get_gr
 @inject
 @jwt_required()
 @handle_api_exceptions
+@conditional_on_data_version
 def get_uncompleted_groups(get_usecase: GetGroupUseCase = Provide[Container.get_group_usecase]):
     """جلب المجموعات غير المكتملة"""
     user_id = get_jwt().get('user_id')
 
-    groups = get_usecase.get_uncompleted_groups(user_id)
+    groups = get_usecase.get_uncompleted_groups(user_id, include_tasks=_include_tasks_arg())
     
     if not groups:
         return jsonify({"done": False, "message": ERROR_MESSAGES["GROUP_NOT_FOUND"]}), 404
@@ -119,4 +141,4 @@ def update_group(group_id, update_usecase: UpdateGroupUseCase = Provide[Containe
     if not group:
         return jsonify({"done": False, "message": ERROR_MESSAGES["GROUP_NOT_FOUND"]}), 404
 
-    return jsonify({"done": True, "message": SUCCESS_MESSAGES["GROUP_UPDATED"], "data": group.__dict__}), 200
+    return jsonify({"done": True, "message": SUCCESS_MESSAGES["GROUP_UPDATED_SUCCESS"], "data": group.__dict__}), 200
@@ -2,19 +2,32 @@ from app.constants.error_messages import ERROR_MESSAGES
 from app.constants.success_messages import SUCCESS_MESSAGES
 from app.containers import Container
 # use cases
+from app.schemas.task_schemas import BulkTaskStateSchema, CreateTaskSchema
+from app.use_cases.tasks.bulk_update_task_state_usecase import \
+    BulkUpdateTaskStateUseCase
 from app.use_cases.tasks.create_task_usecase import CreateTaskUseCase
+from app.use_cases.tasks.create_tasks_batch_usecase import \
+    CreateTasksBatchUseCase
 from app.use_cases.tasks.delete_task_usecase import DeleteTaskUseCase
+from app.use_cases.tasks.get_archived_tasks_usecase import \
+    GetArchivedTasksUseCase
+from app.use_cases.tasks.get_due_tasks_usecase import GetDueTasksUseCase
+from app.use_cases.tasks.get_overdue_tasks_usecase import \
+    GetOverdueTasksUseCase
+from app.use_cases.tasks.get_task_stats_usecase import GetTaskStatsUseCase
 from app.use_cases.tasks.get_tasks_usecase import GetTaskUseCase
 from app.use_cases.tasks.mark_task_completed_usecase import \
     MarkTaskCompletedUseCase
 from app.use_cases.tasks.mark_task_uncompleted_usecase import \
     MarkTaskUncompletedUseCase
+from app.use_cases.tasks.search_tasks_usecase import SearchTasksUseCase
 # flask
 from dependency_injector.wiring import Provide, inject
-from flask import Blueprint, jsonify, request
+from flask import Blueprint, g, jsonify, request
 from flask_jwt_extended import get_jwt, jwt_required
+from webargs.flaskparser import use_args
 
-from ._decorator import handle_api_exceptions
+from ._decorator import conditional_on_data_version, handle_api_exceptions
 
 task_bp = Blueprint('task', __name__, url_prefix='/api/task')
 
@@ -43,10 +56,28 @@ def create_task(create_usecase: CreateTaskUseCase = Provide[Container.create_tas
 
     return jsonify(task.__dict__), 201
     
+@task_bp.route("/batch", methods=["POST"])
+@inject
+@jwt_required()
+@use_args(CreateTaskSchema(many=True), location="json")
+@handle_api_exceptions
+def create_tasks_batch(args, batch_usecase: CreateTasksBatchUseCase = Provide[Container.create_tasks_batch_usecase]):
+    """إضافة عدة مهام في طلب واحد"""
+    user_id = get_jwt()['user_id']
+
+    if not user_id:
+        return jsonify({"done": False, "message": ERROR_MESSAGES["USER_ID_REQUIRED"]}), 400
+
+    tasks = batch_usecase.execute(tasks=args, user_id=user_id)
+
+    return jsonify({"done": True, "data": [task.__dict__ for task in tasks]}), 201
+
+
 @task_bp.route("/", methods=["GET"])
 @inject
 @jwt_required()
 @handle_api_exceptions
+@conditional_on_data_version
 def get_all_tasks(get_usecase: GetTaskUseCase = Provide[Container.get_task_usecase]):
     """جلب جميع المجموعات للمستخدم"""
     
@@ -55,10 +86,126 @@ def get_all_tasks(get_usecase: GetTaskUseCase = Provide[Container.get_task_useca
     if not user_id:
         return jsonify({"done": False, "message": ERROR_MESSAGES["USER_ID_REQUIRED"]}), 400
 
-    tasks = get_usecase.get_all_tasks(user_id)
-    return jsonify([task.__dict__ for task in tasks]), 200
+    page = get_usecase.get_all_tasks(
+        user_id,
+        limit=request.args.get("limit", type=int),
+        cursor=request.args.get("cursor"),
+        data_version=g.data_version
+    )
+    return jsonify({
+        "done": True,
+        "data": [task.__dict__ for task in page.items],
+        "next_cursor": page.next_cursor
+    }), 200
+
+
+@task_bp.route("/archive", methods=["GET"])
+@inject
+@jwt_required()
+@handle_api_exceptions
+@conditional_on_data_version
+def get_archived_tasks(archive_usecase: GetArchivedTasksUseCase = Provide[Container.get_archived_tasks_usecase]):
+    """تصفح أرشيف مهام المستخدم"""
+    user_id = get_jwt()['user_id']
+
+    if not user_id:
+        return jsonify({"done": False, "message": ERROR_MESSAGES["USER_ID_REQUIRED"]}), 400
+
+    page = archive_usecase.execute(
+        user_id,
+        limit=request.args.get("limit", type=int),
+        cursor=request.args.get("cursor")
+    )
+    return jsonify({
+        "done": True,
+        "data": [task.__dict__ for task in page.items],
+        "next_cursor": page.next_cursor
+    }), 200
+
+
+@task_bp.route("/due", methods=["GET"])
+@inject
+@jwt_required()
+@handle_api_exceptions
+@conditional_on_data_version
+def get_due_tasks(due_usecase: GetDueTasksUseCase = Provide[Container.get_due_tasks_usecase]):
+    """المهام المفتوحة المستحقة بين start و end مرتبة حسب الموعد"""
+    user_id = get_jwt()['user_id']
+
+    if not user_id:
+        return jsonify({"done": False, "message": ERROR_MESSAGES["USER_ID_REQUIRED"]}), 400
+
+    page = due_usecase.execute(
+        user_id,
+        start=request.args.get("start"),
+        end=request.args.get("end"),
+        limit=request.args.get("limit", type=int),
+        cursor=request.args.get("cursor")
+    )
+    return jsonify({
+        "done": True,
+        "data": [task.__dict__ for task in page.items],
+        "next_cursor": page.next_cursor
+    }), 200
 
 
+@task_bp.route("/overdue", methods=["GET"])
+@inject
+@jwt_required()
+@handle_api_exceptions
+def get_overdue_tasks(overdue_usecase: GetOverdueTasksUseCase = Provide[Container.get_overdue_tasks_usecase]):
+    """المهام المفتوحة التي فات موعدها"""
+    user_id = get_jwt()['user_id']
+
+    if not user_id:
+        return jsonify({"done": False, "message": ERROR_MESSAGES["USER_ID_REQUIRED"]}), 400
+
+    page = overdue_usecase.execute(
+        user_id,
+        limit=request.args.get("limit", type=int),
+        cursor=request.args.get("cursor")
+    )
+    return jsonify({
+        "done": True,
+        "data": [task.__dict__ for task in page.items],
+        "next_cursor": page.next_cursor
+    }), 200
+
+
+@task_bp.route("/stats", methods=["GET"])
+@inject
+@jwt_required()
+@handle_api_exceptions
+def get_task_stats(stats_usecase: GetTaskStatsUseCase = Provide[Container.get_task_stats_usecase]):
+    """إحصاءات مهام المستخدم للوحة التحكم"""
+    user_id = get_jwt()['user_id']
+
+    if not user_id:
+        return jsonify({"done": False, "message": ERROR_MESSAGES["USER_ID_REQUIRED"]}), 400
+
+    stats = stats_usecase.execute(user_id, tz=request.args.get("tz"))
+    return jsonify({"done": True, "data": stats.to_dict()}), 200
+
+
+@task_bp.route("/search", methods=["GET"])
+@inject
+@jwt_required()
+@handle_api_exceptions
+@conditional_on_data_version
+def search_tasks(search_usecase: SearchTasksUseCase = Provide[Container.search_tasks_usecase]):
+    """بحث نصي في مهام المستخدم مرتب حسب الصلة"""
+    user_id = get_jwt()['user_id']
+
+    if not user_id:
+        return jsonify({"done": False, "message": ERROR_MESSAGES["USER_ID_REQUIRED"]}), 400
+
+    tasks = search_usecase.execute(
+        user_id,
+        query=request.args.get("q", ""),
+        limit=request.args.get("limit", type=int)
+    )
+    return jsonify({"done": True, "data": [task.__dict__ for task in tasks]}), 200
+
 
 @task_bp.route("/<int:task_id>", methods=["DELETE"])
 @inject
@@ -113,3 +260,23 @@ def mark_task_uncompleted(task_id, mark_usecase: MarkTaskUncompletedUseCase = Pr
         return jsonify({"done": False, "message": ERROR_MESSAGES["TASK_NOT_FOUND"]}), 404
 
     return jsonify(task.__dict__), 200
+
+
+@task_bp.route("/bulk", methods=["PATCH"])
+@inject
+@jwt_required()
+@use_args(BulkTaskStateSchema(), location="json")
+@handle_api_exceptions
+def bulk_update_task_state(args, bulk_usecase: BulkUpdateTaskStateUseCase = Provide[Container.bulk_update_task_state_usecase]):
+    """تغيير حالة عدة مهام (إكمال / إلغاء الإكمال / حذف) في طلب واحد"""
+    user_id = get_jwt()['user_id']
+
+    if not user_id:
+        return jsonify({"done": False, "message": ERROR_MESSAGES["USER_ID_REQUIRED"]}), 400
+
+    outcomes = bulk_usecase.execute(task_ids=args["ids"], user_id=user_id, state=args["state"])
+
+    return jsonify({
+        "done": True,
+        "data": [{"id": task_id, "result": outcome} for task_id, outcome in outcomes.items()]
+    }), 200
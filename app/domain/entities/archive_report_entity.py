@@ -0,0 +1,23 @@
+# domain/entities/archive_report_entity.py
+from datetime import datetime
+from typing import Optional
+
+
+class ArchiveReportEntity:
+    def __init__(self,
+                 archived: int = 0,
+                 cutoff: Optional[datetime] = None,
+                 batches: int = 0,
+                 elapsed_seconds: float = 0.0):
+        self.archived = archived
+        self.cutoff = cutoff
+        self.batches = batches
+        self.elapsed_seconds = elapsed_seconds
+
+    def to_dict(self):
+        return {
+            "archived": self.archived,
+            "cutoff": self.cutoff.isoformat() if self.cutoff else None,
+            "batches": self.batches,
+            "elapsed_seconds": self.elapsed_seconds
+        }
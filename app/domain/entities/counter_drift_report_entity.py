@@ -0,0 +1,24 @@
+# domain/entities/counter_drift_report_entity.py
+from typing import Dict, List, Optional
+
+
+class CounterDriftReportEntity:
+    def __init__(self,
+                 drift: Optional[Dict[str, List[dict]]] = None,
+                 repaired: int = 0,
+                 elapsed_seconds: float = 0.0):
+        self.drift = drift or {"users": [], "groups": []}
+        self.repaired = repaired
+        self.elapsed_seconds = elapsed_seconds
+
+    @property
+    def total_drift(self) -> int:
+        return sum(len(items) for items in self.drift.values())
+
+    def to_dict(self):
+        return {
+            "drift": self.drift,
+            "total_drift": self.total_drift,
+            "repaired": self.repaired,
+            "elapsed_seconds": self.elapsed_seconds
+        }
@@ -1,4 +1,4 @@
-from datetime import datetime
+from datetime import datetime, timezone
 from typing import List, Optional
 from .task_entity import TaskEntity
 
@@ -13,7 +13,10 @@ class GroupEntity:
                  created_at: Optional[datetime] = None,
                  updated_at: Optional[datetime] = None,
                  user_id: Optional[int] = None,
-                 tasks: Optional[List[TaskEntity]] = None
+                 tasks: Optional[List[TaskEntity]] = None,
+                 task_count: Optional[int] = None,
+                 open_count: Optional[int] = None,
+                 completed_count: Optional[int] = None
                  ):
         
         self.id = id
@@ -25,6 +28,9 @@ class GroupEntity:
         self.updated_at = updated_at
         self.user_id = user_id
         self.tasks = tasks or []
+        self.task_count = task_count
+        self.open_count = open_count
+        self.completed_count = completed_count
 
     def to_dict(self):
         return {
@@ -36,5 +42,8 @@ class GroupEntity:
             "created_at": self.created_at.isoformat() if self.created_at else None,
             "updated_at": self.updated_at.isoformat() if self.updated_at else None,
             "user_id": self.user_id,
-            "tasks": [task.to_dict() for task in self.tasks] if self.tasks else []
+            "tasks": [task.to_dict() for task in self.tasks] if self.tasks else [],
+            "task_count": self.task_count,
+            "open_count": self.open_count,
+            "completed_count": self.completed_count
         }
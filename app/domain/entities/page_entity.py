@@ -0,0 +1,12 @@
+# domain/entities/page_entity.py
+from typing import Generic, List, Optional, TypeVar
+
+T = TypeVar("T")
+
+
+class PageEntity(Generic[T]):
+    def __init__(self,
+                 items: Optional[List[T]] = None,
+                 next_cursor: Optional[str] = None):
+        self.items = items or []
+        self.next_cursor = next_cursor
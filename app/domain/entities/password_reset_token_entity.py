@@ -1,5 +1,5 @@
 # domain/entities/password_reset_token_entity.py
-from datetime import datetime
+from datetime import datetime, timezone
 from typing import Optional
 
 
@@ -0,0 +1,24 @@
+# domain/entities/purge_report_entity.py
+from typing import Dict, Optional
+
+
+class PurgeReportEntity:
+    def __init__(self,
+                 deleted: Optional[Dict[str, int]] = None,
+                 batches: int = 0,
+                 elapsed_seconds: float = 0.0):
+        self.deleted = deleted or {}
+        self.batches = batches
+        self.elapsed_seconds = elapsed_seconds
+
+    @property
+    def total_deleted(self) -> int:
+        return sum(self.deleted.values())
+
+    def to_dict(self):
+        return {
+            "deleted": self.deleted,
+            "total_deleted": self.total_deleted,
+            "batches": self.batches,
+            "elapsed_seconds": self.elapsed_seconds
+        }
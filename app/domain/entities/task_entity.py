@@ -14,7 +14,8 @@ class TaskEntity:
                  due_at: Optional[datetime] = None,
                  created_at: Optional[datetime] = None,
                  user_id: Optional[int] = None,
-                 group_id: Optional[int] = None):
+                 group_id: Optional[int] = None,
+                 updated_at: Optional[datetime] = None):
         self.id = id
         self.text = text
         self.is_deleted = is_deleted
@@ -25,6 +26,7 @@ class TaskEntity:
         self.created_at = created_at or datetime.now(timezone.utc)
         self.user_id = user_id
         self.group_id = group_id
+        self.updated_at = updated_at
         
         
     def to_dict(self):
@@ -38,6 +40,7 @@ class TaskEntity:
             "due_at": self.due_at.isoformat() if self.due_at else None,
             "created_at": self.created_at.isoformat() if self.created_at else None,
             "user_id": self.user_id,
-            "group_id": self.group_id
+            "group_id": self.group_id,
+            "updated_at": self.updated_at.isoformat() if self.updated_at else None
         }
         
\ No newline at end of file
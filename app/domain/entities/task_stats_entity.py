@@ -0,0 +1,24 @@
+# domain/entities/task_stats_entity.py
+
+
+class TaskStatsEntity:
+    def __init__(self,
+                 total: int = 0,
+                 open: int = 0,
+                 completed: int = 0,
+                 overdue: int = 0,
+                 completed_today: int = 0):
+        self.total = total
+        self.open = open
+        self.completed = completed
+        self.overdue = overdue
+        self.completed_today = completed_today
+
+    def to_dict(self):
+        return {
+            "total": self.total,
+            "open": self.open,
+            "completed": self.completed,
+            "overdue": self.overdue,
+            "completed_today": self.completed_today
+        }
@@ -0,0 +1,30 @@
+# domain/value_objects/cursor.py
+import base64
+import binascii
+from datetime import datetime
+
+from ...constants.error_messages import ERROR_MESSAGES
+
+
+class Cursor:
+    """موضع في قائمة مرتبة حسب (التاريخ، المعرف) للترقيم بدون OFFSET"""
+
+    def __init__(self, timestamp: datetime, id: int):
+        self.timestamp = timestamp
+        self.id = id
+
+    def encode(self) -> str:
+        raw = f"{self.timestamp.isoformat()}|{self.id}"
+        return base64.urlsafe_b64encode(raw.encode()).decode()
+
+    @classmethod
+    def decode(cls, token: str) -> "Cursor":
+        try:
+            raw = base64.urlsafe_b64decode(token.encode()).decode()
+            timestamp, id = raw.rsplit("|", 1)
+            return cls(timestamp=datetime.fromisoformat(timestamp), id=int(id))
+        except (ValueError, UnicodeDecodeError, binascii.Error):
+            raise ValueError(ERROR_MESSAGES["INVALID_CURSOR"])
+
+    def __eq__(self, other):
+        return isinstance(other, Cursor) and (self.timestamp, self.id) == (other.timestamp, other.id)
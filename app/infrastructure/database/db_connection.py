@@ -1,12 +1,93 @@
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, pool
+from sqlalchemy.engine import Engine
 from sqlalchemy.orm import sessionmaker
 from dotenv import load_dotenv
+from typing import Optional
+import logging
 import os
 
+from .routing_session import RoutingSession
+
 load_dotenv()
 
-DATABASE_URL = f"{os.getenv('DB_DRIVER')}://{os.getenv('DB_USER')}:{os.getenv('DB_PASSWORD')}@{os.getenv('DB_HOST')}:{os.getenv('DB_PORT')}/{os.getenv('DB_NAME')}"
+logger = logging.getLogger(__name__)
+
+DATABASE_URL = os.getenv("DATABASE_URL") or f"{os.getenv('DB_DRIVER')}://{os.getenv('DB_USER')}:{os.getenv('DB_PASSWORD')}@{os.getenv('DB_HOST')}:{os.getenv('DB_PORT')}/{os.getenv('DB_NAME')}"
+
+POOL_CLASSES = {
+    "QueuePool": pool.QueuePool,
+    "NullPool": pool.NullPool,
+    "StaticPool": pool.StaticPool,
+    "SingletonThreadPool": pool.SingletonThreadPool,
+}
+
+# نسخة متماثلة اختيارية للقراءة فقط
+DATABASE_REPLICA_URL = os.getenv("DATABASE_REPLICA_URL")
+
+# يتم إنشاء المحركات عند استدعاء init_engine داخل create_app
+engine = None
+replica_engine = None
+
+# لا تنتهي صلاحية الكائنات بعد commit: الكيانات تُبنى من القيم الموجودة في الذاكرة دون SELECT إضافي
+SessionLocal = sessionmaker(class_=RoutingSession, autocommit=False, autoflush=False, expire_on_commit=False)
+
+
+def create_db_engine(url: str = DATABASE_URL,
+                     pool_class: str = "QueuePool",
+                     pool_size: int = 5,
+                     max_overflow: int = 10,
+                     pool_timeout: float = 30,
+                     pool_recycle: int = -1,
+                     pool_pre_ping: bool = False) -> Engine:
+    if pool_class not in POOL_CLASSES:
+        raise ValueError(f"Unknown pool class '{pool_class}', expected one of: {', '.join(POOL_CLASSES)}")
+
+    options = {
+        "echo": False,
+        "poolclass": POOL_CLASSES[pool_class],
+        "pool_recycle": pool_recycle,
+        "pool_pre_ping": pool_pre_ping,
+    }
+
+    # حجم المجموعة والمهلة خاصة بـ QueuePool فقط
+    if pool_class == "QueuePool":
+        options.update(
+            pool_size=pool_size,
+            max_overflow=max_overflow,
+            pool_timeout=pool_timeout,
+        )
+
+    return create_engine(url, **options)
+
+
+def warm_up_pool(db_engine: Engine, connections: int) -> int:
+    # فتح عدد من الاتصالات مسبقاً ثم إعادتها إلى المجموعة حتى لا تدفع أولى الطلبات كلفة الاتصال
+    # المجموعة تحتفظ بـ pool_size اتصالاً فقط (اتصالات overflow تُغلق عند إعادتها)، وطلب أكثر من
+    # pool_size + max_overflow ينتظر pool_timeout ثم يُفشل بدء التشغيل، لذا يُقصر العدد على pool_size
+    capacity = db_engine.pool.size() if isinstance(db_engine.pool, pool.QueuePool) else 1
+    if connections > capacity:
+        logger.warning("DB_POOL_WARMUP=%s exceeds what the pool keeps; warming %s connections", connections, capacity)
+        connections = capacity
+
+    opened = []
+    try:
+        for _ in range(connections):
+            opened.append(db_engine.connect())
+    finally:
+        for connection in opened:
+            connection.close()
+
+    return len(opened)
+
+
+def init_engine(url: Optional[str] = None, replica_url: Optional[str] = None, **pool_options) -> Engine:
+    global engine, replica_engine
+
+    engine = create_db_engine(url or DATABASE_URL, **pool_options)
+
+    replica_url = replica_url or DATABASE_REPLICA_URL
+    replica_engine = create_db_engine(replica_url, **pool_options) if replica_url else None
 
-engine = create_engine(DATABASE_URL, echo=False)
+    SessionLocal.configure(bind=engine, replica_bind=replica_engine)
 
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
\ No newline at end of file
+    return engine
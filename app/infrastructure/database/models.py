@@ -1,10 +1,31 @@
 from datetime import datetime
 
-from sqlalchemy import (Boolean, Column, DateTime, ForeignKey, Integer, String)
+from sqlalchemy import (Boolean, Column, DateTime, ForeignKey, Index, Integer, String)
+from sqlalchemy import text
 from sqlalchemy.orm import declarative_base,relationship
 
+from .task_search import register_search_ddl
+
 Base = declarative_base()
 
+# شرط الفهارس الجزئية: الصفوف غير المحذوفة فقط (PostgreSQL و SQLite)
+LIVE_ROWS_WHERE = {
+    "postgresql_where": text("is_deleted = false"),
+    "sqlite_where": text("is_deleted = 0"),
+}
+
+# المهام المفتوحة ذات الموعد فقط: غير محذوفة وغير مكتملة و due_at محدد
+OPEN_DUE_ROWS_WHERE = {
+    "postgresql_where": text("is_deleted = false AND is_completed = false AND due_at IS NOT NULL"),
+    "sqlite_where": text("is_deleted = 0 AND is_completed = 0 AND due_at IS NOT NULL"),
+}
+
+# المهام المكتملة الحية: عدّ ما أُنجز اليوم حسب completed_at
+COMPLETED_ROWS_WHERE = {
+    "postgresql_where": text("is_deleted = false AND is_completed = true"),
+    "sqlite_where": text("is_deleted = 0 AND is_completed = 1"),
+}
+
 class User(Base):
     __tablename__ = "users"
 
@@ -12,6 +33,8 @@ class User(Base):
     username = Column(String(50), nullable=False, unique=True)
     password = Column(String(255), nullable=False)
     created_at = Column(DateTime, default=datetime.utcnow)
+
+    emails = relationship("Email", back_populates="user", order_by="Email.id")
     
 class Email(Base):
     __tablename__ = "emails"
@@ -23,6 +46,12 @@ class Email(Base):
     deleted_at = Column(DateTime, nullable=True) 
     verified_at = Column(DateTime, nullable=True) 
     user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
+
+    user = relationship("User", back_populates="emails")
+
+    __table_args__ = (
+        Index("ix_emails_user_id", "user_id"),
+    )
     
 class VerifiedEmailToken(Base):
     __tablename__ = "verified_email_tokens"
@@ -36,6 +65,10 @@ class VerifiedEmailToken(Base):
    
     email_id = Column(Integer, ForeignKey("emails.id"), nullable=False)
     user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
+
+    __table_args__ = (
+        Index("ix_verified_email_tokens_email_open", "email_id", "is_used", "expires_at"),
+    )
     
     
 class PasswordResetToken(Base):
@@ -48,6 +81,10 @@ class PasswordResetToken(Base):
     used_at = Column(DateTime, nullable=True)
     created_at = Column(DateTime, default=datetime.utcnow)
     user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
+
+    __table_args__ = (
+        Index("ix_password_reset_tokens_token_hash", "token_hash"),
+    )
         
 class Task(Base):
     __tablename__ = "tasks"
@@ -62,9 +99,62 @@ class Task(Base):
     created_at = Column(DateTime, default=datetime.utcnow)
     user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
     group_id = Column(Integer, ForeignKey("groups.id"), nullable=True)
+    updated_at = Column(DateTime, nullable=True)
     
     group = relationship("Group", back_populates="tasks")
 
+    __table_args__ = (
+        # قائمة مهام المستخدم مرتبة حسب (created_at, id)
+        Index("ix_tasks_user_created", "user_id", "created_at", "id"),
+        # المهام الحية فقط: فهارس جزئية حيث تدعمها قاعدة البيانات
+        Index(
+            "ix_tasks_user_live_completed", "user_id", "is_completed",
+            **LIVE_ROWS_WHERE,
+        ),
+        Index(
+            "ix_tasks_group_live", "group_id", "is_completed", "created_at",
+            **LIVE_ROWS_WHERE,
+        ),
+        # المهام المستحقة في فترة والمتأخرة، مرتبة حسب (due_at, id)
+        Index(
+            "ix_tasks_user_open_due", "user_id", "due_at", "id",
+            **OPEN_DUE_ROWS_WHERE,
+        ),
+        # عدد المهام المكتملة منذ بداية اليوم في الإحصاءات
+        Index(
+            "ix_tasks_user_completed_at", "user_id", "completed_at",
+            **COMPLETED_ROWS_WHERE,
+        ),
+        # معرفات المهام المؤرشفة لا يُعاد استخدامها على SQLite، فلا تتعارض مع archived_tasks.id
+        {"sqlite_autoincrement": True},
+    )
+
+
+register_search_ddl(Task.__table__)
+
+
+class ArchivedTask(Base):
+    # تخزين بارد للمهام المحذوفة أو المكتملة منذ مدة طويلة، خارج جدول tasks الساخن
+    __tablename__ = "archived_tasks"
+
+    id = Column(Integer, primary_key=True, autoincrement=False)
+    text = Column(String(200), nullable=False)
+    is_deleted = Column(Boolean, default=False)
+    is_completed = Column(Boolean, default=False)
+    deleted_at = Column(DateTime, nullable=True)
+    completed_at = Column(DateTime, nullable=True)
+    due_at = Column(DateTime, nullable=True)
+    created_at = Column(DateTime, nullable=True)
+    user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
+    # بدون مفتاح أجنبي: المجموعة قد تُحذف نهائياً بعد أرشفة مهامها
+    group_id = Column(Integer, nullable=True)
+    updated_at = Column(DateTime, nullable=True)
+    archived_at = Column(DateTime, nullable=False)
+
+    __table_args__ = (
+        Index("ix_archived_tasks_user_created", "user_id", "created_at", "id"),
+    )
+
 
 class Group(Base):
     __tablename__ = "groups"
@@ -77,5 +167,28 @@ class Group(Base):
     created_at = Column(DateTime, default=datetime.utcnow)
     updated_at = Column(DateTime, nullable=True)
     user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
+    # عدادات المهام الحية، تُحدَّث مع كل كتابة على المهام في نفس المعاملة
+    task_count = Column(Integer, nullable=False, default=0, server_default=text("0"))
+    open_count = Column(Integer, nullable=False, default=0, server_default=text("0"))
     
-    tasks = relationship("Task", back_populates="group",lazy="dynamic",cascade="all, delete-orphan",order_by="Task.created_at")
\ No newline at end of file
+    tasks = relationship("Task", back_populates="group",lazy="dynamic",cascade="all, delete-orphan",order_by="Task.created_at")
+
+    __table_args__ = (
+        Index("ix_groups_user_created", "user_id", "created_at", "id"),
+        Index(
+            "ix_groups_user_live_created", "user_id", "created_at",
+            **LIVE_ROWS_WHERE,
+        ),
+    )
+
+
+class UserTaskCounter(Base):
+    # عدادات مهام المستخدم الحية: قراءة الإحصاءات بصف واحد بدلاً من تجميع جدول tasks
+    __tablename__ = "user_task_counters"
+
+    user_id = Column(Integer, ForeignKey("users.id"), primary_key=True, autoincrement=False)
+    total = Column(Integer, nullable=False, default=0, server_default=text("0"))
+    open = Column(Integer, nullable=False, default=0, server_default=text("0"))
+    completed = Column(Integer, nullable=False, default=0, server_default=text("0"))
+    # يزداد مع كل كتابة على مهام المستخدم أو مجموعاته؛ يُستخدم ETag لقوائمه
+    data_version = Column(Integer, nullable=False, default=0, server_default=text("0"))
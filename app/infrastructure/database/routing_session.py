@@ -0,0 +1,30 @@
+from typing import Optional
+
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session
+from sqlalchemy.sql.dml import UpdateBase
+
+# مفاتيح session.info المستخدمة في التوجيه
+READ_ONLY_KEY = "read_only"
+USED_PRIMARY_KEY = "used_primary"
+
+
+class RoutingSession(Session):
+    # جلسة توجه عمليات القراءة المعلَّمة إلى النسخة المتماثلة وبقية العمليات إلى القاعدة الرئيسية
+    def __init__(self, *args, replica_bind: Optional[Engine] = None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.replica_bind = replica_bind
+
+    def get_bind(self, mapper=None, clause=None, **kwargs):
+        # أي كتابة تثبّت الجلسة على القاعدة الرئيسية حتى يرى الطلب ما كتبه (read-your-writes)
+        if self._flushing or isinstance(clause, UpdateBase):
+            self.info[USED_PRIMARY_KEY] = True
+
+        if (
+            self.replica_bind is not None
+            and self.info.get(READ_ONLY_KEY)
+            and not self.info.get(USED_PRIMARY_KEY)
+        ):
+            return self.replica_bind
+
+        return super().get_bind(mapper=mapper, clause=clause, **kwargs)
@@ -0,0 +1,94 @@
+import itertools
+import re
+from typing import List
+
+from sqlalchemy import DDL, Table, event
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql.base import _from_objects
+from sqlalchemy.sql.selectable import Join
+
+# فهرس البحث النصي في نص المهام: FTS5 على SQLite و GIN على tsvector في PostgreSQL
+TASKS_FTS_TABLE = "tasks_fts"
+TASKS_SEARCH_INDEX = "ix_tasks_user_text_search"
+# الفهرس السابق بدون user_id (ترحيل 0004)
+LEGACY_TASKS_SEARCH_INDEX = "ix_tasks_text_search"
+# إعداد 'simple' بدون تجذير لغوي: يعمل مع العربية والإنجليزية معاً
+TS_CONFIG = "simple"
+
+# جدول FTS5 بمحتوى خارجي (content=tasks) لا يكرر النص، والمشغلات تبقيه متزامناً
+# مع كل كتابة على tasks بما فيها UPDATE الجماعي والحذف عند الأرشفة
+SQLITE_SEARCH_DDL = [
+    f"CREATE VIRTUAL TABLE IF NOT EXISTS {TASKS_FTS_TABLE} USING fts5("
+    f"text, content='tasks', content_rowid='id', tokenize='unicode61 remove_diacritics 2')",
+    f"CREATE TRIGGER IF NOT EXISTS {TASKS_FTS_TABLE}_ai AFTER INSERT ON tasks BEGIN "
+    f"INSERT INTO {TASKS_FTS_TABLE}(rowid, text) VALUES (new.id, new.text); END",
+    f"CREATE TRIGGER IF NOT EXISTS {TASKS_FTS_TABLE}_ad AFTER DELETE ON tasks BEGIN "
+    f"INSERT INTO {TASKS_FTS_TABLE}({TASKS_FTS_TABLE}, rowid, text) VALUES ('delete', old.id, old.text); END",
+    f"CREATE TRIGGER IF NOT EXISTS {TASKS_FTS_TABLE}_au AFTER UPDATE OF text ON tasks BEGIN "
+    f"INSERT INTO {TASKS_FTS_TABLE}({TASKS_FTS_TABLE}, rowid, text) VALUES ('delete', old.id, old.text); "
+    f"INSERT INTO {TASKS_FTS_TABLE}(rowid, text) VALUES (new.id, new.text); END",
+]
+
+SQLITE_SEARCH_DROP = [
+    f"DROP TRIGGER IF EXISTS {TASKS_FTS_TABLE}_au",
+    f"DROP TRIGGER IF EXISTS {TASKS_FTS_TABLE}_ad",
+    f"DROP TRIGGER IF EXISTS {TASKS_FTS_TABLE}_ai",
+    f"DROP TABLE IF EXISTS {TASKS_FTS_TABLE}",
+]
+
+# إعادة بناء الفهرس من الصفوف الموجودة (عند إضافته إلى قاعدة قائمة)
+SQLITE_SEARCH_REBUILD = f"INSERT INTO {TASKS_FTS_TABLE}({TASKS_FTS_TABLE}) VALUES ('rebuild')"
+
+# فهرس على التعبير نفسه المستخدم في الاستعلام، مسبوقاً بـ user_id (يتطلب btree_gin) ومقصوراً على المهام الحية،
+# فيبحث GIN في مهام المستخدم فقط بدلاً من مطابقات جميع المستخدمين
+POSTGRES_SEARCH_DDL = [
+    "CREATE EXTENSION IF NOT EXISTS btree_gin",
+    f"CREATE INDEX IF NOT EXISTS {TASKS_SEARCH_INDEX} ON tasks USING gin (user_id, to_tsvector('{TS_CONFIG}', text)) "
+    f"WHERE is_deleted = false",
+]
+
+POSTGRES_SEARCH_DROP = [
+    f"DROP INDEX IF EXISTS {TASKS_SEARCH_INDEX}",
+]
+
+
+def search_terms(query: str) -> List[str]:
+    # كلمات الاستعلام فقط: تُهمل علامات الترقيم ومعاملات FTS5 / tsquery
+    return re.findall(r"\w+", (query or "").lower())
+
+
+def is_search_object(name: str) -> bool:
+    # كائنات خارج Base.metadata يجب أن يتجاهلها alembic autogenerate
+    return bool(name) and (name.startswith(TASKS_FTS_TABLE) or name in (TASKS_SEARCH_INDEX, LEGACY_TASKS_SEARCH_INDEX))
+
+
+class OrderedJoin(Join):
+    # JOIN يثبت ترتيب الجدولين على SQLite: الجدول الأيسر هو الحلقة الخارجية
+    inherit_cache = True
+
+
+@compiles(OrderedJoin, "sqlite")
+def _compile_ordered_join(join, compiler, asfrom=False, from_linter=None, **kw):
+    # CROSS JOIN هو الطريقة الوحيدة في SQLite لمنع المخطط من تبديل ترتيب الجداول
+    if from_linter:
+        from_linter.edges.update(
+            itertools.product(_from_objects(join.left), _from_objects(join.right))
+        )
+
+    return (
+        join.left._compiler_dispatch(compiler, asfrom=True, from_linter=from_linter, **kw)
+        + " CROSS JOIN "
+        + join.right._compiler_dispatch(compiler, asfrom=True, from_linter=from_linter, **kw)
+        + " ON "
+        + join.onclause._compiler_dispatch(compiler, from_linter=from_linter, **kw)
+    )
+
+
+def register_search_ddl(tasks_table: Table) -> None:
+    # إنشاء الفهرس مع create_all (الاختبارات وقواعد التطوير)، والترحيلات تنشئه عبر 0004
+    for statement in SQLITE_SEARCH_DDL:
+        event.listen(tasks_table, "after_create", DDL(statement).execute_if(dialect="sqlite"))
+    for statement in SQLITE_SEARCH_DROP:
+        event.listen(tasks_table, "before_drop", DDL(statement).execute_if(dialect="sqlite"))
+    for statement in POSTGRES_SEARCH_DDL:
+        event.listen(tasks_table, "after_create", DDL(statement).execute_if(dialect="postgresql"))
@@ -0,0 +1,25 @@
+from sqlalchemy.orm import Session
+
+from ...interfaces.unit_of_work_interface import IUnitOfWork
+
+
+class UnitOfWork(IUnitOfWork):
+    # معاملة واحدة لكل حالة استخدام: المستودعات تكتفي بـ flush والالتزام يتم مرة واحدة هنا
+    def __init__(self, session: Session):
+        self.session = session
+
+    def __enter__(self) -> "UnitOfWork":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> bool:
+        if exc_type is None:
+            self.commit()
+        else:
+            self.rollback()
+        return False
+
+    def commit(self) -> None:
+        self.session.commit()
+
+    def rollback(self) -> None:
+        self.session.rollback()
@@ -1,19 +1,24 @@
-from typing import List, Optional, Protocol
+from typing import Dict, List, Optional, Protocol
+
+from sqlalchemy import Select
+from sqlalchemy.engine import Row
 
 from ..domain.entities.group_entity import GroupEntity
 from ..domain.entities.task_entity import TaskEntity
+from ..domain.value_objects.cursor import Cursor
 from ..infrastructure.database.models import Group, Task
 
 
 class IGroupRepository(Protocol):
 
-    def get_groups(self, user_id: int) -> List[GroupEntity]:
+    def get_groups(self, user_id: int, limit: Optional[int] = None, after: Optional[Cursor] = None,
+                   include_tasks: bool = True) -> List[GroupEntity]:
         ...
 
-    def get_groups_uncomplete(self, user_id: int) -> List[GroupEntity]:
+    def get_groups_uncomplete(self, user_id: int, include_tasks: bool = True) -> List[GroupEntity]:
         ...
 
-    def get_groups_complete(self, user_id: int) -> List[GroupEntity]:
+    def get_groups_complete(self, user_id: int, include_tasks: bool = True) -> List[GroupEntity]:
         ...
 
     def create_group(self, group: GroupEntity) -> GroupEntity:
@@ -22,7 +27,7 @@ class IGroupRepository(Protocol):
     def update_group(self,group: GroupEntity) -> Optional[GroupEntity]:
         ...
 
-    def delete_group(self, group_id: int, user_id:int) -> bool:
+    def delete_group(self, group_id: int, user_id:int) -> Optional[int]:
         ...
     
     # helper
@@ -30,5 +35,14 @@ class IGroupRepository(Protocol):
     def _convert_to_task_entity(self, db_task: Task) -> TaskEntity:
         ...
     
-    def _convert_to_group_entity(self, db_group: Group, include_tasks: bool = False) -> GroupEntity:
+    def _load_tasks_by_group(self, group_ids: List[int]) -> Dict[int, List[TaskEntity]]:
+        ...
+
+    def _group_summary_query(self) -> Select:
+        ...
+
+    def _convert_groups_with_tasks(self, db_groups: List[Row], include_tasks: bool = True) -> List[GroupEntity]:
+        ...
+    
+    def _convert_to_group_entity(self, db_group: Group, tasks: Optional[List[TaskEntity]] = None) -> GroupEntity:
         ...
\ No newline at end of file
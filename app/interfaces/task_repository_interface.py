@@ -1,17 +1,25 @@
-from typing import List, Optional, Protocol
+from datetime import datetime
+from typing import Dict, List, Optional, Protocol
+
+from sqlalchemy.engine import Row
 
 from app.domain.entities.task_entity import TaskEntity
+from app.domain.entities.task_stats_entity import TaskStatsEntity
+from app.domain.value_objects.cursor import Cursor
 from app.infrastructure.database.models import Task
 
 
 class ITaskRepository(Protocol):
     
-    def get_tasks(slef, user_id: int) -> List[TaskEntity] :
+    def get_tasks(self, user_id: int, limit: Optional[int] = None, after: Optional[Cursor] = None) -> List[TaskEntity] :
         ...
                 
     def create_task(self, task: TaskEntity,user_id: int) -> TaskEntity:
         ...
 
+    def create_tasks(self, tasks: List[TaskEntity]) -> List[TaskEntity]:
+        ...
+
     def mark_task_completed(self, task_id: int,user_id: int) -> Optional[TaskEntity]:
         ...
 
@@ -20,8 +28,44 @@ class ITaskRepository(Protocol):
 
     def delete_task(self, task_id: int,user_id: int) -> bool:
         ...
+
+    def bulk_update_state(self, task_ids: List[int], user_id: int, state: str) -> Dict[int, str]:
+        ...
+
+    def archive_tasks(self, before: datetime, batch_size: int) -> int:
+        ...
+
+    def get_archived_tasks(self, user_id: int, limit: Optional[int] = None, after: Optional[Cursor] = None) -> List[TaskEntity]:
+        ...
+
+    def get_task_stats(self, user_id: int, now: datetime, day_start: datetime) -> TaskStatsEntity:
+        ...
+
+    def search_tasks(self, user_id: int, query: str, limit: Optional[int] = None) -> List[TaskEntity]:
+        ...
+
+    def get_data_version(self, user_id: int) -> int:
+        ...
+
+    def find_counter_drift(self) -> Dict[str, List[dict]]:
+        ...
+
+    def repair_counters(self, drift: Dict[str, List[dict]]) -> int:
+        ...
+
+    def get_tasks_due(self, user_id: int, start: datetime, end: datetime, limit: Optional[int] = None, after: Optional[Cursor] = None) -> List[TaskEntity]:
+        ...
+
+    def get_overdue_tasks(self, user_id: int, now: datetime, limit: Optional[int] = None, after: Optional[Cursor] = None) -> List[TaskEntity]:
+        ...
         
     # helper
+
+    def _update_task(self, task_id: int, user_id: int, **values) -> Optional[TaskEntity]:
+        ...
     
     def _convert_to_entity (self,db_task: Task) -> TaskEntity :
         ...
+
+    def _row_to_entity(self, row: Row) -> TaskEntity:
+        ...
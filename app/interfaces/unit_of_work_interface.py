@@ -0,0 +1,16 @@
+from typing import Protocol
+
+
+class IUnitOfWork(Protocol):
+    
+    def __enter__(self) -> "IUnitOfWork":
+        ...
+    
+    def __exit__(self, exc_type, exc_value, traceback) -> bool:
+        ...
+    
+    def commit(self) -> None:
+        ...
+    
+    def rollback(self) -> None:
+        ...
@@ -1,4 +1,7 @@
-from typing import List, Optional, Protocol, Tuple
+from datetime import datetime
+from typing import Dict, List, Optional, Protocol, Tuple
+
+from sqlalchemy import Select
 
 from app.domain.entities.email_entity import EmailEntity
 from app.domain.entities.password_reset_token_entity import \
@@ -52,6 +55,12 @@ class IUserRepository(Protocol):
     def update_username(slef,old_username:str,new_username:str) -> Optional[UserEntity]:
         ...
     
+    def purge_verified_email_tokens(self, before: datetime, batch_size: int) -> int:
+        ...
+    
+    def purge_password_reset_tokens(self, before: datetime, batch_size: int) -> int:
+        ...
+    
         
     # helper
     
@@ -67,6 +76,18 @@ class IUserRepository(Protocol):
     def _convert_password_token_to_entity(self, db_token: PasswordResetToken) -> PasswordResetTokenEntity:
         ...
     
+    def _user_with_emails_query(self) -> Select:
+        ...
+    
+    def _load_user(self, *criteria) -> Optional[User]:
+        ...
+    
+    def _insert_emails(self, values: List[dict]) -> Dict[str, int]:
+        ...
+    
+    def _purge_tokens(self, model, before: datetime, batch_size: int) -> int:
+        ...
+    
     
     
     
\ No newline at end of file
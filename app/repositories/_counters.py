@@ -0,0 +1,111 @@
+from collections import defaultdict
+from typing import Optional, Tuple
+
+from sqlalchemy import bindparam, insert, update
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import Session
+
+from ..infrastructure.database.models import Group, UserTaskCounter
+
+# حالة المهمة كما تراها العدادات: (is_deleted, is_completed)
+TaskState = Tuple[bool, bool]
+
+USER_COUNTER_COLUMNS = ("total", "open", "completed")
+
+# INSERT ... ON CONFLICT DO UPDATE حيث تدعمه قاعدة البيانات
+UPSERT_INSERTS = {
+    "sqlite": sqlite.insert,
+    "postgresql": postgresql.insert,
+}
+
+user_counters = UserTaskCounter.__table__
+groups = Group.__table__
+
+
+def task_counts(state: Optional[TaskState]) -> Tuple[int, int, int]:
+    # مساهمة مهمة واحدة في (total, open, completed)، المهام المحذوفة أو غير الموجودة لا تُعد
+    if state is None or state[0]:
+        return 0, 0, 0
+    return (1, 0, 1) if state[1] else (1, 1, 0)
+
+
+class CounterChanges:
+    # تجميع فروقات العدادات لكل مستخدم ومجموعة ثم تطبيقها بعبارة واحدة لكل جدول
+    # كل مستخدم مسجَّل هنا تزداد data_version له في نفس العبارة، حتى لو لم تتغير أعداده
+    def __init__(self):
+        self.users = defaultdict(lambda: [0, 0, 0])
+        self.groups = defaultdict(lambda: [0, 0])
+
+    def touch(self, user_id: int) -> "CounterChanges":
+        self.users[user_id]
+        return self
+
+    def add(self, user_id: int, group_id: Optional[int],
+            before: Optional[TaskState] = None, after: Optional[TaskState] = None) -> None:
+        delta = [new - old for new, old in zip(task_counts(after), task_counts(before))]
+        self.shift_user(user_id, delta)
+
+        if group_id is not None:
+            self.shift_group(group_id, delta[:2])
+
+    def shift_user(self, user_id: int, delta) -> None:
+        user = self.users[user_id]
+        for index, value in enumerate(delta):
+            user[index] += value
+
+    def shift_group(self, group_id: int, delta) -> None:
+        if not any(delta):
+            return
+
+        group = self.groups[group_id]
+        for index, value in enumerate(delta):
+            group[index] += value
+
+    def apply(self, session: Session) -> None:
+        users = [
+            dict(zip(USER_COUNTER_COLUMNS, values), user_id=user_id)
+            for user_id, values in self.users.items()
+        ]
+        group_rows = [
+            {"b_group_id": group_id, "b_tasks": tasks, "b_open": open_tasks}
+            for group_id, (tasks, open_tasks) in self.groups.items() if tasks or open_tasks
+        ]
+
+        if users:
+            _add_to_user_counters(session, users)
+
+        if group_rows:
+            session.execute(
+                update(groups).where(groups.c.id == bindparam("b_group_id")).values(
+                    task_count=groups.c.task_count + bindparam("b_tasks"),
+                    open_count=groups.c.open_count + bindparam("b_open")
+                ),
+                group_rows
+            )
+
+
+def _add_to_user_counters(session: Session, rows) -> None:
+    upsert = UPSERT_INSERTS.get(session.get_bind().dialect.name)
+
+    if upsert is not None:
+        stmt = upsert(user_counters)
+        stmt = stmt.values(data_version=1).on_conflict_do_update(
+            index_elements=[user_counters.c.user_id],
+            set_={
+                **{name: user_counters.c[name] + stmt.excluded[name] for name in USER_COUNTER_COLUMNS},
+                "data_version": user_counters.c.data_version + 1
+            }
+        )
+        session.execute(stmt, rows)
+        return
+
+    # قواعد بدون ON CONFLICT: تحديث الصف ثم إنشاؤه إن لم يوجد
+    for row in rows:
+        result = session.execute(
+            update(user_counters).where(user_counters.c.user_id == row["user_id"]).values(
+                **{name: user_counters.c[name] + row[name] for name in USER_COUNTER_COLUMNS},
+                data_version=user_counters.c.data_version + 1
+            )
+        )
+        if result.rowcount == 0:
+            session.execute(insert(user_counters).values(**row, data_version=1))
@@ -1,6 +1,8 @@
 from functools import wraps
 from sqlalchemy.exc import SQLAlchemyError
 
+from ..infrastructure.database.routing_session import READ_ONLY_KEY
+
 class RepositoryError(Exception):
     def __init__(self, message: str, original_exception: Exception = None):
         super().__init__(message)
@@ -23,3 +25,16 @@ def handle_db_errors(func):
         except Exception as e:
             raise RepositoryError(f"Unexpected error: {str(e)}") from e
     return wrapper
+
+def read_only(func):
+    # تعليم الاستعلام كقراءة فقط ليوجَّه إلى النسخة المتماثلة إن وُجدت
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        info = args[0].session.info
+        previous = info.get(READ_ONLY_KEY, False)
+        info[READ_ONLY_KEY] = True
+        try:
+            return func(*args, **kwargs)
+        finally:
+            info[READ_ONLY_KEY] = previous
+    return wrapper
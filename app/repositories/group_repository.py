@@ -1,14 +1,19 @@
+from collections import defaultdict
 from datetime import datetime, timezone
-from typing import List, Optional
+from typing import Dict, List, Optional
 
+from sqlalchemy import Select, select, tuple_, update
+from sqlalchemy.engine import Row
 from sqlalchemy.orm import Session
 
 from ..constants.error_messages import ERROR_MESSAGES
 from ..domain.entities.group_entity import GroupEntity
 from ..domain.entities.task_entity import TaskEntity
+from ..domain.value_objects.cursor import Cursor
 from ..infrastructure.database.models import Group, Task
 from ..interfaces.group_repository_interface import IGroupRepository
-from ._decorator import handle_db_errors
+from ._counters import CounterChanges
+from ._decorator import handle_db_errors, read_only
 
 
 class GroupRepository(IGroupRepository):
@@ -16,47 +21,60 @@ class GroupRepository(IGroupRepository):
         self.session = session
 
     @handle_db_errors
-    def get_groups(self, user_id: int) -> List[GroupEntity]:
-        db_groups = self.session.query(Group).filter(
+    @read_only
+    def get_groups(self, user_id: int, limit: Optional[int] = None, after: Optional[Cursor] = None,
+                   include_tasks: bool = True) -> List[GroupEntity]:
+        stmt = self._group_summary_query().where(
             Group.user_id == user_id,
-        ).order_by(Group.created_at.desc()).all()
+        )
+
+        if after is not None:
+            stmt = stmt.where(tuple_(Group.created_at, Group.id) < tuple_(after.timestamp, after.id))
+
+        stmt = stmt.order_by(Group.created_at.desc(), Group.id.desc())
+
+        if limit is not None:
+            stmt = stmt.limit(limit)
+
+        db_groups = self.session.execute(stmt).all()
 
         if not db_groups:
             return None
         
-        return [self._convert_to_group_entity(group,include_tasks=True) for group in db_groups]
+        return self._convert_groups_with_tasks(db_groups, include_tasks)
 
     @handle_db_errors
-    def get_groups_uncomplete(self, user_id: int) -> List[GroupEntity]:
-        db_groups = self.session.query(Group).filter(
-            Group.user_id == user_id,
-            Group.is_deleted == False,
-            Group.tasks.any(
-                Task.is_completed == False,
-                Task.is_deleted == False
-            )
-        ).order_by(Group.created_at.desc()).all()
+    @read_only
+    def get_groups_uncomplete(self, user_id: int, include_tasks: bool = True) -> List[GroupEntity]:
+        db_groups = self.session.execute(
+            self._group_summary_query().where(
+                Group.user_id == user_id,
+                Group.is_deleted == False,
+                Group.open_count > 0
+            ).order_by(Group.created_at.desc())
+        ).all()
 
         if not db_groups:
             return None
 
-        return [self._convert_to_group_entity(group, include_tasks=True) for group in db_groups]
+        return self._convert_groups_with_tasks(db_groups, include_tasks)
 
     @handle_db_errors
-    def get_groups_complete(self, user_id: int) -> List[GroupEntity]:
-        db_groups = self.session.query(Group).filter(
-            Group.user_id == user_id,
-            Group.is_deleted == False,
-            ~Group.tasks.any(
-                Task.is_completed == False,
-                Task.is_deleted == False
-            )
-        ).order_by(Group.created_at.desc()).all()
+    @read_only
+    def get_groups_complete(self, user_id: int, include_tasks: bool = True) -> List[GroupEntity]:
+        # المجموعة مكتملة إذا لم تبقَ فيها مهام مفتوحة (بما فيها المجموعات الفارغة)
+        db_groups = self.session.execute(
+            self._group_summary_query().where(
+                Group.user_id == user_id,
+                Group.is_deleted == False,
+                Group.open_count == 0
+            ).order_by(Group.created_at.desc())
+        ).all()
 
         if not db_groups:
             return None
 
-        return [self._convert_to_group_entity(group, include_tasks=True) for group in db_groups]
+        return self._convert_groups_with_tasks(db_groups, include_tasks)
 
     @handle_db_errors
     def create_group(self, group: GroupEntity) -> GroupEntity:
@@ -68,50 +86,89 @@ class GroupRepository(IGroupRepository):
         )
 
         self.session.add(db_group)
-        self.session.commit()
-        self.session.refresh(db_group)
+        self.session.flush()
+        CounterChanges().touch(db_group.user_id).apply(self.session)
 
         return self._convert_to_group_entity(db_group)
 
     @handle_db_errors
     def update_group(self, group: GroupEntity) -> Optional[GroupEntity]:
-        db_group = self.session.query(Group).filter(
-            Group.id == group.id,
-            Group.is_deleted == False
-        ).first()
+        conditions = [Group.id == group.id, Group.is_deleted == False]
+        if group.user_id is not None:
+            # تحديث مجموعة المستخدم نفسه فقط
+            conditions.append(Group.user_id == group.user_id)
 
-        if not db_group:
+        stmt = update(Group).where(*conditions).values(
+            name=group.name,
+            description=group.description,
+            updated_at=group.updated_at or datetime.now(timezone.utc)
+        ).execution_options(synchronize_session=False)
+
+        if self.session.get_bind().dialect.update_returning:
+            # ذهاب وإياب واحد: UPDATE ... RETURNING
+            row = self.session.execute(stmt.returning(*Group.__table__.c)).first()
+        elif self.session.execute(stmt).rowcount:
+            row = self.session.execute(
+                select(*Group.__table__.c).where(Group.id == group.id)
+            ).first()
+        else:
+            row = None
+
+        if row is None:
             return None
 
-        db_group.name = group.name
-        db_group.description = group.description
-        db_group.updated_at = datetime.now(timezone.utc)
-
-        self.session.commit()
-        return self._convert_to_group_entity(db_group)
+        CounterChanges().touch(row.user_id).apply(self.session)
+        return self._convert_to_group_entity(row)
 
     @handle_db_errors
-    def delete_group(self, group_id: int,user_id : int) -> bool:
-        db_group = self.session.query(Group).filter(
-            Group.id == group_id,
-            Group.is_deleted == False,
-            Group.user_id == user_id
-        ).first()
-        
-        print (db_group.__dir__)
-
-        if not db_group:
-            return False
-
-        db_group.is_deleted = True
-        db_group.deleted_at = datetime.now(timezone.utc)
+    def delete_group(self, group_id: int,user_id : int) -> Optional[int]:
+        deleted_at = datetime.now(timezone.utc)
+
+        # تصفير عدادات المجموعة في نفس عبارة الحذف
+        result = self.session.execute(
+            update(Group).where(
+                Group.id == group_id,
+                Group.is_deleted == False,
+                Group.user_id == user_id
+            ).values(
+                is_deleted=True,
+                deleted_at=deleted_at,
+                task_count=0,
+                open_count=0
+            ).execution_options(synchronize_session=False)
+        )
 
-        for task in db_group.tasks:
-            task.is_deleted = True
-            task.deleted_at = datetime.now(timezone.utc)
+        if result.rowcount == 0:
+            return None
 
-        self.session.commit()
-        return True
+        # حذف مهام المجموعة بتحديث جماعي واحد ضمن نفس المعاملة
+        stmt = update(Task).where(
+            Task.group_id == group_id,
+            Task.is_deleted == False
+        ).values(
+            is_deleted=True,
+            deleted_at=deleted_at,
+            updated_at=deleted_at
+        ).execution_options(synchronize_session=False)
+
+        if self.session.get_bind().dialect.update_returning:
+            deleted = self.session.execute(stmt.returning(Task.user_id, Task.is_completed)).all()
+        else:
+            deleted = self.session.execute(
+                select(Task.user_id, Task.is_completed).where(
+                    Task.group_id == group_id,
+                    Task.is_deleted == False
+                )
+            ).all()
+            self.session.execute(stmt)
+
+        # عدادات المجموعة صُفّرت أعلاه، تبقى عدادات أصحاب المهام وإصدار بيانات صاحب المجموعة
+        changes = CounterChanges().touch(user_id)
+        for row in deleted:
+            changes.add(row.user_id, None, before=(False, row.is_completed))
+        changes.apply(self.session)
+
+        return len(deleted)
 
     # Helper functions
     def _convert_to_task_entity(self, db_task: Task) -> TaskEntity:
@@ -125,20 +182,42 @@ class GroupRepository(IGroupRepository):
             due_at=db_task.due_at,
             created_at=db_task.created_at,
             user_id=db_task.user_id,
-            group_id=db_task.group_id
+            group_id=db_task.group_id,
+            updated_at=db_task.updated_at
         )
 
-    def _convert_to_group_entity(self, db_group: Group, include_tasks: bool = False) -> GroupEntity:
-        tasks = []
-        
-        if include_tasks:
-            
-            tasks = [
-                self._convert_to_task_entity(task)
-                for task in db_group.tasks.all()
-                if not task.is_deleted
-            ]
+    def _group_summary_query(self) -> Select:
+        # أعمدة المجموعة مع عداداتها المحفوظة، دون ربط بجدول المهام
+        return select(*Group.__table__.c)
+
+    def _load_tasks_by_group(self, group_ids: List[int]) -> Dict[int, List[TaskEntity]]:
+        # جلب مهام جميع المجموعات في استعلام واحد بدلاً من استعلام لكل مجموعة
+        tasks_by_group = defaultdict(list)
+
+        if not group_ids:
+            return tasks_by_group
+
+        rows = self.session.execute(
+            select(*Task.__table__.c).where(
+                Task.group_id.in_(group_ids),
+                Task.is_deleted == False
+            ).order_by(Task.created_at)
+        )
+
+        for row in rows:
+            tasks_by_group[row.group_id].append(TaskEntity(**row._mapping))
+
+        return tasks_by_group
+
+    def _convert_groups_with_tasks(self, db_groups: List[Row], include_tasks: bool = True) -> List[GroupEntity]:
+        tasks_by_group = self._load_tasks_by_group([group.id for group in db_groups]) if include_tasks else {}
+
+        return [
+            self._convert_to_group_entity(group, tasks=tasks_by_group.get(group.id, []))
+            for group in db_groups
+        ]
 
+    def _convert_to_group_entity(self, db_group: Group, tasks: Optional[List[TaskEntity]] = None) -> GroupEntity:
         return GroupEntity(
             id=db_group.id,
             name=db_group.name,
@@ -148,5 +227,8 @@ class GroupRepository(IGroupRepository):
             created_at=db_group.created_at,
             updated_at=db_group.updated_at,
             user_id=db_group.user_id,
-            tasks=tasks
+            tasks=tasks or [],
+            task_count=db_group.task_count,
+            open_count=db_group.open_count,
+            completed_count=db_group.task_count - db_group.open_count
         )
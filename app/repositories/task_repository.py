@@ -1,12 +1,32 @@
 from datetime import datetime, timezone
-from typing import Optional, List
+from typing import Dict, Optional, List
+from sqlalchemy import and_, case, column, delete, func, insert, literal, literal_column, or_, select, table, tuple_, update
 from sqlalchemy.orm import Session
 
 from ..constants.error_messages import ERROR_MESSAGES
+from ..constants.task_states import BULK_OUTCOMES, TASK_STATES
 from ..domain.entities.task_entity import TaskEntity
-from ..infrastructure.database.models import Task
+from ..domain.entities.task_stats_entity import TaskStatsEntity
+from ..domain.value_objects.cursor import Cursor
+from ..infrastructure.database.models import ArchivedTask, Group, Task, UserTaskCounter
+from ..infrastructure.database.task_search import TASKS_FTS_TABLE, TS_CONFIG, OrderedJoin, search_terms
 from ..interfaces.task_repository_interface import ITaskRepository
-from ._decorator import handle_db_errors
+from ._counters import USER_COUNTER_COLUMNS, CounterChanges
+from ._decorator import handle_db_errors, read_only
+
+
+# أعمدة الأرشيف المطابقة لـ TaskEntity (بدون archived_at)
+ARCHIVED_TASK_COLUMNS = [column for column in ArchivedTask.__table__.c if column.name != "archived_at"]
+
+# أعمدة الحالة التي تحدد مساهمة المهمة في العدادات
+STATE_FLAGS = ("is_deleted", "is_completed")
+
+# جدول FTS5 الافتراضي (SQLite) ليس ضمن النماذج
+tasks_fts = table(TASKS_FTS_TABLE, column("rowid"))
+
+
+def _escape_like(term: str) -> str:
+    return term.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
 
 
 class TaskRepository(ITaskRepository):
@@ -14,9 +34,21 @@ class TaskRepository(ITaskRepository):
         self.session = session
         
     @handle_db_errors
-    def get_tasks(self, user_id):  # تصحيح كتابة self وتحديد نوع الإرجاع
-        db_tasks = self.session.query(Task).filter(Task.user_id == user_id).all()
-        return [self._convert_to_entity(task) for task in db_tasks]
+    @read_only
+    def get_tasks(self, user_id: int, limit: Optional[int] = None, after: Optional[Cursor] = None) -> List[TaskEntity]:
+        # قراءة بـ SQLAlchemy Core: صفوف خام بدون إنشاء كائنات ORM أو تسجيلها في identity map
+        stmt = select(*Task.__table__.c).where(Task.user_id == user_id)
+
+        # ترقيم بالمفتاح (created_at, id) بدلاً من OFFSET ليبقى زمن الصفحات العميقة ثابتاً
+        if after is not None:
+            stmt = stmt.where(tuple_(Task.created_at, Task.id) < tuple_(after.timestamp, after.id))
+
+        stmt = stmt.order_by(Task.created_at.desc(), Task.id.desc())
+
+        if limit is not None:
+            stmt = stmt.limit(limit)
+
+        return [self._row_to_entity(row) for row in self.session.execute(stmt)]
         
     @handle_db_errors
     def create_task(self, task):
@@ -29,68 +61,486 @@ class TaskRepository(ITaskRepository):
             due_at=task.due_at,
             created_at=task.created_at if hasattr(task, 'created_at') else datetime.now(timezone.utc),
             user_id=task.user_id,
-            group_id=task.group_id if hasattr(task, 'group_id') else None
+            group_id=task.group_id if hasattr(task, 'group_id') else None,
+            updated_at=task.updated_at if hasattr(task, 'updated_at') else None
         )
 
+        # المعرّف يعود من INSERT ... RETURNING، وبقية القيم موجودة في الكائن أصلاً
         self.session.add(db_task)
-        self.session.commit()
-        self.session.refresh(db_task)
+        self.session.flush()
+
+        changes = CounterChanges()
+        changes.add(db_task.user_id, db_task.group_id, after=(db_task.is_deleted, db_task.is_completed))
+        changes.apply(self.session)
 
         return self._convert_to_entity(db_task)
 
+    @handle_db_errors
+    def create_tasks(self, tasks: List[TaskEntity]) -> List[TaskEntity]:
+        values = [
+            {
+                "text": task.text,
+                "is_deleted": False,
+                "is_completed": False,
+                "due_at": task.due_at,
+                "created_at": task.created_at or datetime.now(timezone.utc),
+                "user_id": task.user_id,
+                "group_id": task.group_id
+            }
+            for task in tasks
+        ]
+
+        if self.session.get_bind().dialect.insert_executemany_returning:
+            # إدراج جميع الصفوف في عبارة INSERT واحدة متعددة القيم مع RETURNING
+            # sort_by_parameter_order يعيد الصفوف بترتيب المدخلات حتى عند تقسيمها على عدة دفعات
+            rows = self.session.execute(
+                insert(Task.__table__).returning(*Task.__table__.c, sort_by_parameter_order=True),
+                values
+            ).all()
+            created = [self._row_to_entity(row) for row in rows]
+        else:
+            db_tasks = [Task(**row) for row in values]
+            self.session.add_all(db_tasks)
+            self.session.flush()
+            created = [self._convert_to_entity(db_task) for db_task in db_tasks]
+
+        changes = CounterChanges()
+        for row in values:
+            changes.add(row["user_id"], row["group_id"], after=(False, False))
+        changes.apply(self.session)
+
+        return created
+
     @handle_db_errors
     def mark_task_completed(self, task_id, user_id):
-        db_task = self.session.query(Task).filter(
-            Task.id == task_id,
-            Task.user_id == user_id,
-            Task.is_deleted == False  # أو Task.is_deleted.is_(False) حسب إصدار SQLAlchemy
-        ).first()
+        now = datetime.now(timezone.utc)
+        return self._update_task(
+            task_id,
+            user_id,
+            is_completed=True,
+            completed_at=now,
+            updated_at=now
+        )
+
+    @handle_db_errors
+    def mark_task_uncompleted(self, task_id, user_id):
+        return self._update_task(
+            task_id,
+            user_id,
+            is_completed=False,
+            completed_at=None,
+            updated_at=datetime.now(timezone.utc)
+        )
+
+    @handle_db_errors
+    def delete_task(self, task_id: int, user_id: int):
+        now = datetime.now(timezone.utc)
+        db_task = self._update_task(
+            task_id,
+            user_id,
+            is_deleted=True,
+            deleted_at=now,
+            updated_at=now
+        )
 
         if not db_task:
             return None
 
-        db_task.is_completed = True
-        db_task.completed_at = datetime.now(timezone.utc)
+        return True
 
-        self.session.commit()
-        self.session.refresh(db_task)
+    @handle_db_errors
+    def bulk_update_state(self, task_ids: List[int], user_id: int, state: str) -> Dict[int, str]:
+        values, already_in_state = self._state_transition(state)
 
-        return self._convert_to_entity(db_task)
+        # الحالة الحالية للمهام التي يملكها المستخدم فقط
+        current = {
+            row.id: row
+            for row in self.session.execute(
+                select(Task.id, Task.is_completed, Task.is_deleted).where(
+                    Task.id.in_(task_ids),
+                    Task.user_id == user_id
+                )
+            )
+        }
+
+        stmt = update(Task).where(
+            Task.id.in_(task_ids),
+            Task.user_id == user_id,
+            Task.is_deleted == False,
+            ~already_in_state
+        ).values(**values).execution_options(synchronize_session=False)
+
+        if self.session.get_bind().dialect.update_returning:
+            updated = self.session.execute(stmt.returning(*self._counted_columns())).all()
+        else:
+            self.session.execute(stmt)
+            changed_ids = [
+                row.id for row in current.values()
+                if not row.is_deleted and not self._is_in_state(row, state)
+            ]
+            updated = self.session.execute(
+                select(*self._counted_columns()).where(Task.id.in_(changed_ids))
+            ).all() if changed_ids else []
+
+        self._apply_transitions(updated, values)
+        updated_ids = {row.id for row in updated}
+
+        outcomes = {}
+        for task_id in task_ids:
+            row = current.get(task_id)
+            if task_id in updated_ids:
+                outcomes[task_id] = BULK_OUTCOMES["UPDATED"]
+            elif row is None or (row.is_deleted and state != TASK_STATES["DELETED"]):
+                outcomes[task_id] = BULK_OUTCOMES["NOT_FOUND"]
+            else:
+                outcomes[task_id] = BULK_OUTCOMES["ALREADY_IN_STATE"]
+
+        return outcomes
 
     @handle_db_errors
-    def mark_task_uncompleted(self, task_id, user_id):
-        db_task = self.session.query(Task).filter(
-            Task.id == task_id,
+    def archive_tasks(self, before: datetime, batch_size: int) -> int:
+        # دفعة واحدة: اختيار المعرفات، نسخها إلى الأرشيف بـ INSERT ... SELECT، ثم حذفها من tasks
+        rows = self.session.execute(
+            select(*self._counted_columns()).where(
+                or_(
+                    and_(Task.is_deleted == True, Task.deleted_at <= before),
+                    and_(Task.is_completed == True, Task.completed_at <= before)
+                )
+            ).order_by(Task.id).limit(batch_size)
+        ).all()
+
+        if not rows:
+            return 0
+
+        task_ids = [row.id for row in rows]
+
+        columns = [column.name for column in Task.__table__.c]
+        self.session.execute(
+            insert(ArchivedTask).from_select(
+                columns + ["archived_at"],
+                select(*Task.__table__.c, literal(datetime.now(timezone.utc), ArchivedTask.archived_at.type)).where(
+                    Task.id.in_(task_ids)
+                )
+            )
+        )
+        self.session.execute(
+            delete(Task).where(Task.id.in_(task_ids)).execution_options(synchronize_session=False)
+        )
+
+        # المهام المؤرشفة تخرج من العدادات (المكتملة منها كانت محسوبة)
+        changes = CounterChanges()
+        for row in rows:
+            changes.add(row.user_id, row.group_id, before=(row.is_deleted, row.is_completed))
+        changes.apply(self.session)
+
+        return len(task_ids)
+
+    @handle_db_errors
+    @read_only
+    def get_archived_tasks(self, user_id: int, limit: Optional[int] = None,
+                           after: Optional[Cursor] = None) -> List[TaskEntity]:
+        stmt = select(*ARCHIVED_TASK_COLUMNS).where(ArchivedTask.user_id == user_id)
+
+        if after is not None:
+            stmt = stmt.where(tuple_(ArchivedTask.created_at, ArchivedTask.id) < tuple_(after.timestamp, after.id))
+
+        stmt = stmt.order_by(ArchivedTask.created_at.desc(), ArchivedTask.id.desc())
+
+        if limit is not None:
+            stmt = stmt.limit(limit)
+
+        return [self._row_to_entity(row) for row in self.session.execute(stmt)]
+
+    @handle_db_errors
+    @read_only
+    def get_tasks_due(self, user_id: int, start: datetime, end: datetime, limit: Optional[int] = None,
+                      after: Optional[Cursor] = None) -> List[TaskEntity]:
+        return self._get_open_due_tasks(
+            user_id, Task.due_at >= start, Task.due_at < end, limit=limit, after=after
+        )
+
+    @handle_db_errors
+    @read_only
+    def get_overdue_tasks(self, user_id: int, now: datetime, limit: Optional[int] = None,
+                          after: Optional[Cursor] = None) -> List[TaskEntity]:
+        return self._get_open_due_tasks(user_id, Task.due_at < now, limit=limit, after=after)
+
+    @handle_db_errors
+    @read_only
+    def get_task_stats(self, user_id: int, now: datetime, day_start: datetime) -> TaskStatsEntity:
+        # الإجماليات من user_task_counters، والأعداد المرتبطة بالوقت من الفهارس الجزئية، في SELECT واحد
+        def counter(name):
+            return func.coalesce(
+                select(UserTaskCounter.__table__.c[name]).where(
+                    UserTaskCounter.user_id == user_id
+                ).scalar_subquery(),
+                0
+            )
+
+        overdue = select(func.count()).select_from(Task).where(
             Task.user_id == user_id,
-            Task.is_deleted == False
-        ).first()
+            Task.is_deleted == False,
+            Task.is_completed == False,
+            Task.due_at.isnot(None),
+            Task.due_at < now
+        ).scalar_subquery()
 
-        if not db_task:
-            return None
+        completed_today = select(func.count()).select_from(Task).where(
+            Task.user_id == user_id,
+            Task.is_deleted == False,
+            Task.is_completed == True,
+            Task.completed_at >= day_start
+        ).scalar_subquery()
 
-        db_task.is_completed = False
-        db_task.completed_at = None
+        row = self.session.execute(
+            select(
+                *[counter(name).label(name) for name in USER_COUNTER_COLUMNS],
+                overdue.label("overdue"),
+                completed_today.label("completed_today")
+            )
+        ).one()
 
-        self.session.commit()
-        self.session.refresh(db_task)
+        return TaskStatsEntity(**row._mapping)
 
-        return self._convert_to_entity(db_task)
+    @handle_db_errors
+    @read_only
+    def get_data_version(self, user_id: int) -> int:
+        # يزداد مع كل كتابة على مهام المستخدم أو مجموعاته؛ 0 لمستخدم لم يكتب بعد
+        version = self.session.execute(
+            select(UserTaskCounter.data_version).where(UserTaskCounter.user_id == user_id)
+        ).scalar()
+        return version or 0
 
     @handle_db_errors
-    def delete_task(self, task_id: int, user_id: int):
-        db_task = self.session.query(Task).filter(
+    def find_counter_drift(self) -> Dict[str, List[dict]]:
+        # مقارنة العدادات المحفوظة بالقيم المحسوبة من المهام الحية، على القاعدة الرئيسية لأن الإصلاح يكتب ما قيس هنا
+        live = Task.is_deleted == False
+
+        actual_users = {
+            row.user_id: (row.total, row.open, row.completed)
+            for row in self.session.execute(
+                select(
+                    Task.user_id,
+                    func.count(Task.id).label("total"),
+                    self._count_where(Task.is_completed == False).label("open"),
+                    self._count_where(Task.is_completed == True).label("completed")
+                ).where(live).group_by(Task.user_id)
+            )
+        }
+        stored_users = {
+            row.user_id: (row.total, row.open, row.completed)
+            for row in self.session.execute(select(*UserTaskCounter.__table__.c))
+        }
+
+        actual_groups = {
+            row.group_id: (row.task_count, row.open_count)
+            for row in self.session.execute(
+                select(
+                    Task.group_id,
+                    func.count(Task.id).label("task_count"),
+                    self._count_where(Task.is_completed == False).label("open_count")
+                ).where(live, Task.group_id.isnot(None)).group_by(Task.group_id)
+            )
+        }
+        stored_groups = {
+            row.id: (row.task_count, row.open_count)
+            for row in self.session.execute(select(Group.id, Group.task_count, Group.open_count))
+        }
+
+        group_drift = self._diff_counters("group_id", ("task_count", "open_count"), stored_groups, actual_groups)
+        # مهام تشير إلى مجموعة لم تعد موجودة، فلا يوجد عداد لإصلاحه
+        for item in group_drift:
+            if item["group_id"] not in stored_groups:
+                item["orphaned"] = True
+
+        return {
+            "users": self._diff_counters("user_id", USER_COUNTER_COLUMNS, stored_users, actual_users),
+            "groups": group_drift
+        }
+
+    @handle_db_errors
+    def repair_counters(self, drift: Dict[str, List[dict]]) -> int:
+        # إضافة الفرق بين القيمة المحسوبة والمحفوظة للعدادات المنحرفة فقط، مع رفع data_version لأصحابها
+        # وتُتخطى صفوف المجموعات غير الموجودة ولا تُحسب ضمن ما أُصلح
+        users = drift.get("users", [])
+        groups = drift.get("groups", [])
+        repaired = len(users)
+        changes = CounterChanges()
+
+        for item in users:
+            changes.shift_user(item["user_id"], [
+                item["actual"][name] - item["stored"][name] for name in USER_COUNTER_COLUMNS
+            ])
+
+        if groups:
+            owners = dict(self.session.execute(
+                select(Group.id, Group.user_id).where(Group.id.in_([item["group_id"] for item in groups]))
+            ).all())
+            for item in groups:
+                owner_id = owners.get(item["group_id"])
+                if owner_id is None:
+                    continue
+                changes.shift_group(item["group_id"], [
+                    item["actual"][name] - item["stored"][name] for name in ("task_count", "open_count")
+                ])
+                changes.touch(owner_id)
+                repaired += 1
+
+        changes.apply(self.session)
+        return repaired
+
+    @handle_db_errors
+    @read_only
+    def search_tasks(self, user_id: int, query: str, limit: Optional[int] = None) -> List[TaskEntity]:
+        terms = search_terms(query)
+        if not terms:
+            return []
+
+        stmt = self._search_statement(terms, user_id)
+
+        if limit is not None:
+            stmt = stmt.limit(limit)
+
+        return [self._row_to_entity(row) for row in self.session.execute(stmt)]
+
+    def _get_open_due_tasks(self, user_id: int, *criteria, limit: Optional[int] = None,
+                            after: Optional[Cursor] = None) -> List[TaskEntity]:
+        # نفس شرط الفهرس الجزئي ix_tasks_user_open_due ليخدم الاستعلام بالترتيب (due_at, id)
+        stmt = select(*Task.__table__.c).where(
+            Task.user_id == user_id,
+            Task.is_deleted == False,
+            Task.is_completed == False,
+            Task.due_at.isnot(None),
+            *criteria
+        )
+
+        if after is not None:
+            stmt = stmt.where(tuple_(Task.due_at, Task.id) > tuple_(after.timestamp, after.id))
+
+        stmt = stmt.order_by(Task.due_at.asc(), Task.id.asc())
+
+        if limit is not None:
+            stmt = stmt.limit(limit)
+
+        return [self._row_to_entity(row) for row in self.session.execute(stmt)]
+
+    def _search_statement(self, terms: List[str], user_id: int):
+        # كل كلمة مطابقة بادئة، وجميع الكلمات مطلوبة، والأعلى صلة أولاً؛ المطابقة مقصورة على مهام المستخدم الحية
+        dialect = self.session.get_bind().dialect.name
+        owned = (Task.user_id == user_id, Task.is_deleted == False)
+
+        if dialect == "sqlite":
+            # مهام المستخدم أولاً عبر فهرسه ثم FTS5 لكل صف (rowid = ?)، بدلاً من مطابقات جميع المستخدمين
+            match = " ".join(f'"{term}"*' for term in terms)
+            return select(*Task.__table__.c).select_from(
+                OrderedJoin(Task.__table__, tasks_fts, tasks_fts.c.rowid == Task.id)
+            ).where(
+                *owned,
+                literal_column(TASKS_FTS_TABLE).op("MATCH")(match)
+            ).order_by(func.bm25(literal_column(TASKS_FTS_TABLE)), Task.created_at.desc(), Task.id.desc())
+
+        if dialect == "postgresql":
+            # الشرطان يطابقان الفهرس المركب الجزئي (user_id, tsvector) WHERE is_deleted = false
+            document = func.to_tsvector(literal_column(f"'{TS_CONFIG}'"), Task.text)
+            tsquery = func.to_tsquery(literal_column(f"'{TS_CONFIG}'"), " & ".join(f"{term}:*" for term in terms))
+            return select(*Task.__table__.c).where(
+                *owned,
+                document.op("@@")(tsquery)
+            ).order_by(func.ts_rank(document, tsquery).desc(), Task.created_at.desc(), Task.id.desc())
+
+        # قواعد بدون فهرس نصي: مطابقة جزئية بدون ترتيب صلة، مع تهريب محارف LIKE الخاصة
+        return select(*Task.__table__.c).where(
+            *owned,
+            *[Task.text.ilike(f"%{_escape_like(term)}%", escape="\\") for term in terms]
+        ).order_by(Task.created_at.desc(), Task.id.desc())
+
+    def _count_where(self, condition):
+        return func.coalesce(func.sum(case((condition, 1), else_=0)), 0)
+
+    def _state_transition(self, state: str):
+        now = datetime.now(timezone.utc)
+
+        if state == TASK_STATES["COMPLETED"]:
+            return {"is_completed": True, "completed_at": now, "updated_at": now}, Task.is_completed == True
+
+        if state == TASK_STATES["UNCOMPLETED"]:
+            return {"is_completed": False, "completed_at": None, "updated_at": now}, Task.is_completed == False
+
+        if state == TASK_STATES["DELETED"]:
+            return {"is_deleted": True, "deleted_at": now, "updated_at": now}, Task.is_deleted == True
+
+        raise ValueError(ERROR_MESSAGES["INVALID_TASK_STATE"])
+
+    def _is_in_state(self, row, state: str) -> bool:
+        if state == TASK_STATES["COMPLETED"]:
+            return bool(row.is_completed)
+
+        if state == TASK_STATES["UNCOMPLETED"]:
+            return not row.is_completed
+
+        return bool(row.is_deleted)
+
+    def _update_task(self, task_id: int, user_id: int, **values) -> Optional[TaskEntity]:
+        # تحديث شرطي واحد: الملكية وعدم الحذف ضمن شرط WHERE نفسه، ولا يُحدَّث إلا انتقال فعلي في الحالة
+        flag = next(name for name in STATE_FLAGS if name in values)
+        stmt = update(Task).where(
             Task.id == task_id,
-            Task.user_id == user_id
-        ).first()
+            Task.user_id == user_id,
+            Task.is_deleted == False,
+            Task.__table__.c[flag] != values[flag]
+        ).values(**values).execution_options(synchronize_session=False)
 
-        if not db_task:
-            return None
+        if self.session.get_bind().dialect.update_returning:
+            # ذهاب وإياب واحد: UPDATE ... RETURNING
+            row = self.session.execute(stmt.returning(*Task.__table__.c)).first()
+        elif self.session.execute(stmt).rowcount:
+            # قواعد البيانات التي لا تدعم RETURNING: تحديث ثم قراءة الصف
+            row = self.session.execute(
+                select(*Task.__table__.c).where(Task.id == task_id)
+            ).first()
+        else:
+            row = None
 
-        db_task.is_deleted = True
-        db_task.deleted_at = datetime.now(timezone.utc)
+        if row is None:
+            # المهمة في الحالة المطلوبة أصلاً (أو غير موجودة): تُعاد كما هي دون تغيير العدادات
+            row = self.session.execute(
+                select(*Task.__table__.c).where(
+                    Task.id == task_id,
+                    Task.user_id == user_id,
+                    Task.is_deleted == False
+                )
+            ).first()
+            return self._row_to_entity(row) if row else None
 
-        self.session.commit()
-        return True
+        self._apply_transitions([row], values)
+        return self._row_to_entity(row)
+
+    def _counted_columns(self):
+        return Task.id, Task.user_id, Task.group_id, Task.is_deleted, Task.is_completed
+
+    def _apply_transitions(self, rows, values: dict) -> None:
+        # الصفوف بعد التحديث؛ شرط WHERE يضمن أن العلم المحدَّث انقلب، فالحالة السابقة هي عكسه
+        changes = CounterChanges()
+        for row in rows:
+            after = (row.is_deleted, row.is_completed)
+            before = tuple(
+                not value if name in values else value
+                for name, value in zip(STATE_FLAGS, after)
+            )
+            changes.add(row.user_id, row.group_id, before=before, after=after)
+        changes.apply(self.session)
+
+    def _diff_counters(self, key: str, names, stored: dict, actual: dict) -> List[dict]:
+        zero = (0,) * len(names)
+        return [
+            {
+                key: item_id,
+                "stored": dict(zip(names, stored.get(item_id, zero))),
+                "actual": dict(zip(names, actual.get(item_id, zero)))
+            }
+            for item_id in sorted(set(stored) | set(actual))
+            if stored.get(item_id, zero) != actual.get(item_id, zero)
+        ]
 
     def _convert_to_entity(self, db_task):
         return TaskEntity(
@@ -103,5 +553,10 @@ class TaskRepository(ITaskRepository):
             due_at=db_task.due_at,
             created_at=db_task.created_at,
             user_id=db_task.user_id,
-            group_id=db_task.group_id
-        )
\ No newline at end of file
+            group_id=db_task.group_id,
+            updated_at=db_task.updated_at
+        )
+
+    def _row_to_entity(self, row) -> TaskEntity:
+        # أسماء أعمدة جدول tasks تطابق معاملات TaskEntity
+        return TaskEntity(**row._mapping)
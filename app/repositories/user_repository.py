@@ -1,5 +1,7 @@
 from datetime import datetime, timezone
-from sqlalchemy.orm import Session
+from sqlalchemy import Select, delete, insert, literal, or_, select, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session, joinedload
 
 from ..constants.error_messages import ERROR_MESSAGES
 from ..domain.entities.email_entity import EmailEntity
@@ -8,7 +10,7 @@ from ..domain.entities.user_entity import UserEntity
 from ..domain.entities.verified_email_token_entity import VerifiedEmailTokenEntity
 from ..infrastructure.database.models import Email, PasswordResetToken, User, VerifiedEmailToken
 from ..interfaces.user_repository_interface import IUserRepository
-from ._decorator import handle_db_errors
+from ._decorator import handle_db_errors, read_only
 
 
 class UserRepository(IUserRepository):
@@ -17,11 +19,12 @@ class UserRepository(IUserRepository):
 
     # ✅ تحويل كائنات
     def _convert_user_to_entity(self, db_user):
-        db_emails = self.session.query(Email).filter(
-            Email.user_id == db_user.id,
-            Email.is_deleted == False
-        ).all()
-        emails = [self._convert_email_to_entity(email) for email in db_emails]
+        # البريد محمَّل مسبقاً مع المستخدم، والتصفية هنا احتياطية إن كانت المجموعة محمَّلة كاملة
+        emails = [
+            self._convert_email_to_entity(email)
+            for email in db_user.emails
+            if not email.is_deleted
+        ]
         return UserEntity(
             id=db_user.id,
             username=db_user.username,
@@ -64,11 +67,37 @@ class UserRepository(IUserRepository):
             user_id=db_token.user_id
         )
 
+    def _user_with_emails_query(self) -> Select:
+        # استعلام واحد بـ LEFT OUTER JOIN يجلب المستخدم مع بريده غير المحذوف
+        return select(User).options(
+            joinedload(User.emails.and_(Email.is_deleted == False))
+        )
+
+    def _load_user(self, *criteria):
+        return self.session.execute(
+            self._user_with_emails_query().where(*criteria)
+        ).unique().scalar_one_or_none()
+
+    def _insert_emails(self, values):
+        # إدراج جميع العناوين في عبارة INSERT واحدة وإعادة معرفاتها حسب العنوان
+        if self.session.get_bind().dialect.insert_executemany_returning:
+            rows = self.session.execute(
+                insert(Email.__table__).returning(Email.id, Email.email_address),
+                values
+            )
+            return {row.email_address: row.id for row in rows}
+
+        db_emails = [Email(**row) for row in values]
+        self.session.add_all(db_emails)
+        self.session.flush()
+        return {db_email.email_address: db_email.id for db_email in db_emails}
+
     # ✅ العمليات الأساسية
     @handle_db_errors
+    @read_only
     def get_user(self, username: str):
         
-        db_user = self.session.query(User).filter(User.username == username).first()
+        db_user = self._load_user(User.username == username)
             
         if not db_user:
             raise ValueError(ERROR_MESSAGES["USER_NOT_FOUND"])
@@ -77,11 +106,30 @@ class UserRepository(IUserRepository):
 
     @handle_db_errors
     def create_user(self, user_entity):
-        existing_user = self.session.query(User).filter(
-            User.username == user_entity.username
-        ).first()
-        if existing_user:
+        # التحقق من المدخلات قبل أي عمل على قاعدة البيانات
+        primary_count = sum(1 for e in user_entity.emails if e.is_primary)
+        if primary_count != 1:
+            raise ValueError(ERROR_MESSAGES["PRIMARY_EMAIL_REQUIRED"])
+
+        addresses = [e.email_address for e in user_entity.emails]
+        if len(set(addresses)) != len(addresses):
+            raise ValueError(ERROR_MESSAGES["EMAIL_ALREADY_EXISTS"])
+
+        # استعلام واحد يفحص اسم المستخدم وجميع العناوين معاً
+        conflicts = set(self.session.execute(
+            select(literal("username")).where(
+                User.username == user_entity.username
+            ).union_all(
+                select(literal("email")).where(
+                    Email.email_address.in_(addresses),
+                    Email.is_deleted == False
+                )
+            )
+        ).scalars())
+        if "username" in conflicts:
             raise ValueError(ERROR_MESSAGES["USERNAME_ALREADY_EXISTS"])
+        if "email" in conflicts:
+            raise ValueError(ERROR_MESSAGES["EMAIL_ALREADY_EXISTS"])
 
         db_user = User(
             username=user_entity.username,
@@ -89,50 +137,47 @@ class UserRepository(IUserRepository):
             created_at=user_entity.created_at or datetime.now(timezone.utc)
         )
         self.session.add(db_user)
-        self.session.flush()
-
-        for email_entity in user_entity.emails:
-            existing_email = self.session.query(Email).filter(
-                Email.email_address == email_entity.email_address,
-                Email.is_deleted == False
-            ).first()
-            if existing_email:
-                self.session.rollback()
-                raise ValueError(ERROR_MESSAGES["EMAIL_ALREADY_EXISTS"])
-
-            db_email = Email(
-                email_address=email_entity.email_address,
-                is_primary=email_entity.is_primary,
-                user_id=db_user.id,
-                verified_at=datetime.now(timezone.utc)
-            )
-            self.session.add(db_email)
+        try:
             self.session.flush()
-            email_entity.id = db_email.id
+        except IntegrityError as e:
+            # تسجيل متزامن بنفس الاسم تجاوز الفحص المسبق
+            raise ValueError(ERROR_MESSAGES["USERNAME_ALREADY_EXISTS"]) from e
+
+        verified_at = datetime.now(timezone.utc)
+        values = [
+            {
+                "email_address": e.email_address,
+                "is_primary": e.is_primary,
+                "is_deleted": False,
+                "user_id": db_user.id,
+                "verified_at": verified_at
+            }
+            for e in user_entity.emails
+        ]
+        try:
+            email_ids = self._insert_emails(values)
+        except IntegrityError as e:
+            raise ValueError(ERROR_MESSAGES["EMAIL_ALREADY_EXISTS"]) from e
 
-        primary_count = sum(1 for e in user_entity.emails if e.is_primary)
-        if primary_count != 1:
-            self.session.rollback()
-            raise ValueError(ERROR_MESSAGES["PRIMARY_EMAIL_REQUIRED"])
+        for email_entity in user_entity.emails:
+            email_entity.id = email_ids[email_entity.email_address]
+            email_entity.user_id = db_user.id
 
-        self.session.commit()
-        self.session.refresh(db_user)
         user_entity.id = db_user.id
         return user_entity
 
     @handle_db_errors
     def update_password(self, id, new_password_hashing):
-        user = self.session.query(User).filter(User.id == id).first()
+        user = self._load_user(User.id == id)
         if not user:
             raise ValueError(ERROR_MESSAGES["USER_NOT_FOUND"])
         user.password = new_password_hashing
-        self.session.commit()
-        self.session.refresh(user)
+        self.session.flush()
         return self._convert_user_to_entity(user)
 
     @handle_db_errors
     def update_username(self, old_username, new_username):
-        user = self.session.query(User).filter(User.username == old_username).first()
+        user = self._load_user(User.username == old_username)
         if not user:
             raise ValueError(ERROR_MESSAGES["USER_NOT_FOUND"])
 
@@ -141,8 +186,7 @@ class UserRepository(IUserRepository):
             raise ValueError(ERROR_MESSAGES["USERNAME_ALREADY_EXISTS"])
 
         user.username = new_username
-        self.session.commit()
-        self.session.refresh(user)
+        self.session.flush()
         return self._convert_user_to_entity(user)
 
     @handle_db_errors
@@ -157,22 +201,17 @@ class UserRepository(IUserRepository):
 
     @handle_db_errors
     def create_email(self, email_entity):
-        existing_email = self.session.query(Email).filter(
-            Email.email_address == email_entity.email_address,
-            Email.is_deleted == False
-        ).first()
-        
-        if existing_email:
-            raise ValueError(ERROR_MESSAGES["EMAIL_ALREADY_EXISTS"])
-
         db_email = Email(
             email_address=email_entity.email_address,
             is_primary=email_entity.is_primary,
             user_id=email_entity.user_id
         )
         self.session.add(db_email)
-        self.session.commit()
-        self.session.refresh(db_email)
+        try:
+            # القيد الفريد على email_address يغني عن استعلام فحص مسبق
+            self.session.flush()
+        except IntegrityError as e:
+            raise ValueError(ERROR_MESSAGES["EMAIL_ALREADY_EXISTS"]) from e
         email_entity.id = db_email.id
         return email_entity
 
@@ -183,7 +222,7 @@ class UserRepository(IUserRepository):
             raise ValueError(ERROR_MESSAGES["EMAIL_NOT_FOUND"])
         db_email.is_deleted = True
         db_email.deleted_at = datetime.now(timezone.utc)
-        self.session.commit()
+        self.session.flush()
         return self._convert_email_to_entity(db_email)
 
     @handle_db_errors
@@ -195,8 +234,7 @@ class UserRepository(IUserRepository):
             user_id=token.user_id
         )
         self.session.add(db_token)
-        self.session.commit()
-        self.session.refresh(db_token)
+        self.session.flush()
         token.id = db_token.id
         token.created_at = db_token.created_at
         return token
@@ -220,7 +258,7 @@ class UserRepository(IUserRepository):
 
         db_token.is_used = True
         db_token.used_at = datetime.now(timezone.utc)
-        self.session.commit()
+        self.session.flush()
         return True
 
     @handle_db_errors
@@ -248,26 +286,35 @@ class UserRepository(IUserRepository):
             user_id=token.user_id
         )
         self.session.add(db_token)
-        self.session.commit()
-        self.session.refresh(db_token)
+        self.session.flush()
         token.id = db_token.id
         token.created_at = db_token.created_at
         return token
 
     @handle_db_errors
     def confirm_password_reset_token(self, token_id: int):
-        db_token = self.session.query(PasswordResetToken).filter(
+        stmt = update(PasswordResetToken).where(
             PasswordResetToken.id == token_id,
             PasswordResetToken.is_used == False
-        ).first()
-        if not db_token:
+        ).values(
+            is_used=True,
+            used_at=datetime.now(timezone.utc)
+        ).execution_options(synchronize_session=False)
+
+        if self.session.get_bind().dialect.update_returning:
+            # ذهاب وإياب واحد: UPDATE ... RETURNING
+            row = self.session.execute(stmt.returning(*PasswordResetToken.__table__.c)).first()
+        elif self.session.execute(stmt).rowcount:
+            row = self.session.execute(
+                select(*PasswordResetToken.__table__.c).where(PasswordResetToken.id == token_id)
+            ).first()
+        else:
+            row = None
+
+        if not row:
             raise ValueError(ERROR_MESSAGES["TOKEN_CONFIRMATION_FAILED"])
 
-        db_token.is_used = True
-        db_token.used_at = datetime.now(timezone.utc)
-        self.session.commit()
-        self.session.refresh(db_token)
-        return self._convert_password_token_to_entity(db_token)
+        return self._convert_password_token_to_entity(row)
 
     @handle_db_errors
     def get_password_reset_token(self, token_hash):
@@ -279,3 +326,23 @@ class UserRepository(IUserRepository):
         if not db_token:
             raise ValueError(ERROR_MESSAGES["TOKEN_NOT_FOUND"])
         return self._convert_password_token_to_entity(db_token)
+
+    # ✅ الصيانة
+    @handle_db_errors
+    def purge_verified_email_tokens(self, before: datetime, batch_size: int) -> int:
+        return self._purge_tokens(VerifiedEmailToken, before, batch_size)
+
+    @handle_db_errors
+    def purge_password_reset_tokens(self, before: datetime, batch_size: int) -> int:
+        return self._purge_tokens(PasswordResetToken, before, batch_size)
+
+    def _purge_tokens(self, model, before: datetime, batch_size: int) -> int:
+        # حذف دفعة محدودة من التوكنات المنتهية أو المستخدمة حتى تبقى الأقفال قصيرة
+        batch = select(model.id).where(
+            or_(model.expires_at <= before, model.is_used == True)
+        ).limit(batch_size)
+
+        result = self.session.execute(
+            delete(model).where(model.id.in_(batch)).execution_options(synchronize_session=False)
+        )
+        return result.rowcount
@@ -1,5 +1,7 @@
 from marshmallow import Schema, fields, validate
 
+from ..constants.task_states import TASK_STATES
+
 class CreateTaskSchema(Schema):
     text = fields.Str(
         required=True,
@@ -19,3 +21,17 @@ class UpdateTaskSchema(Schema):
 
 class TaskStatusSchema(Schema):
     id = fields.Int(required=True)
+
+
+class BulkTaskStateSchema(Schema):
+    ids = fields.List(
+        fields.Int(),
+        required=True,
+        validate=validate.Length(min=1),
+        error_messages={"required": "Task ids are required"}
+    )
+    state = fields.Str(
+        required=True,
+        validate=validate.OneOf(list(TASK_STATES.values())),
+        error_messages={"required": "Target state is required"}
+    )
@@ -0,0 +1,130 @@
+import threading
+import time
+from collections import OrderedDict, defaultdict
+from typing import Any, Callable, Dict, Hashable, Optional
+
+
+class _PendingLoad:
+    # قراءة جارية من قاعدة البيانات؛ تُلغى إذا كتب المستخدم قبل انتهائها
+    __slots__ = ("user_id", "key", "valid")
+
+    def __init__(self, user_id: int, key: Hashable):
+        self.user_id = user_id
+        self.key = key
+        self.valid = True
+
+
+class ReadCacheService:
+    # ذاكرة قراءة داخل العملية لقوائم المستخدم: LRU محدودة الحجم مع مدة صلاحية، تُبطَل عند كل كتابة للمستخدم
+    def __init__(self, max_entries: int = 1024, ttl_seconds: float = 30.0, enabled: bool = True,
+                 clock: Callable[[], float] = time.monotonic):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.enabled = enabled
+        self._clock = clock
+        self._lock = threading.Lock()
+        # (user_id, key) -> (expires_at, value) بترتيب آخر استخدام
+        self._entries: "OrderedDict[tuple, tuple]" = OrderedDict()
+        self._keys_by_user = defaultdict(set)
+        self._pending = defaultdict(set)
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.invalidations = 0
+
+    def get_or_load(self, user_id: int, key: Hashable, load: Callable[[], Any]) -> Any:
+        if not self.enabled:
+            return load()
+
+        found, value, pending = self._lookup(user_id, key)
+        if found:
+            return value
+
+        try:
+            value = load()
+            self._store(pending, value)
+        finally:
+            self._finish(pending)
+        return value
+
+    def invalidate(self, user_id: Optional[int]) -> None:
+        # يُستدعى بعد commit حتى لا تُعاد تعبئة الذاكرة بحالة ما قبل الكتابة؛ None يُبطل ذاكرة جميع المستخدمين
+        if not self.enabled:
+            return
+
+        with self._lock:
+            self.invalidations += 1
+            user_ids = list(set(self._keys_by_user) | set(self._pending)) if user_id is None else [user_id]
+
+            for invalidated_id in user_ids:
+                for pending in self._pending.get(invalidated_id, ()):
+                    pending.valid = False
+                for key in self._keys_by_user.pop(invalidated_id, ()):
+                    self._entries.pop((invalidated_id, key), None)
+
+    def clear(self) -> None:
+        self.invalidate(None)
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+                "invalidations": self.invalidations
+            }
+
+    def _lookup(self, user_id: int, key: Hashable):
+        with self._lock:
+            entry_key = (user_id, key)
+            entry = self._entries.get(entry_key)
+
+            if entry is not None and entry[0] <= self._clock():
+                self._remove(entry_key)
+                self.expirations += 1
+                entry = None
+
+            if entry is not None:
+                self._entries.move_to_end(entry_key)
+                self.hits += 1
+                return True, entry[1], None
+
+            self.misses += 1
+            pending = _PendingLoad(user_id, key)
+            self._pending[user_id].add(pending)
+            return False, None, pending
+
+    def _store(self, pending: _PendingLoad, value: Any) -> None:
+        with self._lock:
+            # كتابة حدثت أثناء التحميل: القيمة قد تسبقها، فلا تُخزَّن
+            if not pending.valid:
+                return
+
+            entry_key = (pending.user_id, pending.key)
+            self._entries[entry_key] = (self._clock() + self.ttl_seconds, value)
+            self._entries.move_to_end(entry_key)
+            self._keys_by_user[pending.user_id].add(pending.key)
+
+            while len(self._entries) > self.max_entries:
+                self._remove(next(iter(self._entries)))
+                self.evictions += 1
+
+    def _finish(self, pending: _PendingLoad) -> None:
+        with self._lock:
+            loads = self._pending.get(pending.user_id)
+            if loads is not None:
+                loads.discard(pending)
+                if not loads:
+                    del self._pending[pending.user_id]
+
+    def _remove(self, entry_key: tuple) -> None:
+        user_id, key = entry_key
+        self._entries.pop(entry_key, None)
+        keys = self._keys_by_user.get(user_id)
+        if keys is not None:
+            keys.discard(key)
+            if not keys:
+                del self._keys_by_user[user_id]
@@ -0,0 +1,33 @@
+from datetime import datetime, timezone
+from typing import Optional, Union
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+
+from ..constants.error_messages import ERROR_MESSAGES
+
+
+def to_utc(value: Optional[Union[str, datetime]]) -> Optional[datetime]:
+    # تواريخ المهام تُخزن وتُقارن بتوقيت UTC، والقيمة بدون منطقة زمنية تُعتبر UTC
+    if value is None:
+        return None
+
+    if isinstance(value, str):
+        try:
+            value = datetime.fromisoformat(value)
+        except ValueError:
+            raise ValueError(ERROR_MESSAGES["INVALID_DATETIME"])
+
+    if value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+
+    return value.astimezone(timezone.utc)
+
+
+def start_of_day(now: datetime, tz: Optional[str] = None) -> datetime:
+    # بداية اليوم الحالي في منطقة المستخدم الزمنية (IANA، مثل Asia/Riyadh) محولة إلى UTC
+    try:
+        zone = ZoneInfo(tz) if tz else timezone.utc
+    except (ZoneInfoNotFoundError, ValueError):
+        raise ValueError(ERROR_MESSAGES["INVALID_TIMEZONE"])
+
+    local_midnight = now.astimezone(zone).replace(hour=0, minute=0, second=0, microsecond=0)
+    return local_midnight.astimezone(timezone.utc)
@@ -0,0 +1,33 @@
+from typing import Callable, List, Optional
+
+from ..constants.error_messages import ERROR_MESSAGES
+from ..constants.pagination import PAGINATION
+from ..domain.entities.page_entity import PageEntity
+from ..domain.value_objects.cursor import Cursor
+
+
+def resolve_limit(limit: Optional[int]) -> int:
+    if limit is None:
+        return PAGINATION["DEFAULT_LIMIT"]
+
+    if limit < 1 or limit > PAGINATION["MAX_LIMIT"]:
+        raise ValueError(ERROR_MESSAGES["INVALID_LIMIT"].format(max_limit=PAGINATION["MAX_LIMIT"]))
+
+    return limit
+
+
+def decode_cursor(cursor: Optional[str]) -> Optional[Cursor]:
+    return Cursor.decode(cursor) if cursor else None
+
+
+def build_page(items: Optional[List], limit: int,
+               cursor_of: Callable[[object], Cursor] = lambda item: Cursor(item.created_at, item.id)) -> PageEntity:
+    # المستودع يجلب limit + 1 عنصراً، وجود العنصر الإضافي يعني وجود صفحة تالية
+    items = items or []
+    next_cursor = None
+
+    if len(items) > limit:
+        items = items[:limit]
+        next_cursor = cursor_of(items[-1]).encode()
+
+    return PageEntity(items=items, next_cursor=next_cursor)
@@ -1,11 +1,17 @@
+from typing import Optional
 from datetime import datetime, timezone
 from ...interfaces.group_repository_interface import IGroupRepository
+from ...interfaces.unit_of_work_interface import IUnitOfWork
+from ...services.read_cache_service import ReadCacheService
 from ...domain.entities.group_entity import GroupEntity
 
 
 class CreateGroupUseCase:
-    def __init__(self, group_repository: IGroupRepository):
+    def __init__(self, group_repository: IGroupRepository, uow: IUnitOfWork,
+                 read_cache: Optional[ReadCacheService] = None):
         self.group_repository = group_repository
+        self.uow = uow
+        self.read_cache = read_cache
 
     def execute(self, name: str, description: str, user_id: int):
     
@@ -21,4 +27,9 @@ class CreateGroupUseCase:
             tasks=[]
         )
 
-        return self.group_repository.create_group(new_group)
+        with self.uow:
+            result = self.group_repository.create_group(new_group)
+
+        if self.read_cache is not None:
+            self.read_cache.invalidate(user_id)
+        return result
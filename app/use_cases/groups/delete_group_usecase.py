@@ -1,9 +1,22 @@
+from typing import Optional
+
 from ...interfaces.group_repository_interface import IGroupRepository
+from ...interfaces.unit_of_work_interface import IUnitOfWork
+from ...services.read_cache_service import ReadCacheService
 
 
 class DeleteGroupUseCase:
-    def __init__(self, group_repository: IGroupRepository):
+    def __init__(self, group_repository: IGroupRepository, uow: IUnitOfWork,
+                 read_cache: Optional[ReadCacheService] = None):
         self.group_repository = group_repository
+        self.uow = uow
+        self.read_cache = read_cache
+
+    def execute(self, group_id: int, user_id:int) -> Optional[int]:
+        # يعيد عدد المهام المحذوفة مع المجموعة، أو None إذا لم توجد المجموعة
+        with self.uow:
+            result = self.group_repository.delete_group(group_id,user_id)
 
-    def execute(self, group_id: int, user_id:int) -> bool:
-        return self.group_repository.delete_group(group_id,user_id)
+        if self.read_cache is not None:
+            self.read_cache.invalidate(user_id)
+        return result
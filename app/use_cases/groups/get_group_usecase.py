@@ -1,30 +1,49 @@
-from typing import List
+from typing import List, Optional
 from ...domain.entities.group_entity import GroupEntity
+from ...domain.entities.page_entity import PageEntity
 from ...interfaces.group_repository_interface import IGroupRepository
 from ...constants.error_messages import ERROR_MESSAGES
+from ...services.read_cache_service import ReadCacheService
+from .._pagination import build_page, decode_cursor, resolve_limit
 
 
 class GetGroupUseCase:
-    def __init__(self, group_repository: IGroupRepository):
+    def __init__(self, group_repository: IGroupRepository, read_cache: Optional[ReadCacheService] = None):
         self.group_repository = group_repository
+        self.read_cache = read_cache
 
-    def get_all_groups(self, user_id: int) -> List[GroupEntity]:
+    def get_all_groups(self, user_id: int, limit: Optional[int] = None, cursor: Optional[str] = None,
+                       include_tasks: bool = True, data_version: Optional[int] = None) -> PageEntity:
       
         if not user_id:
             raise ValueError(ERROR_MESSAGES["USER_ID_REQUIRED"])
 
-        return self.group_repository.get_groups(user_id=user_id)
+        limit = resolve_limit(limit)
 
-    def get_completed_groups(self, user_id: int) -> List[GroupEntity]:
+        def load() -> PageEntity:
+            groups = self.group_repository.get_groups(
+                user_id=user_id,
+                limit=limit + 1,
+                after=decode_cursor(cursor),
+                include_tasks=include_tasks
+            )
+            return build_page(groups, limit)
+
+        if self.read_cache is None:
+            return load()
+
+        return self.read_cache.get_or_load(user_id, ("groups", limit, cursor, include_tasks, data_version), load)
+
+    def get_completed_groups(self, user_id: int, include_tasks: bool = True) -> List[GroupEntity]:
        
         if not user_id:
             raise ValueError(ERROR_MESSAGES["USER_ID_REQUIRED"])
 
-        return self.group_repository.get_groups_complete(user_id=user_id)
+        return self.group_repository.get_groups_complete(user_id=user_id, include_tasks=include_tasks)
 
-    def get_uncompleted_groups(self, user_id: int) -> List[GroupEntity]:
+    def get_uncompleted_groups(self, user_id: int, include_tasks: bool = True) -> List[GroupEntity]:
         
         if not user_id:
             raise ValueError(ERROR_MESSAGES["USER_ID_REQUIRED"])
 
-        return self.group_repository.get_groups_uncomplete(user_id=user_id)
+        return self.group_repository.get_groups_uncomplete(user_id=user_id, include_tasks=include_tasks)
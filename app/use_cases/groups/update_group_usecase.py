@@ -1,13 +1,19 @@
+from typing import Optional
 from datetime import datetime, timezone
 from ...interfaces.group_repository_interface import IGroupRepository
+from ...interfaces.unit_of_work_interface import IUnitOfWork
+from ...services.read_cache_service import ReadCacheService
 from ...domain.entities.group_entity import GroupEntity
 
 
 class UpdateGroupUseCase:
-    def __init__(self, group_repository: IGroupRepository):
+    def __init__(self, group_repository: IGroupRepository, uow: IUnitOfWork,
+                 read_cache: Optional[ReadCacheService] = None):
         self.group_repository = group_repository
+        self.uow = uow
+        self.read_cache = read_cache
 
-    def execute(self, group_id: int, name: str, description: str) -> GroupEntity | None:
+    def execute(self, group_id: int, name: str, description: str, user_id: int | None = None) -> GroupEntity | None:
         updated_group = GroupEntity(
             id=group_id,
             name=name,
@@ -16,8 +22,13 @@ class UpdateGroupUseCase:
             deleted_at=None,
             created_at=None,  # لا نغير تاريخ الإنشاء
             updated_at=datetime.now(timezone.utc),
-            user_id=None,     # لن نغير المالك
+            user_id=user_id,  # للتحقق من الملكية فقط، لن نغير المالك
             tasks=[]
         )
 
-        return self.group_repository.update_group(updated_group)
+        with self.uow:
+            result = self.group_repository.update_group(updated_group)
+
+        if self.read_cache is not None:
+            self.read_cache.invalidate(user_id)
+        return result
@@ -0,0 +1,41 @@
+import time
+from datetime import datetime, timedelta, timezone
+
+from ...constants.error_messages import ERROR_MESSAGES
+from ...domain.entities.archive_report_entity import ArchiveReportEntity
+from ...interfaces.task_repository_interface import ITaskRepository
+from ...interfaces.unit_of_work_interface import IUnitOfWork
+
+
+class ArchiveTasksUseCase:
+    def __init__(self, task_repository: ITaskRepository, uow: IUnitOfWork,
+                 older_than_days: int = 90, batch_size: int = 1000):
+        self.task_repository = task_repository
+        self.uow = uow
+        self.older_than_days = older_than_days
+        self.batch_size = batch_size
+
+    def execute(self, older_than_days: int = None, batch_size: int = None) -> ArchiveReportEntity:
+        older_than_days = self.older_than_days if older_than_days is None else older_than_days
+        batch_size = batch_size or self.batch_size
+
+        if batch_size < 1:
+            raise ValueError(ERROR_MESSAGES["INVALID_BATCH_SIZE"])
+        if older_than_days < 0:
+            raise ValueError(ERROR_MESSAGES["INVALID_ARCHIVE_AGE"])
+
+        started = time.perf_counter()
+        before = datetime.now(timezone.utc) - timedelta(days=older_than_days)
+        report = ArchiveReportEntity(cutoff=before)
+
+        while True:
+            # كل دفعة تُنقل وتُحذف في معاملة مستقلة
+            with self.uow:
+                moved = self.task_repository.archive_tasks(before=before, batch_size=batch_size)
+            report.batches += 1
+            report.archived += moved
+            if moved < batch_size:
+                break
+
+        report.elapsed_seconds = round(time.perf_counter() - started, 3)
+        return report
@@ -0,0 +1,39 @@
+from typing import Dict, List, Optional
+
+from ...constants.error_messages import ERROR_MESSAGES
+from ...constants.task_states import TASK_STATES
+from ...interfaces.task_repository_interface import ITaskRepository
+from ...interfaces.unit_of_work_interface import IUnitOfWork
+from ...services.read_cache_service import ReadCacheService
+
+
+class BulkUpdateTaskStateUseCase:
+    def __init__(self, task_repository: ITaskRepository, uow: IUnitOfWork, max_batch_size: int = 100,
+                 read_cache: Optional[ReadCacheService] = None):
+        self.task_repository = task_repository
+        self.uow = uow
+        self.max_batch_size = max_batch_size
+        self.read_cache = read_cache
+
+    def execute(self, task_ids: List[int], user_id: int, state: str) -> Dict[int, str]:
+        if not user_id:
+            raise ValueError(ERROR_MESSAGES["USER_ID_REQUIRED"])
+
+        if state not in TASK_STATES.values():
+            raise ValueError(ERROR_MESSAGES["INVALID_TASK_STATE"])
+
+        # إزالة المعرفات المكررة مع الحفاظ على الترتيب
+        task_ids = list(dict.fromkeys(task_ids))
+
+        if not task_ids:
+            raise ValueError(ERROR_MESSAGES["EMPTY_BATCH"])
+
+        if len(task_ids) > self.max_batch_size:
+            raise ValueError(ERROR_MESSAGES["BATCH_TOO_LARGE"].format(max_batch_size=self.max_batch_size))
+
+        with self.uow:
+            result = self.task_repository.bulk_update_state(task_ids, user_id, state)
+
+        if self.read_cache is not None:
+            self.read_cache.invalidate(user_id)
+        return result
@@ -1,11 +1,18 @@
+from typing import Optional
 from ...domain.entities.task_entity import TaskEntity
+from ...interfaces.unit_of_work_interface import IUnitOfWork
+from ...services.read_cache_service import ReadCacheService
 from ...repositories.task_repository import TaskRepository
+from .._datetimes import to_utc
 from datetime import datetime, timezone
 
 
 class CreateTaskUseCase:
-    def __init__(self, task_repository: TaskRepository):
+    def __init__(self, task_repository: TaskRepository, uow: IUnitOfWork,
+                 read_cache: Optional[ReadCacheService] = None):
         self.task_repository = task_repository
+        self.uow = uow
+        self.read_cache = read_cache
 
     def execute(self, text: str, user_id: int, group_id: int = None, due_at=None):
         # إنشاء كيان المهمة
@@ -16,11 +23,16 @@ class CreateTaskUseCase:
             is_completed=False,
             deleted_at=None,
             completed_at=None,
-            due_at=due_at,
+            due_at=to_utc(due_at),
             created_at=datetime.now(timezone.utc),
             user_id=user_id,
             group_id=group_id
         )
         
         # استدعاء المستودع لحفظ المهمة
-        return self.task_repository.create_task(task)
+        with self.uow:
+            result = self.task_repository.create_task(task)
+
+        if self.read_cache is not None:
+            self.read_cache.invalidate(user_id)
+        return result
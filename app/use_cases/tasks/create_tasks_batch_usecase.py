@@ -0,0 +1,52 @@
+from datetime import datetime, timezone
+from typing import List, Optional
+
+from ...constants.error_messages import ERROR_MESSAGES
+from ...domain.entities.task_entity import TaskEntity
+from ...interfaces.task_repository_interface import ITaskRepository
+from ...interfaces.unit_of_work_interface import IUnitOfWork
+from ...services.read_cache_service import ReadCacheService
+from .._datetimes import to_utc
+
+
+class CreateTasksBatchUseCase:
+    def __init__(self, task_repository: ITaskRepository, uow: IUnitOfWork, max_batch_size: int = 100,
+                 read_cache: Optional[ReadCacheService] = None):
+        self.task_repository = task_repository
+        self.uow = uow
+        self.max_batch_size = max_batch_size
+        self.read_cache = read_cache
+
+    def execute(self, tasks: List[dict], user_id: int) -> List[TaskEntity]:
+        if not user_id:
+            raise ValueError(ERROR_MESSAGES["USER_ID_REQUIRED"])
+
+        if not tasks:
+            raise ValueError(ERROR_MESSAGES["EMPTY_BATCH"])
+
+        if len(tasks) > self.max_batch_size:
+            raise ValueError(ERROR_MESSAGES["BATCH_TOO_LARGE"].format(max_batch_size=self.max_batch_size))
+
+        now = datetime.now(timezone.utc)
+
+        # إنشاء الكيانات بنفس ترتيب المدخلات
+        entities = [
+            TaskEntity(
+                id=None,
+                text=task["text"],
+                is_deleted=False,
+                is_completed=False,
+                due_at=to_utc(task.get("due_at")),
+                created_at=now,
+                user_id=user_id,
+                group_id=task.get("group_id")
+            )
+            for task in tasks
+        ]
+
+        with self.uow:
+            result = self.task_repository.create_tasks(entities)
+
+        if self.read_cache is not None:
+            self.read_cache.invalidate(user_id)
+        return result
@@ -0,0 +1,24 @@
+from typing import Optional
+
+from ...constants.error_messages import ERROR_MESSAGES
+from ...domain.entities.page_entity import PageEntity
+from ...interfaces.task_repository_interface import ITaskRepository
+from .._pagination import build_page, decode_cursor, resolve_limit
+
+
+class GetArchivedTasksUseCase:
+    def __init__(self, task_repository: ITaskRepository):
+        self.task_repository = task_repository
+
+    def execute(self, user_id: int, limit: Optional[int] = None, cursor: Optional[str] = None) -> PageEntity:
+        if not user_id:
+            raise ValueError(ERROR_MESSAGES["USER_ID_REQUIRED"])
+
+        limit = resolve_limit(limit)
+
+        tasks = self.task_repository.get_archived_tasks(
+            user_id=user_id,
+            limit=limit + 1,
+            after=decode_cursor(cursor)
+        )
+        return build_page(tasks, limit)
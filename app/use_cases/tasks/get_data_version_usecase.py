@@ -0,0 +1,13 @@
+from ...constants.error_messages import ERROR_MESSAGES
+from ...interfaces.task_repository_interface import ITaskRepository
+
+
+class GetDataVersionUseCase:
+    def __init__(self, task_repository: ITaskRepository):
+        self.task_repository = task_repository
+
+    def execute(self, user_id: int) -> int:
+        if not user_id:
+            raise ValueError(ERROR_MESSAGES["USER_ID_REQUIRED"])
+
+        return self.task_repository.get_data_version(user_id)
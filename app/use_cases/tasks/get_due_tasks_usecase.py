@@ -0,0 +1,41 @@
+from typing import Optional
+
+from ...constants.error_messages import ERROR_MESSAGES
+from ...domain.entities.page_entity import PageEntity
+from ...domain.value_objects.cursor import Cursor
+from ...interfaces.task_repository_interface import ITaskRepository
+from .._datetimes import to_utc
+from .._pagination import build_page, decode_cursor, resolve_limit
+
+
+def due_cursor(task) -> Cursor:
+    # صفحات المهام المستحقة مرتبة حسب (due_at, id) تصاعدياً
+    return Cursor(task.due_at, task.id)
+
+
+class GetDueTasksUseCase:
+    def __init__(self, task_repository: ITaskRepository):
+        self.task_repository = task_repository
+
+    def execute(self, user_id: int, start, end, limit: Optional[int] = None,
+                cursor: Optional[str] = None) -> PageEntity:
+        if not user_id:
+            raise ValueError(ERROR_MESSAGES["USER_ID_REQUIRED"])
+
+        if not start or not end:
+            raise ValueError(ERROR_MESSAGES["DUE_RANGE_REQUIRED"])
+
+        start, end = to_utc(start), to_utc(end)
+        if start >= end:
+            raise ValueError(ERROR_MESSAGES["INVALID_DUE_RANGE"])
+
+        limit = resolve_limit(limit)
+
+        tasks = self.task_repository.get_tasks_due(
+            user_id=user_id,
+            start=start,
+            end=end,
+            limit=limit + 1,
+            after=decode_cursor(cursor)
+        )
+        return build_page(tasks, limit, cursor_of=due_cursor)
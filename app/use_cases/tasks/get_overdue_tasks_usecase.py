@@ -0,0 +1,28 @@
+from datetime import datetime, timezone
+from typing import Optional
+
+from ...constants.error_messages import ERROR_MESSAGES
+from ...domain.entities.page_entity import PageEntity
+from ...interfaces.task_repository_interface import ITaskRepository
+from .._pagination import build_page, decode_cursor, resolve_limit
+from .get_due_tasks_usecase import due_cursor
+
+
+class GetOverdueTasksUseCase:
+    def __init__(self, task_repository: ITaskRepository):
+        self.task_repository = task_repository
+
+    def execute(self, user_id: int, limit: Optional[int] = None, cursor: Optional[str] = None) -> PageEntity:
+        if not user_id:
+            raise ValueError(ERROR_MESSAGES["USER_ID_REQUIRED"])
+
+        limit = resolve_limit(limit)
+
+        # المهام المفتوحة التي فات موعدها، الأقدم أولاً
+        tasks = self.task_repository.get_overdue_tasks(
+            user_id=user_id,
+            now=datetime.now(timezone.utc),
+            limit=limit + 1,
+            after=decode_cursor(cursor)
+        )
+        return build_page(tasks, limit, cursor_of=due_cursor)
@@ -0,0 +1,24 @@
+from datetime import datetime, timezone
+from typing import Optional
+
+from ...constants.error_messages import ERROR_MESSAGES
+from ...domain.entities.task_stats_entity import TaskStatsEntity
+from ...interfaces.task_repository_interface import ITaskRepository
+from .._datetimes import start_of_day
+
+
+class GetTaskStatsUseCase:
+    def __init__(self, task_repository: ITaskRepository):
+        self.task_repository = task_repository
+
+    def execute(self, user_id: int, tz: Optional[str] = None) -> TaskStatsEntity:
+        if not user_id:
+            raise ValueError(ERROR_MESSAGES["USER_ID_REQUIRED"])
+
+        now = datetime.now(timezone.utc)
+
+        return self.task_repository.get_task_stats(
+            user_id=user_id,
+            now=now,
+            day_start=start_of_day(now, tz)
+        )
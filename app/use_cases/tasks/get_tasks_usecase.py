@@ -1,16 +1,34 @@
-from typing import List
-from ...domain.entities.task_entity import TaskEntity
+from typing import Optional
+from ...domain.entities.page_entity import PageEntity
 from ...interfaces.task_repository_interface import ITaskRepository
 from ...constants.error_messages import ERROR_MESSAGES
+from ...services.read_cache_service import ReadCacheService
+from .._pagination import build_page, decode_cursor, resolve_limit
 
 
 class GetTaskUseCase:
-    def __init__(self, task_repository: ITaskRepository):
+    def __init__(self, task_repository: ITaskRepository, read_cache: Optional[ReadCacheService] = None):
         self.task_repository = task_repository
+        self.read_cache = read_cache
 
-    def get_all_tasks(self, user_id: int) -> List[TaskEntity]:
+    def get_all_tasks(self, user_id: int, limit: Optional[int] = None, cursor: Optional[str] = None,
+                      data_version: Optional[int] = None) -> PageEntity:
       
         if not user_id:
             raise ValueError(ERROR_MESSAGES["USER_ID_REQUIRED"])
 
-        return self.task_repository.get_tasks(user_id=user_id)
+        limit = resolve_limit(limit)
+
+        def load() -> PageEntity:
+            tasks = self.task_repository.get_tasks(
+                user_id=user_id,
+                limit=limit + 1,
+                after=decode_cursor(cursor)
+            )
+            return build_page(tasks, limit)
+
+        if self.read_cache is None:
+            return load()
+
+        # data_version ضمن المفتاح: صفحة حُمّلت قبل كتابة لا تُقدَّم تحت ETag أحدث منها
+        return self.read_cache.get_or_load(user_id, ("tasks", limit, cursor, data_version), load)
@@ -1,10 +1,21 @@
+from typing import Optional
 from ...interfaces.task_repository_interface import ITaskRepository
+from ...interfaces.unit_of_work_interface import IUnitOfWork
+from ...services.read_cache_service import ReadCacheService
 from ...domain.entities.task_entity import TaskEntity
 
 
 class MarkTaskCompletedUseCase:
-    def __init__(self, task_repository: ITaskRepository):
+    def __init__(self, task_repository: ITaskRepository, uow: IUnitOfWork,
+                 read_cache: Optional[ReadCacheService] = None):
         self.task_repository = task_repository
+        self.uow = uow
+        self.read_cache = read_cache
 
     def execute(self, task_id: int, user_id: int) -> TaskEntity | None:
-        return self.task_repository.mark_task_completed(task_id, user_id)
+        with self.uow:
+            result = self.task_repository.mark_task_completed(task_id, user_id)
+
+        if self.read_cache is not None:
+            self.read_cache.invalidate(user_id)
+        return result
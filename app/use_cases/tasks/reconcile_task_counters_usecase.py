@@ -0,0 +1,25 @@
+import time
+
+from ...domain.entities.counter_drift_report_entity import CounterDriftReportEntity
+from ...interfaces.task_repository_interface import ITaskRepository
+from ...interfaces.unit_of_work_interface import IUnitOfWork
+
+
+class ReconcileTaskCountersUseCase:
+    def __init__(self, task_repository: ITaskRepository, uow: IUnitOfWork):
+        self.task_repository = task_repository
+        self.uow = uow
+
+    def execute(self, dry_run: bool = False) -> CounterDriftReportEntity:
+        started = time.perf_counter()
+
+        # الفحص والإصلاح في معاملة واحدة حتى تُكتب القيم التي قيست نفسها
+        with self.uow:
+            drift = self.task_repository.find_counter_drift()
+            repaired = 0 if dry_run else self.task_repository.repair_counters(drift)
+
+        return CounterDriftReportEntity(
+            drift=drift,
+            repaired=repaired,
+            elapsed_seconds=round(time.perf_counter() - started, 3)
+        )
@@ -0,0 +1,26 @@
+from typing import List, Optional
+
+from ...constants.error_messages import ERROR_MESSAGES
+from ...domain.entities.task_entity import TaskEntity
+from ...infrastructure.database.task_search import search_terms
+from ...interfaces.task_repository_interface import ITaskRepository
+from .._pagination import resolve_limit
+
+
+class SearchTasksUseCase:
+    def __init__(self, task_repository: ITaskRepository):
+        self.task_repository = task_repository
+
+    def execute(self, user_id: int, query: str, limit: Optional[int] = None) -> List[TaskEntity]:
+        if not user_id:
+            raise ValueError(ERROR_MESSAGES["USER_ID_REQUIRED"])
+
+        if not search_terms(query):
+            raise ValueError(ERROR_MESSAGES["SEARCH_QUERY_REQUIRED"])
+
+        # نتائج مرتبة حسب الصلة: أفضل limit نتيجة بدون ترقيم بالمؤشر
+        return self.task_repository.search_tasks(
+            user_id=user_id,
+            query=query,
+            limit=resolve_limit(limit)
+        )
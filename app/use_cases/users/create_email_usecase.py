@@ -2,6 +2,7 @@ from datetime import datetime, timedelta, timezone
 
 from ...domain.entities.email_entity import EmailEntity
 from ...domain.entities.verified_email_token_entity import VerifiedEmailTokenEntity
+from ...interfaces.unit_of_work_interface import IUnitOfWork
 from ...interfaces.user_repository_interface import IUserRepository
 from ...services.mail_service import MailService
 from ...services.token_service import TokenService
@@ -11,10 +12,12 @@ from ...constants.error_messages import ERROR_MESSAGES
 class CreateVerifiedEmailTokenUseCase:
     def __init__(self,
                  user_repo: IUserRepository,
+                 uow: IUnitOfWork,
                  token_service: TokenService,
                  mail_service: MailService,
                  base_url: str):
         self.user_repo = user_repo
+        self.uow = uow
         self.token_service = token_service
         self.mail_service = mail_service
         self.base_url = base_url
@@ -26,34 +29,35 @@ class CreateVerifiedEmailTokenUseCase:
         if not user_id:
             raise ValueError(ERROR_MESSAGES["MISSING_USER_ID"])
 
-        # 2️⃣ إنشاء الإيميل في قاعدة البيانات
-        email_entity = EmailEntity(
-            email_address=email_address,
-            user_id=user_id,
-            is_primary=False
-        )
-        new_email = self.user_repo.create_email(email_entity)
-
-        # 3️⃣ إنشاء التوكن للتحقق
-        try:
-            raw_token, token_hash, expires = self.token_service.generate_token(
-                email=email_address,
+        # 2️⃣ إنشاء الإيميل والتوكن في معاملة واحدة
+        with self.uow:
+            email_entity = EmailEntity(
+                email_address=email_address,
                 user_id=user_id,
-                token_type="verify_email",
-                expires_delta=timedelta(hours=2)
+                is_primary=False
             )
-        except Exception:
-            raise ValueError(ERROR_MESSAGES["TOKEN_GENERATION_FAILED"])
+            new_email = self.user_repo.create_email(email_entity)
 
-        # 4️⃣ تخزين التوكن في قاعدة البيانات
-        token_entity = VerifiedEmailTokenEntity(
-            token_hash=token_hash,
-            is_used=False,
-            expires_at=expires,
-            created_at=datetime.now(timezone.utc),
-            email_id=new_email.id
-        )
-        self.user_repo.create_verified_email_token(token_entity)
+            # 3️⃣ إنشاء التوكن للتحقق
+            try:
+                raw_token, token_hash, expires = self.token_service.generate_token(
+                    email=email_address,
+                    user_id=user_id,
+                    token_type="verify_email",
+                    expires_delta=timedelta(hours=2)
+                )
+            except Exception:
+                raise ValueError(ERROR_MESSAGES["TOKEN_GENERATION_FAILED"])
+
+            # 4️⃣ تخزين التوكن في قاعدة البيانات
+            token_entity = VerifiedEmailTokenEntity(
+                token_hash=token_hash,
+                is_used=False,
+                expires_at=expires,
+                created_at=datetime.now(timezone.utc),
+                email_id=new_email.id
+            )
+            self.user_repo.create_verified_email_token(token_entity)
 
         # 5️⃣ إنشاء رابط التحقق
         verification_link = f"{self.base_url}/verify-email?token={raw_token}"
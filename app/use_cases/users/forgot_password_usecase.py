@@ -1,6 +1,7 @@
 from datetime import datetime, timedelta, timezone
 
 from ...domain.entities.password_reset_token_entity import PasswordResetTokenEntity
+from ...interfaces.unit_of_work_interface import IUnitOfWork
 from ...interfaces.user_repository_interface import IUserRepository
 from ...services.mail_service import MailService
 from ...services.token_service import TokenService
@@ -10,10 +11,12 @@ from ...constants.error_messages import ERROR_MESSAGES
 class ForgotPasswordUseCase:
     def __init__(self,
                  user_repo: IUserRepository,
+                 uow: IUnitOfWork,
                  token_service: TokenService,
                  mail_service: MailService,
                  base_url: str):
         self.user_repo = user_repo
+        self.uow = uow
         self.token_service = token_service
         self.mail_service = mail_service
         self.base_url = base_url
@@ -49,7 +52,8 @@ class ForgotPasswordUseCase:
             created_at=datetime.now(timezone.utc),
             user_id=user_id
         )
-        self.user_repo.create_password_reset_token(token_entity)
+        with self.uow:
+            self.user_repo.create_password_reset_token(token_entity)
 
         # 5️⃣ إنشاء الرابط
         reset_link = f"{self.base_url}/reset-password?token={raw_token}"
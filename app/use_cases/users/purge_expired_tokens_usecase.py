@@ -0,0 +1,40 @@
+import time
+from datetime import datetime, timezone
+
+from ...domain.entities.purge_report_entity import PurgeReportEntity
+from ...interfaces.unit_of_work_interface import IUnitOfWork
+from ...interfaces.user_repository_interface import IUserRepository
+from ...constants.error_messages import ERROR_MESSAGES
+
+
+class PurgeExpiredTokensUseCase:
+    def __init__(self, user_repo: IUserRepository, uow: IUnitOfWork, batch_size: int = 1000):
+        self.user_repo = user_repo
+        self.uow = uow
+        self.batch_size = batch_size
+
+    def execute(self, batch_size: int = None) -> PurgeReportEntity:
+        batch_size = batch_size or self.batch_size
+        if batch_size < 1:
+            raise ValueError(ERROR_MESSAGES["INVALID_BATCH_SIZE"])
+
+        started = time.perf_counter()
+        now = datetime.now(timezone.utc)
+        report = PurgeReportEntity()
+
+        for name, purge in (
+            ("verified_email_tokens", self.user_repo.purge_verified_email_tokens),
+            ("password_reset_tokens", self.user_repo.purge_password_reset_tokens),
+        ):
+            report.deleted[name] = 0
+            while True:
+                # كل دفعة في معاملة مستقلة حتى لا تُحجز الأقفال طوال عملية التنظيف
+                with self.uow:
+                    deleted = purge(before=now, batch_size=batch_size)
+                report.batches += 1
+                report.deleted[name] += deleted
+                if deleted < batch_size:
+                    break
+
+        report.elapsed_seconds = round(time.perf_counter() - started, 3)
+        return report
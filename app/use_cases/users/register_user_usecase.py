@@ -3,6 +3,7 @@ from datetime import datetime, timedelta, timezone
 from ...domain.entities.email_entity import EmailEntity
 from ...domain.entities.user_entity import UserEntity
 from ...domain.entities.verified_email_token_entity import VerifiedEmailTokenEntity
+from ...interfaces.unit_of_work_interface import IUnitOfWork
 from ...repositories.user_repository import UserRepository
 from ...services.mail_service import MailService
 from ...services.password_hashing_service import PasswordHashingService
@@ -13,11 +14,13 @@ from ...constants.error_messages import ERROR_MESSAGES
 class RegisterUserUseCase:
     def __init__(self,
                  user_repo: UserRepository,
+                 uow: IUnitOfWork,
                  hashing_service: PasswordHashingService,
                  token_service: TokenService,
                  mail_service: MailService,
                  base_url: str):
         self.user_repo = user_repo
+        self.uow = uow
         self.hashing_service = hashing_service
         self.token_service = token_service
         self.mail_service = mail_service
@@ -45,27 +48,28 @@ class RegisterUserUseCase:
             ]
         )
 
-        # 4️⃣ Save user
-        created_user = self.user_repo.create_user(new_user)
+        # 4️⃣ Save user and verification token in one transaction
+        with self.uow:
+            created_user = self.user_repo.create_user(new_user)
 
-        # 5️⃣ Generate email verification token
-        raw_token, token_hash, expires = self.token_service.generate_token(
-            email=email,
-            user_id=created_user.id,
-            token_type="verify_email",
-            expires_delta=timedelta(hours=24)
-        )
+            # 5️⃣ Generate email verification token
+            raw_token, token_hash, expires = self.token_service.generate_token(
+                email=email,
+                user_id=created_user.id,
+                token_type="verify_email",
+                expires_delta=timedelta(hours=24)
+            )
 
-        # 6️⃣ Store token
-        token_entity = VerifiedEmailTokenEntity(
-            token_hash=token_hash,
-            is_used=False,
-            expires_at=expires,
-            created_at=datetime.now(timezone.utc),
-            email_id=created_user.emails[0].id,
-            user_id=created_user.id
-        )
-        self.user_repo.create_verified_email_token(token_entity)
+            # 6️⃣ Store token
+            token_entity = VerifiedEmailTokenEntity(
+                token_hash=token_hash,
+                is_used=False,
+                expires_at=expires,
+                created_at=datetime.now(timezone.utc),
+                email_id=created_user.emails[0].id,
+                user_id=created_user.id
+            )
+            self.user_repo.create_verified_email_token(token_entity)
 
         # 7️⃣ Send verification email
         verification_link = f"{self.base_url}/verify-email?token={raw_token}"
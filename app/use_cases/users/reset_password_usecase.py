@@ -1,5 +1,6 @@
 from datetime import datetime, timezone
 
+from ...interfaces.unit_of_work_interface import IUnitOfWork
 from ...repositories.user_repository import UserRepository
 from ...services.password_hashing_service import PasswordHashingService
 from ...services.token_service import TokenService
@@ -9,9 +10,11 @@ from ...constants.error_messages import ERROR_MESSAGES
 class ResetPasswordUseCase:
     def __init__(self,
                  user_repo: UserRepository,
+                 uow: IUnitOfWork,
                  token_service: TokenService,
                  hashing_service: PasswordHashingService):
         self.user_repo = user_repo
+        self.uow = uow
         self.token_service = token_service
         self.hashing_service = hashing_service
 
@@ -40,20 +43,21 @@ class ResetPasswordUseCase:
         if stored_token.is_used:
             raise ValueError(ERROR_MESSAGES["TOKEN_ALREADY_USED"])
 
-        # 4️⃣ Update password
+        # 4️⃣ Update password and consume the token atomically
         hashed_password = self.hashing_service.hash_password(new_password)
-        user = self.user_repo.update_password(
-            id=stored_token.user_id,
-            new_password_hashing=hashed_password
-        )
-        if not user:
-            raise ValueError(ERROR_MESSAGES["USER_NOT_FOUND"])
-
-        # 5️⃣ Confirm token usage
-        confirmed_token = self.user_repo.confirm_password_reset_token(
-            token_id=stored_token.id
-        )
-        if not confirmed_token:
-            raise ValueError(ERROR_MESSAGES["TOKEN_CONFIRMATION_FAILED"])
+        with self.uow:
+            user = self.user_repo.update_password(
+                id=stored_token.user_id,
+                new_password_hashing=hashed_password
+            )
+            if not user:
+                raise ValueError(ERROR_MESSAGES["USER_NOT_FOUND"])
+
+            # 5️⃣ Confirm token usage
+            confirmed_token = self.user_repo.confirm_password_reset_token(
+                token_id=stored_token.id
+            )
+            if not confirmed_token:
+                raise ValueError(ERROR_MESSAGES["TOKEN_CONFIRMATION_FAILED"])
 
         return True
@@ -1,10 +1,12 @@
+from ...interfaces.unit_of_work_interface import IUnitOfWork
 from ...repositories.user_repository import UserRepository
 from ...constants.error_messages import ERROR_MESSAGES
 
 
 class ResetUsernameUseCase:
-    def __init__(self, user_repo: UserRepository):
+    def __init__(self, user_repo: UserRepository, uow: IUnitOfWork):
         self.user_repo = user_repo
+        self.uow = uow
 
     def execute(self, old_username: str, new_username: str):
         # 1️⃣ Validate inputs
@@ -14,10 +16,11 @@ class ResetUsernameUseCase:
             raise ValueError(ERROR_MESSAGES["INVALID_NEW_USERNAME"])
 
         # 2️⃣ Update username
-        updated_user = self.user_repo.update_username(
-            old_username=old_username,
-            new_username=new_username
-        )
+        with self.uow:
+            updated_user = self.user_repo.update_username(
+                old_username=old_username,
+                new_username=new_username
+            )
 
         if not updated_user:
             raise ValueError(ERROR_MESSAGES["USERNAME_UPDATE_FAILED"])
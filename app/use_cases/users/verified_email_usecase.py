@@ -1,11 +1,13 @@
+from ...interfaces.unit_of_work_interface import IUnitOfWork
 from ...repositories.user_repository import UserRepository
 from ...services.token_service import TokenService
 from ...constants.error_messages import ERROR_MESSAGES
 
 
 class VerifiedEmailUseCase:
-    def __init__(self, user_repo: UserRepository, token_service: TokenService):
+    def __init__(self, user_repo: UserRepository, uow: IUnitOfWork, token_service: TokenService):
         self.user_repo = user_repo
+        self.uow = uow
         self.token_service = token_service
 
     def execute(self, raw_token: str):
@@ -37,9 +39,10 @@ class VerifiedEmailUseCase:
             raise ValueError(ERROR_MESSAGES["TOKEN_MISMATCH"])
 
         # 6️⃣ Confirm email
-        self.user_repo.confirm_email(
-            email_id=stored_token.email_id,
-            token_id=stored_token.id
-        )
+        with self.uow:
+            self.user_repo.confirm_email(
+                email_id=stored_token.email_id,
+                token_id=stored_token.id
+            )
 
         return {"message": ERROR_MESSAGES["EMAIL_VERIFIED_SUCCESS"]}
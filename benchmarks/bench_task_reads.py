@@ -0,0 +1,83 @@
+"""
+مقارنة سرعة قراءة المهام: تحميل كائنات ORM ثم تحويلها إلى كيانات
+مقابل مسار SQLAlchemy Core المستخدم في TaskRepository.get_tasks.
+
+التشغيل من جذر المشروع:
+    python -m benchmarks.bench_task_reads --rows 100000
+"""
+import argparse
+import time
+from datetime import datetime, timedelta
+
+from sqlalchemy import create_engine, insert
+from sqlalchemy.orm import sessionmaker
+
+from app.infrastructure.database.models import Base, Task
+from app.repositories.task_repository import TaskRepository
+
+
+def seed(session, rows: int, user_id: int = 1):
+    base = datetime(2025, 1, 1)
+    session.execute(insert(Task.__table__), [
+        {
+            "text": f"Task {i}",
+            "is_deleted": False,
+            "is_completed": i % 3 == 0,
+            "created_at": base + timedelta(seconds=i),
+            "user_id": user_id,
+        }
+        for i in range(rows)
+    ])
+    session.commit()
+
+
+def read_with_orm(session, repo: TaskRepository, user_id: int):
+    # المسار السابق: كائنات ORM كاملة ثم نسخ الخصائص إلى TaskEntity
+    db_tasks = session.query(Task).filter(Task.user_id == user_id).order_by(
+        Task.created_at.desc(), Task.id.desc()
+    ).all()
+    return [repo._convert_to_entity(task) for task in db_tasks]
+
+
+def read_with_core(session, repo: TaskRepository, user_id: int):
+    return repo.get_tasks(user_id=user_id)
+
+
+def measure(label, read, session_factory, rows: int, repeat: int):
+    best = None
+    for _ in range(repeat):
+        session = session_factory()
+        repo = TaskRepository(session)
+        start = time.perf_counter()
+        result = read(session, repo, 1)
+        elapsed = time.perf_counter() - start
+        session.close()
+        assert len(result) == rows
+        best = elapsed if best is None else min(best, elapsed)
+
+    print(f"{label:<28} {best * 1000:>9.1f} ms   {rows / best:>12,.0f} rows/sec")
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--url", default="sqlite://", help="database URL (default: in-memory SQLite)")
+    args = parser.parse_args()
+
+    engine = create_engine(args.url)
+    Base.metadata.create_all(engine)
+    session_factory = sessionmaker(bind=engine)
+
+    with session_factory() as session:
+        seed(session, args.rows)
+
+    print(f"Reading {args.rows:,} tasks ({engine.dialect.name}), best of {args.repeat}")
+    orm = measure("ORM hydration (before)", read_with_orm, session_factory, args.rows, args.repeat)
+    core = measure("Core select (after)", read_with_core, session_factory, args.rows, args.repeat)
+    print(f"speedup: {orm / core:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
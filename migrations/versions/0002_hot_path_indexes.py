@@ -0,0 +1,50 @@
+"""composite and partial indexes for hot query predicates
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2025-11-12 00:00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "0002"
+down_revision: Union[str, None] = "0001"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+LIVE_ROWS_WHERE = {
+    "postgresql_where": sa.text("is_deleted = false"),
+    "sqlite_where": sa.text("is_deleted = 0"),
+}
+
+
+def upgrade() -> None:
+    op.create_index("ix_emails_user_id", "emails", ["user_id"])
+    op.create_index(
+        "ix_verified_email_tokens_email_open",
+        "verified_email_tokens",
+        ["email_id", "is_used", "expires_at"],
+    )
+    op.create_index("ix_password_reset_tokens_token_hash", "password_reset_tokens", ["token_hash"])
+
+    op.create_index("ix_tasks_user_created", "tasks", ["user_id", "created_at", "id"])
+    op.create_index("ix_tasks_user_live_completed", "tasks", ["user_id", "is_completed"], **LIVE_ROWS_WHERE)
+    op.create_index("ix_tasks_group_live", "tasks", ["group_id", "is_completed", "created_at"], **LIVE_ROWS_WHERE)
+
+    op.create_index("ix_groups_user_created", "groups", ["user_id", "created_at", "id"])
+    op.create_index("ix_groups_user_live_created", "groups", ["user_id", "created_at"], **LIVE_ROWS_WHERE)
+
+
+def downgrade() -> None:
+    op.drop_index("ix_groups_user_live_created", table_name="groups")
+    op.drop_index("ix_groups_user_created", table_name="groups")
+    op.drop_index("ix_tasks_group_live", table_name="tasks")
+    op.drop_index("ix_tasks_user_live_completed", table_name="tasks")
+    op.drop_index("ix_tasks_user_created", table_name="tasks")
+    op.drop_index("ix_password_reset_tokens_token_hash", table_name="password_reset_tokens")
+    op.drop_index("ix_verified_email_tokens_email_open", table_name="verified_email_tokens")
+    op.drop_index("ix_emails_user_id", table_name="emails")
@@ -0,0 +1,71 @@
+"""full-text search index over task text
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2025-12-01 00:00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+revision: str = "0004"
+down_revision: Union[str, None] = "0003"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# الـ DDL كما كان عند كتابة هذا الترحيل، مستقلاً عن ثوابت التطبيق التي قد تتغير لاحقاً
+SQLITE_SEARCH_DDL = [
+    "CREATE VIRTUAL TABLE IF NOT EXISTS tasks_fts USING fts5("
+    "text, content='tasks', content_rowid='id', tokenize='unicode61 remove_diacritics 2')",
+    "CREATE TRIGGER IF NOT EXISTS tasks_fts_ai AFTER INSERT ON tasks BEGIN "
+    "INSERT INTO tasks_fts(rowid, text) VALUES (new.id, new.text); END",
+    "CREATE TRIGGER IF NOT EXISTS tasks_fts_ad AFTER DELETE ON tasks BEGIN "
+    "INSERT INTO tasks_fts(tasks_fts, rowid, text) VALUES ('delete', old.id, old.text); END",
+    "CREATE TRIGGER IF NOT EXISTS tasks_fts_au AFTER UPDATE OF text ON tasks BEGIN "
+    "INSERT INTO tasks_fts(tasks_fts, rowid, text) VALUES ('delete', old.id, old.text); "
+    "INSERT INTO tasks_fts(rowid, text) VALUES (new.id, new.text); END",
+]
+
+SQLITE_SEARCH_DROP = [
+    "DROP TRIGGER IF EXISTS tasks_fts_au",
+    "DROP TRIGGER IF EXISTS tasks_fts_ad",
+    "DROP TRIGGER IF EXISTS tasks_fts_ai",
+    "DROP TABLE IF EXISTS tasks_fts",
+]
+
+SQLITE_SEARCH_REBUILD = "INSERT INTO tasks_fts(tasks_fts) VALUES ('rebuild')"
+
+# 0008 يستبدل هذا الفهرس بفهرس مركب مع user_id
+POSTGRES_SEARCH_DDL = [
+    "CREATE INDEX IF NOT EXISTS ix_tasks_text_search ON tasks USING gin (to_tsvector('simple', text))",
+]
+
+POSTGRES_SEARCH_DROP = [
+    "DROP INDEX IF EXISTS ix_tasks_text_search",
+]
+
+
+def upgrade() -> None:
+    dialect = op.get_bind().dialect.name
+
+    if dialect == "sqlite":
+        for statement in SQLITE_SEARCH_DDL:
+            op.execute(statement)
+        # فهرسة المهام الموجودة قبل إضافة المشغلات
+        op.execute(SQLITE_SEARCH_REBUILD)
+    elif dialect == "postgresql":
+        for statement in POSTGRES_SEARCH_DDL:
+            op.execute(statement)
+
+
+def downgrade() -> None:
+    dialect = op.get_bind().dialect.name
+
+    if dialect == "sqlite":
+        for statement in SQLITE_SEARCH_DROP:
+            op.execute(statement)
+    elif dialect == "postgresql":
+        for statement in POSTGRES_SEARCH_DROP:
+            op.execute(statement)
@@ -0,0 +1,30 @@
+"""partial index for due-date range and overdue queries
+
+Revision ID: 0005
+Revises: 0004
+Create Date: 2025-12-08 00:00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "0005"
+down_revision: Union[str, None] = "0004"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+OPEN_DUE_ROWS_WHERE = {
+    "postgresql_where": sa.text("is_deleted = false AND is_completed = false AND due_at IS NOT NULL"),
+    "sqlite_where": sa.text("is_deleted = 0 AND is_completed = 0 AND due_at IS NOT NULL"),
+}
+
+
+def upgrade() -> None:
+    op.create_index("ix_tasks_user_open_due", "tasks", ["user_id", "due_at", "id"], **OPEN_DUE_ROWS_WHERE)
+
+
+def downgrade() -> None:
+    op.drop_index("ix_tasks_user_open_due", table_name="tasks")
@@ -0,0 +1,97 @@
+"""per-user and per-group task counters
+
+Revision ID: 0006
+Revises: 0005
+Create Date: 2025-12-15 00:00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "0006"
+down_revision: Union[str, None] = "0005"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+COMPLETED_ROWS_WHERE = {
+    "postgresql_where": sa.text("is_deleted = false AND is_completed = true"),
+    "sqlite_where": sa.text("is_deleted = 0 AND is_completed = 1"),
+}
+
+tasks = sa.table(
+    "tasks",
+    sa.column("user_id", sa.Integer),
+    sa.column("group_id", sa.Integer),
+    sa.column("is_deleted", sa.Boolean),
+    sa.column("is_completed", sa.Boolean),
+)
+groups = sa.table(
+    "groups",
+    sa.column("id", sa.Integer),
+    sa.column("task_count", sa.Integer),
+    sa.column("open_count", sa.Integer),
+)
+user_task_counters = sa.table(
+    "user_task_counters",
+    sa.column("user_id", sa.Integer),
+    sa.column("total", sa.Integer),
+    sa.column("open", sa.Integer),
+    sa.column("completed", sa.Integer),
+)
+
+
+def _count_where(condition):
+    return sa.func.coalesce(sa.func.sum(sa.case((condition, 1), else_=0)), 0)
+
+
+def upgrade() -> None:
+    with op.batch_alter_table("groups") as batch_op:
+        batch_op.add_column(sa.Column("task_count", sa.Integer(), server_default=sa.text("0"), nullable=False))
+        batch_op.add_column(sa.Column("open_count", sa.Integer(), server_default=sa.text("0"), nullable=False))
+
+    op.create_table(
+        "user_task_counters",
+        sa.Column("user_id", sa.Integer(), autoincrement=False, nullable=False),
+        sa.Column("total", sa.Integer(), server_default=sa.text("0"), nullable=False),
+        sa.Column("open", sa.Integer(), server_default=sa.text("0"), nullable=False),
+        sa.Column("completed", sa.Integer(), server_default=sa.text("0"), nullable=False),
+        sa.ForeignKeyConstraint(["user_id"], ["users.id"]),
+        sa.PrimaryKeyConstraint("user_id"),
+    )
+    op.create_index("ix_tasks_user_completed_at", "tasks", ["user_id", "completed_at"], **COMPLETED_ROWS_WHERE)
+
+    # ملء العدادات من المهام الحية الموجودة
+    live = tasks.c.is_deleted == sa.false()
+    op.execute(
+        user_task_counters.insert().from_select(
+            ["user_id", "total", "open", "completed"],
+            sa.select(
+                tasks.c.user_id,
+                sa.func.count(),
+                _count_where(tasks.c.is_completed == sa.false()),
+                _count_where(tasks.c.is_completed == sa.true()),
+            ).where(live).group_by(tasks.c.user_id)
+        )
+    )
+
+    group_tasks = sa.and_(tasks.c.group_id == groups.c.id, live)
+    op.execute(
+        groups.update().values(
+            task_count=sa.select(sa.func.count()).where(group_tasks).scalar_subquery(),
+            open_count=sa.select(sa.func.count()).where(
+                group_tasks, tasks.c.is_completed == sa.false()
+            ).scalar_subquery(),
+        )
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_tasks_user_completed_at", table_name="tasks")
+    op.drop_table("user_task_counters")
+
+    with op.batch_alter_table("groups") as batch_op:
+        batch_op.drop_column("open_count")
+        batch_op.drop_column("task_count")
@@ -0,0 +1,39 @@
+"""task updated_at and per-user data_version for list ETags
+
+Revision ID: 0007
+Revises: 0006
+Create Date: 2026-01-05 00:00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "0007"
+down_revision: Union[str, None] = "0006"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    with op.batch_alter_table("tasks") as batch_op:
+        batch_op.add_column(sa.Column("updated_at", sa.DateTime(), nullable=True))
+
+    with op.batch_alter_table("archived_tasks") as batch_op:
+        batch_op.add_column(sa.Column("updated_at", sa.DateTime(), nullable=True))
+
+    with op.batch_alter_table("user_task_counters") as batch_op:
+        batch_op.add_column(sa.Column("data_version", sa.Integer(), server_default=sa.text("0"), nullable=False))
+
+
+def downgrade() -> None:
+    with op.batch_alter_table("user_task_counters") as batch_op:
+        batch_op.drop_column("data_version")
+
+    with op.batch_alter_table("archived_tasks") as batch_op:
+        batch_op.drop_column("updated_at")
+
+    with op.batch_alter_table("tasks") as batch_op:
+        batch_op.drop_column("updated_at")
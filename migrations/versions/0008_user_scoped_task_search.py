@@ -0,0 +1,50 @@
+"""scope the PostgreSQL task search index to the user
+
+Revision ID: 0008
+Revises: 0007
+Create Date: 2026-01-12 00:00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+revision: str = "0008"
+down_revision: Union[str, None] = "0007"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# الـ DDL كما كان عند كتابة هذا الترحيل، مستقلاً عن ثوابت التطبيق التي قد تتغير لاحقاً
+POSTGRES_SEARCH_DDL = [
+    "CREATE EXTENSION IF NOT EXISTS btree_gin",
+    "CREATE INDEX IF NOT EXISTS ix_tasks_user_text_search ON tasks USING gin (user_id, to_tsvector('simple', text)) "
+    "WHERE is_deleted = false",
+]
+
+POSTGRES_SEARCH_DROP = [
+    "DROP INDEX IF EXISTS ix_tasks_user_text_search",
+]
+
+# فهرس 0004 بدون user_id
+LEGACY_SEARCH_DDL = "CREATE INDEX IF NOT EXISTS ix_tasks_text_search ON tasks USING gin (to_tsvector('simple', text))"
+LEGACY_SEARCH_DROP = "DROP INDEX IF EXISTS ix_tasks_text_search"
+
+
+def upgrade() -> None:
+    # SQLite لا يحتاج تغييراً في المخطط: الاستعلام نفسه يبدأ من مهام المستخدم
+    if op.get_bind().dialect.name != "postgresql":
+        return
+
+    for statement in POSTGRES_SEARCH_DDL:
+        op.execute(statement)
+    op.execute(LEGACY_SEARCH_DROP)
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name != "postgresql":
+        return
+
+    op.execute(LEGACY_SEARCH_DDL)
+    for statement in POSTGRES_SEARCH_DROP:
+        op.execute(statement)
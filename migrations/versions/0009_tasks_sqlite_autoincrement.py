@@ -0,0 +1,61 @@
+"""never reuse task ids on SQLite
+
+Revision ID: 0009
+Revises: 0008
+Create Date: 2026-01-19 00:00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+revision: str = "0009"
+down_revision: Union[str, None] = "0008"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# مشغلات tasks_fts كما أنشأها 0004؛ تُحذف مع الجدول القديم عند إعادة بنائه
+SQLITE_SEARCH_TRIGGERS = [
+    "CREATE TRIGGER IF NOT EXISTS tasks_fts_ai AFTER INSERT ON tasks BEGIN "
+    "INSERT INTO tasks_fts(rowid, text) VALUES (new.id, new.text); END",
+    "CREATE TRIGGER IF NOT EXISTS tasks_fts_ad AFTER DELETE ON tasks BEGIN "
+    "INSERT INTO tasks_fts(tasks_fts, rowid, text) VALUES ('delete', old.id, old.text); END",
+    "CREATE TRIGGER IF NOT EXISTS tasks_fts_au AFTER UPDATE OF text ON tasks BEGIN "
+    "INSERT INTO tasks_fts(tasks_fts, rowid, text) VALUES ('delete', old.id, old.text); "
+    "INSERT INTO tasks_fts(rowid, text) VALUES (new.id, new.text); END",
+]
+
+# أكبر معرف صدر حتى الآن، بما فيه معرفات المهام التي نُقلت إلى الأرشيف
+SEED_TASKS_SEQUENCE = [
+    "DELETE FROM sqlite_sequence WHERE name = 'tasks'",
+    "INSERT INTO sqlite_sequence (name, seq) SELECT 'tasks', MAX("
+    "(SELECT COALESCE(MAX(id), 0) FROM tasks), (SELECT COALESCE(MAX(id), 0) FROM archived_tasks))",
+]
+
+
+def _rebuild_tasks(autoincrement: bool) -> None:
+    # SQLite لا يضيف AUTOINCREMENT إلا عند إنشاء الجدول، فيُعاد بناؤه مع فهارسه
+    with op.batch_alter_table("tasks", recreate="always",
+                              table_kwargs={"sqlite_autoincrement": autoincrement}):
+        pass
+
+    for statement in SQLITE_SEARCH_TRIGGERS:
+        op.execute(statement)
+
+
+def upgrade() -> None:
+    # PostgreSQL يصدر المعرفات من SERIAL فلا يعيد استخدامها
+    if op.get_bind().dialect.name != "sqlite":
+        return
+
+    _rebuild_tasks(autoincrement=True)
+    for statement in SEED_TASKS_SEQUENCE:
+        op.execute(statement)
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name != "sqlite":
+        return
+
+    _rebuild_tasks(autoincrement=False)
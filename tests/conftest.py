@@ -1,6 +1,6 @@
 # tests/conftest.py
 import pytest
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
 from sqlalchemy.orm import sessionmaker
 from app.infrastructure.database.models import Base
 
@@ -15,3 +15,45 @@ def db_session():
         yield session
     finally:
         session.close()
+
+
+@pytest.fixture(scope="function")
+def query_counter(db_session):
+    # تسجيل جميع استعلامات SQL المنفذة على المحرك لعدّها في الاختبارات
+    statements = []
+
+    def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    engine = db_session.get_bind()
+    event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+    try:
+        yield statements
+    finally:
+        event.remove(engine, "before_cursor_execute", _before_cursor_execute)
+
+
+@pytest.fixture(scope="function")
+def flask_app(tmp_path, monkeypatch):
+    # تطبيق Flask كامل على قاعدة SQLite مؤقتة مع رموز JWT في الترويسات
+    from app import create_app
+    from app.infrastructure.database import db_connection
+
+    monkeypatch.setattr(db_connection, "DATABASE_URL", f"sqlite:///{tmp_path / 'app.db'}")
+    monkeypatch.setenv("JWT_SECRET_KEY", "test-secret-key-with-at-least-32-bytes")
+    monkeypatch.setenv("JWT_TOKEN_LOCATION", "headers")
+    monkeypatch.setenv("DB_POOL_CLASS", "QueuePool")
+
+    app = create_app()
+    Base.metadata.create_all(bind=db_connection.engine)
+    yield app
+    db_connection.engine.dispose()
+
+
+@pytest.fixture(scope="function")
+def auth_headers(flask_app):
+    from flask_jwt_extended import create_access_token
+
+    with flask_app.app_context():
+        token = create_access_token(identity="1", additional_claims={"user_id": 1})
+    return {"Authorization": f"Bearer {token}"}
@@ -0,0 +1,64 @@
+# tests/test_app_sessions.py
+import pytest
+from flask import g
+from sqlalchemy import event
+
+from app.infrastructure.database import db_connection
+
+
+@pytest.fixture
+def pool_checkouts(flask_app):
+    # عدّ مرات سحب اتصال من مجموعة الاتصالات أثناء الطلبات
+    checkouts = []
+
+    def _on_checkout(dbapi_connection, connection_record, connection_proxy):
+        checkouts.append(connection_record)
+
+    event.listen(db_connection.engine, "checkout", _on_checkout)
+    try:
+        yield checkouts
+    finally:
+        event.remove(db_connection.engine, "checkout", _on_checkout)
+
+
+def test_logout_does_not_touch_pool(flask_app, pool_checkouts):
+    response = flask_app.test_client().post("/auth/logout")
+
+    assert response.status_code == 200
+    assert pool_checkouts == []
+
+
+def test_cors_preflight_does_not_touch_pool(flask_app, pool_checkouts):
+    response = flask_app.test_client().options(
+        "/api/task/",
+        headers={"Origin": "http://example.com", "Access-Control-Request-Method": "GET"}
+    )
+
+    assert response.status_code == 200
+    assert pool_checkouts == []
+
+
+def test_unauthorized_request_does_not_touch_pool(flask_app, pool_checkouts):
+    response = flask_app.test_client().get("/api/task/")
+
+    assert response.status_code == 401
+    assert pool_checkouts == []
+
+
+def test_db_endpoint_opens_one_session(flask_app, auth_headers, pool_checkouts):
+    response = flask_app.test_client().get("/api/task/", headers=auth_headers)
+
+    assert response.status_code == 200
+    assert len(pool_checkouts) == 1
+
+
+def test_request_reuses_and_closes_session(flask_app, auth_headers):
+    with flask_app.test_request_context("/api/task/"):
+        session = flask_app.container.db_session()
+        # نفس الجلسة تُعاد لكل مستودع داخل الطلب
+        assert flask_app.container.db_session() is session
+        session.connection()
+        assert db_connection.engine.pool.checkedout() == 1
+
+    # teardown يغلق الجلسة ويعيد الاتصال إلى المجموعة
+    assert db_connection.engine.pool.checkedout() == 0
@@ -0,0 +1,66 @@
+# tests/test_db_connection.py
+import pytest
+from sqlalchemy import pool
+
+from app.infrastructure.database.db_connection import create_db_engine, warm_up_pool
+
+
+def test_create_db_engine_applies_queue_pool_settings(tmp_path):
+    engine = create_db_engine(
+        f"sqlite:///{tmp_path / 'pool.db'}",
+        pool_size=3,
+        max_overflow=2,
+        pool_timeout=5,
+        pool_recycle=600,
+        pool_pre_ping=True
+    )
+
+    assert isinstance(engine.pool, pool.QueuePool)
+    assert engine.pool.size() == 3
+    assert engine.pool._max_overflow == 2
+    assert engine.pool.timeout() == 5
+    assert engine.pool._recycle == 600
+    assert engine.pool._pre_ping is True
+
+
+def test_create_db_engine_supports_null_pool(tmp_path):
+    engine = create_db_engine(f"sqlite:///{tmp_path / 'pool.db'}", pool_class="NullPool", pool_size=50)
+
+    assert isinstance(engine.pool, pool.NullPool)
+
+
+def test_create_db_engine_rejects_unknown_pool_class():
+    with pytest.raises(ValueError):
+        create_db_engine("sqlite://", pool_class="MagicPool")
+
+
+def test_warm_up_pool_leaves_connections_checked_in(tmp_path):
+    engine = create_db_engine(f"sqlite:///{tmp_path / 'pool.db'}", pool_size=4)
+
+    assert warm_up_pool(engine, 3) == 3
+    assert engine.pool.checkedin() == 3
+    assert engine.pool.checkedout() == 0
+
+
+def test_warm_up_pool_is_clamped_to_pool_size(tmp_path):
+    # أكبر من pool_size + max_overflow: كان ينتظر pool_timeout ثم يرفع TimeoutError
+    engine = create_db_engine(f"sqlite:///{tmp_path / 'pool.db'}", pool_size=2, max_overflow=1, pool_timeout=0.1)
+
+    assert warm_up_pool(engine, 10) == 2
+    assert engine.pool.checkedin() == 2
+
+
+def test_create_app_survives_oversized_warm_up(tmp_path, monkeypatch):
+    from app import create_app
+    from app.infrastructure.database import db_connection
+
+    monkeypatch.setattr(db_connection, "DATABASE_URL", f"sqlite:///{tmp_path / 'app.db'}")
+    monkeypatch.setenv("DB_POOL_SIZE", "2")
+    monkeypatch.setenv("DB_MAX_OVERFLOW", "0")
+    monkeypatch.setenv("DB_POOL_TIMEOUT", "0.1")
+    monkeypatch.setenv("DB_POOL_WARMUP", "5")
+
+    create_app()
+
+    assert db_connection.engine.pool.checkedin() == 2
+    db_connection.engine.dispose()
@@ -0,0 +1,154 @@
+# tests/test_etags.py
+from unittest.mock import MagicMock
+
+import pytest
+from flask_jwt_extended import create_access_token
+from sqlalchemy import event, update
+
+from app.domain.entities.group_entity import GroupEntity
+from app.domain.entities.task_entity import TaskEntity
+from app.infrastructure.database import db_connection
+from app.infrastructure.database.models import UserTaskCounter
+from app.repositories.group_repository import GroupRepository
+from app.repositories.task_repository import TaskRepository
+from app.services.read_cache_service import ReadCacheService
+from app.use_cases.tasks.get_tasks_usecase import GetTaskUseCase
+
+
+@pytest.fixture
+def statements(flask_app):
+    executed = []
+
+    def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        executed.append(statement)
+
+    event.listen(db_connection.engine, "before_cursor_execute", _before_cursor_execute)
+    try:
+        yield executed
+    finally:
+        event.remove(db_connection.engine, "before_cursor_execute", _before_cursor_execute)
+
+
+def _etag(client, url, headers):
+    response = client.get(url, headers=headers)
+    assert response.status_code == 200
+    return response.headers["ETag"]
+
+
+def test_matching_if_none_match_is_304_without_loading_rows(flask_app, auth_headers, statements):
+    client = flask_app.test_client()
+    client.post("/api/task/", json={"text": "cached by the client"}, headers=auth_headers)
+
+    first = client.get("/api/task/", headers=auth_headers)
+    assert first.status_code == 200
+    assert first.headers["ETag"] == '"1.1"'
+    assert first.headers["Cache-Control"] == "private, no-cache"
+    statements.clear()
+
+    again = client.get("/api/task/", headers=dict(auth_headers, **{"If-None-Match": first.headers["ETag"]}))
+
+    assert again.status_code == 304
+    assert again.data == b""
+    assert again.headers["ETag"] == first.headers["ETag"]
+    # قراءة data_version فقط
+    assert len(statements) == 1
+    assert "user_task_counters" in statements[0]
+
+
+def test_every_write_changes_the_etag(flask_app, auth_headers):
+    client = flask_app.test_client()
+    client.post("/api/task/", json={"text": "first"}, headers=auth_headers)
+    seen = [_etag(client, "/api/task/", auth_headers)]
+
+    task_id = client.post("/api/task/", json={"text": "second"}, headers=auth_headers).get_json()["id"]
+    seen.append(_etag(client, "/api/task/", auth_headers))
+
+    client.patch(f"/api/task/complete/{task_id}", headers=auth_headers)
+    seen.append(_etag(client, "/api/task/", auth_headers))
+
+    # إعادة الإكمال لا تكتب شيئاً فلا يتغير الوسم
+    client.patch(f"/api/task/complete/{task_id}", headers=auth_headers)
+    assert _etag(client, "/api/task/", auth_headers) == seen[-1]
+
+    group_id = client.post("/api/group/", json={"name": "home"}, headers=auth_headers).get_json()["id"]
+    seen.append(_etag(client, "/api/task/", auth_headers))
+
+    client.put(f"/api/group/{group_id}", json={"name": "renamed"}, headers=auth_headers)
+    seen.append(_etag(client, "/api/task/", auth_headers))
+
+    client.delete(f"/api/group/{group_id}", headers=auth_headers)
+    seen.append(_etag(client, "/api/task/", auth_headers))
+
+    assert len(set(seen)) == len(seen)
+
+    stale = client.get("/api/task/", headers=dict(auth_headers, **{"If-None-Match": seen[0]}))
+    assert stale.status_code == 200
+
+
+def test_etag_is_per_user(flask_app, auth_headers):
+    client = flask_app.test_client()
+    with flask_app.app_context():
+        other_headers = {"Authorization": f"Bearer {create_access_token(identity='2', additional_claims={'user_id': 2})}"}
+
+    client.post("/api/task/", json={"text": "mine"}, headers=auth_headers)
+    client.post("/api/task/", json={"text": "theirs"}, headers=other_headers)
+    mine = _etag(client, "/api/task/", auth_headers)
+
+    response = client.get("/api/task/", headers=dict(other_headers, **{"If-None-Match": mine}))
+    assert response.status_code == 200
+    assert [task["text"] for task in response.get_json()["data"]] == ["theirs"]
+
+
+def test_error_responses_carry_no_etag(flask_app, auth_headers):
+    response = flask_app.test_client().get("/api/task/due?start=2025-01-02T00:00:00Z&end=2025-01-01T00:00:00Z",
+                                           headers=auth_headers)
+
+    assert response.status_code == 400
+    assert "ETag" not in response.headers
+
+
+def test_clock_dependent_endpoints_are_not_tagged(flask_app, auth_headers):
+    client = flask_app.test_client()
+
+    assert "ETag" not in client.get("/api/task/overdue", headers=auth_headers).headers
+    assert "ETag" not in client.get("/api/task/stats", headers=auth_headers).headers
+
+
+def test_state_changes_set_updated_at(db_session):
+    task_repo = TaskRepository(db_session)
+    group_repo = GroupRepository(db_session)
+    group = group_repo.create_group(GroupEntity(name="Home", user_id=1))
+    created = task_repo.create_task(TaskEntity(text="touch me", user_id=1, group_id=group.id))
+    assert created.updated_at is None
+
+    completed = task_repo.mark_task_completed(created.id, 1)
+    assert completed.updated_at is not None
+    assert completed.updated_at == completed.completed_at
+
+    # إنشاء المجموعة ثم إنشاء المهمة ثم إكمالها ثم حذف المجموعة
+    group_repo.delete_group(group.id, 1)
+    assert task_repo.get_data_version(1) == 4
+
+
+def test_repair_counters_bumps_data_version(db_session):
+    task_repo = TaskRepository(db_session)
+    task_repo.create_task(TaskEntity(text="counted", user_id=1))
+    db_session.execute(update(UserTaskCounter).values(open=7))
+    version = task_repo.get_data_version(1)
+
+    task_repo.repair_counters(task_repo.find_counter_drift())
+
+    assert task_repo.get_data_version(1) == version + 1
+    assert task_repo.get_data_version(99) == 0
+
+
+def test_cached_page_is_not_reused_under_a_newer_version():
+    task_repo = MagicMock()
+    task_repo.get_tasks.return_value = []
+    get_tasks = GetTaskUseCase(task_repository=task_repo, read_cache=ReadCacheService())
+
+    get_tasks.get_all_tasks(user_id=1, data_version=1)
+    get_tasks.get_all_tasks(user_id=1, data_version=1)
+    get_tasks.get_all_tasks(user_id=1, data_version=2)
+
+    assert task_repo.get_tasks.call_count == 2
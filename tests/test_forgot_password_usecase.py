@@ -19,6 +19,22 @@ class FakeUserRepo:
         return token
 
 
+class FakeUnitOfWork:
+    def __init__(self):
+        self.committed = 0
+        self.rolled_back = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is None:
+            self.committed += 1
+        else:
+            self.rolled_back += 1
+        return False
+
+
 class FakeTokenService:
     def generate_token(self, email, user_id, token_type, expires_delta=None):
         return "raw_token_123", "hashed_token_123", datetime.now(timezone.utc) + timedelta(hours=1)
@@ -46,7 +62,8 @@ def setup_usecase():
     user_repo = FakeUserRepo(email_entity)
     token_service = FakeTokenService()
     mail_service = FakeMailService()
-    return ForgotPasswordUseCase(user_repo, token_service, mail_service, base_url="https://testapp.com"), user_repo, mail_service
+    uow = FakeUnitOfWork()
+    return ForgotPasswordUseCase(user_repo, uow, token_service, mail_service, base_url="https://testapp.com"), user_repo, mail_service
 
 
 def test_forgot_password_success(setup_usecase):
@@ -65,7 +82,7 @@ def test_forgot_password_no_email_found():
     user_repo = FakeUserRepo(email_entity=None)
     token_service = FakeTokenService()
     mail_service = FakeMailService()
-    usecase = ForgotPasswordUseCase(user_repo, token_service, mail_service, base_url="https://testapp.com")
+    usecase = ForgotPasswordUseCase(user_repo, FakeUnitOfWork(), token_service, mail_service, base_url="https://testapp.com")
 
     with pytest.raises(ValueError, match=ERROR_MESSAGES["EMAIL_NOT_VERIFIED"]):
         usecase.execute("notfound@example.com")
@@ -1,7 +1,9 @@
 import pytest
+from datetime import datetime
 from types import SimpleNamespace
 from app.use_cases.groups.get_group_usecase import GetGroupUseCase
 from app.constants.error_messages import ERROR_MESSAGES
+from app.domain.value_objects.cursor import Cursor
 
 @pytest.fixture
 def mock_group_repo(mocker):
@@ -10,7 +12,7 @@ def mock_group_repo(mocker):
 
 @pytest.fixture
 def usecase(mock_group_repo):
-    return GetGroupUseCase(group_repo=mock_group_repo)
+    return GetGroupUseCase(group_repository=mock_group_repo)
 
 
 # ✅ 1) اختبار جلب جميع المجموعات
@@ -22,10 +24,38 @@ def test_get_all_groups_success(usecase, mock_group_repo):
     ]
     mock_group_repo.get_groups.return_value = expected_groups
 
-    result = usecase.get_all_groups(user_id)
+    result = usecase.get_all_groups(user_id, limit=5)
 
-    assert result == expected_groups
-    mock_group_repo.get_groups.assert_called_once_with(user_id=user_id)
+    assert result.items == expected_groups
+    assert result.next_cursor is None
+    mock_group_repo.get_groups.assert_called_once_with(user_id=user_id, limit=6, after=None, include_tasks=True)
+
+
+def test_get_all_groups_returns_next_cursor_when_more_rows(usecase, mock_group_repo):
+    created_at = datetime(2025, 1, 1, 12, 0)
+    mock_group_repo.get_groups.return_value = [
+        SimpleNamespace(id=3, name="Group C", created_at=created_at),
+        SimpleNamespace(id=2, name="Group B", created_at=created_at),
+        SimpleNamespace(id=1, name="Group A", created_at=created_at),
+    ]
+
+    result = usecase.get_all_groups(1, limit=2)
+
+    assert [group.id for group in result.items] == [3, 2]
+    assert Cursor.decode(result.next_cursor) == Cursor(created_at, 2)
+
+    usecase.get_all_groups(1, limit=2, cursor=result.next_cursor)
+    mock_group_repo.get_groups.assert_called_with(user_id=1, limit=3, after=Cursor(created_at, 2), include_tasks=True)
+
+
+def test_get_all_groups_invalid_cursor(usecase):
+    with pytest.raises(ValueError, match=ERROR_MESSAGES["INVALID_CURSOR"]):
+        usecase.get_all_groups(1, cursor="not-a-cursor")
+
+
+def test_get_all_groups_limit_out_of_range(usecase):
+    with pytest.raises(ValueError):
+        usecase.get_all_groups(1, limit=0)
 
 
 def test_get_all_groups_missing_user_id(usecase):
@@ -42,7 +72,13 @@ def test_get_completed_groups_success(usecase, mock_group_repo):
     result = usecase.get_completed_groups(user_id)
 
     assert result == expected_groups
-    mock_group_repo.get_groups_complete.assert_called_once_with(user_id=user_id)
+    mock_group_repo.get_groups_complete.assert_called_once_with(user_id=user_id, include_tasks=True)
+
+
+def test_get_completed_groups_without_tasks(usecase, mock_group_repo):
+    usecase.get_completed_groups(1, include_tasks=False)
+
+    mock_group_repo.get_groups_complete.assert_called_once_with(user_id=1, include_tasks=False)
 
 
 def test_get_completed_groups_missing_user_id(usecase):
@@ -59,7 +95,7 @@ def test_get_uncompleted_groups_success(usecase, mock_group_repo):
     result = usecase.get_uncompleted_groups(user_id)
 
     assert result == expected_groups
-    mock_group_repo.get_groups_uncomplete.assert_called_once_with(user_id=user_id)
+    mock_group_repo.get_groups_uncomplete.assert_called_once_with(user_id=user_id, include_tasks=True)
 
 
 def test_get_uncompleted_groups_missing_user_id(usecase):
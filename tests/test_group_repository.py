@@ -1,6 +1,16 @@
 # tests/test_group_repository.py
 from app.repositories.group_repository import GroupRepository
+from app.repositories.task_repository import TaskRepository
 from app.domain.entities.group_entity import GroupEntity
+from app.domain.entities.task_entity import TaskEntity
+
+
+def _add_tasks(db_session, *tasks):
+    # الإنشاء عبر المستودع ليُحدّث عدادات المجموعات والمستخدمين
+    task_repo = TaskRepository(db_session)
+    for task in tasks:
+        task_repo.create_task(task)
+    db_session.commit()
 
 def test_create_and_get_group(db_session):
     repo = GroupRepository(db_session)
@@ -42,5 +52,139 @@ def test_delete_group(db_session):
     )
     created_group = repo.create_group(group)
 
-    result = repo.delete_group(created_group.id)
-    assert result is True
+    result = repo.delete_group(created_group.id, 1)
+    assert result == 0
+    assert repo.delete_group(created_group.id, 1) is None
+
+
+def test_delete_group_cascades_tasks_in_one_update(db_session, query_counter):
+    from app.infrastructure.database.models import Task
+
+    repo = GroupRepository(db_session)
+    created_group = _create_group_with_tasks(repo, db_session, "Cascade", task_count=25)
+    _add_tasks(db_session, TaskEntity(text="Ungrouped", user_id=1))
+
+    # مستخدم آخر لا يستطيع حذف المجموعة
+    assert repo.delete_group(created_group.id, 2) is None
+
+    query_counter.clear()
+    assert repo.delete_group(created_group.id, 1) == 25
+    # حذف المجموعة مع تصفير عداداتها، حذف مهامها، ثم تحديث عداد المستخدم
+    assert len(query_counter) == 3
+
+    live_tasks = db_session.query(Task).filter(Task.is_deleted == False).all()
+    assert [task.text for task in live_tasks] == ["Ungrouped"]
+
+
+def _create_group_with_tasks(repo, db_session, name, task_count):
+    created_group = repo.create_group(GroupEntity(name=name, user_id=1))
+    _add_tasks(
+        db_session,
+        *[TaskEntity(text=f"{name} task {i}", user_id=1, group_id=created_group.id) for i in range(task_count)],
+        TaskEntity(text=f"{name} deleted", user_id=1, group_id=created_group.id, is_deleted=True)
+    )
+    return created_group
+
+
+def test_get_groups_loads_tasks_without_n_plus_one(db_session, query_counter):
+    repo = GroupRepository(db_session)
+
+    for i in range(3):
+        _create_group_with_tasks(repo, db_session, f"Group {i}", task_count=2)
+
+    query_counter.clear()
+    groups = repo.get_groups(user_id=1)
+    small_page_queries = len(query_counter)
+
+    assert len(groups) == 3
+    assert all(len(group.tasks) == 2 for group in groups)
+
+    for i in range(3, 20):
+        _create_group_with_tasks(repo, db_session, f"Group {i}", task_count=2)
+
+    query_counter.clear()
+    groups = repo.get_groups(user_id=1)
+
+    assert len(groups) == 20
+    assert len(query_counter) == small_page_queries == 2
+
+
+def test_get_groups_complete_and_uncomplete_fixed_query_count(db_session, query_counter):
+    repo = GroupRepository(db_session)
+
+    for i in range(10):
+        _create_group_with_tasks(repo, db_session, f"Group {i}", task_count=1)
+
+    query_counter.clear()
+    uncompleted = repo.get_groups_uncomplete(user_id=1)
+    assert len(uncompleted) == 10
+    assert len(query_counter) == 2
+
+    query_counter.clear()
+    assert repo.get_groups_complete(user_id=1) is None
+    assert len(query_counter) == 1
+
+
+def test_get_groups_keyset_pagination(db_session):
+    from datetime import datetime, timedelta
+    from app.domain.value_objects.cursor import Cursor
+
+    repo = GroupRepository(db_session)
+    base = datetime(2025, 1, 1)
+    for i in range(4):
+        repo.create_group(GroupEntity(name=f"Group {i}", user_id=1, created_at=base + timedelta(hours=i)))
+
+    first_page = repo.get_groups(user_id=1, limit=2)
+    assert [group.name for group in first_page] == ["Group 3", "Group 2"]
+
+    after = Cursor(first_page[-1].created_at, first_page[-1].id)
+    second_page = repo.get_groups(user_id=1, limit=2, after=after)
+    assert [group.name for group in second_page] == ["Group 1", "Group 0"]
+
+
+
+def test_group_listings_classify_by_aggregated_counts(db_session, query_counter):
+    repo = GroupRepository(db_session)
+    open_group = repo.create_group(GroupEntity(name="Open", user_id=1))
+    done_group = repo.create_group(GroupEntity(name="Done", user_id=1))
+    repo.create_group(GroupEntity(name="Empty", user_id=1))
+
+    _add_tasks(
+        db_session,
+        TaskEntity(text="Open 1", user_id=1, group_id=open_group.id),
+        TaskEntity(text="Open 2", user_id=1, group_id=open_group.id),
+        TaskEntity(text="Open finished", user_id=1, group_id=open_group.id, is_completed=True),
+        TaskEntity(text="Done 1", user_id=1, group_id=done_group.id, is_completed=True),
+        TaskEntity(text="Done 2", user_id=1, group_id=done_group.id, is_completed=True),
+        TaskEntity(text="Done deleted", user_id=1, group_id=done_group.id, is_deleted=True),
+    )
+
+    query_counter.clear()
+    uncompleted = repo.get_groups_uncomplete(user_id=1, include_tasks=False)
+    assert len(query_counter) == 1
+    assert [group.name for group in uncompleted] == ["Open"]
+    assert (uncompleted[0].task_count, uncompleted[0].open_count, uncompleted[0].completed_count) == (3, 2, 1)
+    assert uncompleted[0].tasks == []
+
+    completed = repo.get_groups_complete(user_id=1)
+    counts = {group.name: (group.task_count, group.open_count, group.completed_count) for group in completed}
+    assert counts == {"Done": (2, 0, 2), "Empty": (0, 0, 0)}
+    assert {group.name: len(group.tasks) for group in completed} == {"Done": 2, "Empty": 0}
+
+    summary = repo.get_groups(user_id=1, include_tasks=False)
+    assert [group.to_dict()["open_count"] for group in summary] == [0, 0, 2]
+    assert all(group.tasks == [] for group in summary)
+
+
+def test_update_group_is_scoped_to_owner(db_session, query_counter):
+    repo = GroupRepository(db_session)
+    created = repo.create_group(GroupEntity(name="Mine", description=None, user_id=1))
+    query_counter.clear()
+
+    assert repo.update_group(GroupEntity(id=created.id, name="Stolen", description=None, user_id=2)) is None
+
+    updated = repo.update_group(GroupEntity(id=created.id, name="Renamed", description="d", user_id=1))
+    assert updated.name == "Renamed"
+    assert updated.created_at is not None
+    # UPDATE ... RETURNING واحد لكل محاولة، ورفع data_version للتحديث الناجح فقط
+    assert len(query_counter) == 3
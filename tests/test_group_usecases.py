@@ -14,18 +14,23 @@ def mock_group_repo(mocker):
 
 
 @pytest.fixture
-def create_group_usecase(mock_group_repo):
-    return CreateGroupUseCase(group_repo=mock_group_repo)
+def mock_uow(mocker):
+    return mocker.MagicMock()
 
 
 @pytest.fixture
-def update_group_usecase(mock_group_repo):
-    return UpdateGroupUseCase(group_repo=mock_group_repo)
+def create_group_usecase(mock_group_repo, mock_uow):
+    return CreateGroupUseCase(group_repository=mock_group_repo, uow=mock_uow)
 
 
 @pytest.fixture
-def delete_group_usecase(mock_group_repo):
-    return DeleteGroupUseCase(group_repo=mock_group_repo)
+def update_group_usecase(mock_group_repo, mock_uow):
+    return UpdateGroupUseCase(group_repository=mock_group_repo, uow=mock_uow)
+
+
+@pytest.fixture
+def delete_group_usecase(mock_group_repo, mock_uow):
+    return DeleteGroupUseCase(group_repository=mock_group_repo, uow=mock_uow)
 
 
 # ---------------- Tests: Create Group ----------------
@@ -85,18 +90,18 @@ def test_update_group_not_found(update_group_usecase, mock_group_repo):
 
 # ---------------- Tests: Delete Group ----------------
 def test_delete_group_success(delete_group_usecase, mock_group_repo):
-    mock_group_repo.delete_group.return_value = True
+    mock_group_repo.delete_group.return_value = 3
 
-    result = delete_group_usecase.execute(1)
+    result = delete_group_usecase.execute(1, 1)
 
-    assert result is True
-    mock_group_repo.delete_group.assert_called_once_with(1)
+    assert result == 3
+    mock_group_repo.delete_group.assert_called_once_with(1, 1)
 
 
 def test_delete_group_not_found(delete_group_usecase, mock_group_repo):
-    mock_group_repo.delete_group.return_value = False
+    mock_group_repo.delete_group.return_value = None
 
-    result = delete_group_usecase.execute(99)
+    result = delete_group_usecase.execute(99, 1)
 
-    assert result is False
-    mock_group_repo.delete_group.assert_called_once_with(99)
+    assert result is None
+    mock_group_repo.delete_group.assert_called_once_with(99, 1)
@@ -0,0 +1,72 @@
+# tests/test_purge_tokens.py
+from datetime import datetime, timedelta, timezone
+from unittest.mock import MagicMock
+
+import pytest
+from sqlalchemy import func, select
+
+from app.constants.error_messages import ERROR_MESSAGES
+from app.infrastructure.database import db_connection
+from app.infrastructure.database.models import PasswordResetToken, VerifiedEmailToken
+from app.infrastructure.database.unit_of_work import UnitOfWork
+from app.repositories.user_repository import UserRepository
+from app.use_cases.users.purge_expired_tokens_usecase import PurgeExpiredTokensUseCase
+
+
+def _seed_tokens(session, expired=0, used=0, live=0):
+    now = datetime.now(timezone.utc)
+    rows = []
+    for model in (VerifiedEmailToken, PasswordResetToken):
+        extra = {"email_id": 1} if model is VerifiedEmailToken else {}
+        rows += [model(token_hash="e", user_id=1, expires_at=now - timedelta(hours=1), **extra) for _ in range(expired)]
+        rows += [model(token_hash="u", user_id=1, is_used=True, expires_at=now + timedelta(hours=1), **extra) for _ in range(used)]
+        rows += [model(token_hash="l", user_id=1, expires_at=now + timedelta(hours=1), **extra) for _ in range(live)]
+    session.add_all(rows)
+    session.commit()
+
+
+def _remaining(session, model):
+    return session.execute(select(func.count()).select_from(model)).scalar_one()
+
+
+def test_purge_deletes_expired_and_used_in_batches(db_session):
+    _seed_tokens(db_session, expired=4, used=1, live=2)
+    usecase = PurgeExpiredTokensUseCase(UserRepository(db_session), UnitOfWork(db_session), batch_size=2)
+
+    report = usecase.execute()
+
+    assert report.deleted == {"verified_email_tokens": 5, "password_reset_tokens": 5}
+    # 5 صفوف بدفعات من 2: ثلاث دفعات لكل جدول
+    assert report.batches == 6
+    assert report.elapsed_seconds >= 0
+    assert _remaining(db_session, VerifiedEmailToken) == 2
+    assert _remaining(db_session, PasswordResetToken) == 2
+
+
+def test_purge_commits_each_batch(db_session):
+    _seed_tokens(db_session, expired=3)
+    uow = MagicMock()
+    usecase = PurgeExpiredTokensUseCase(UserRepository(db_session), uow, batch_size=2)
+
+    usecase.execute()
+
+    assert uow.__enter__.call_count == 4
+
+
+def test_purge_rejects_invalid_batch_size(db_session):
+    usecase = PurgeExpiredTokensUseCase(UserRepository(db_session), MagicMock())
+
+    with pytest.raises(ValueError, match=ERROR_MESSAGES["INVALID_BATCH_SIZE"]):
+        usecase.execute(batch_size=-1)
+
+
+def test_purge_tokens_cli_reports_counts(flask_app):
+    with db_connection.SessionLocal() as session:
+        _seed_tokens(session, expired=2, live=1)
+
+    result = flask_app.test_cli_runner().invoke(args=["purge-tokens", "--batch-size", "1"])
+
+    assert result.exit_code == 0
+    assert "verified_email_tokens: 2 rows deleted" in result.output
+    assert "password_reset_tokens: 2 rows deleted" in result.output
+    assert "Total: 4 rows" in result.output
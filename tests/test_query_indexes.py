@@ -0,0 +1,137 @@
+# tests/test_query_indexes.py
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from sqlalchemy import event
+
+from app.domain.entities.group_entity import GroupEntity
+from app.domain.entities.task_entity import TaskEntity
+from app.domain.value_objects.cursor import Cursor
+from app.infrastructure.database.models import (Email, PasswordResetToken, User,
+                                                VerifiedEmailToken)
+from app.repositories.group_repository import GroupRepository
+from app.repositories.task_repository import TaskRepository
+from app.repositories.user_repository import UserRepository
+
+
+def _query_plans(db_session, call):
+    # تنفيذ دالة المستودع مع التقاط استعلامات SELECT ثم تشغيل EXPLAIN QUERY PLAN عليها
+    captured = []
+
+    def _capture(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith("SELECT"):
+            captured.append((statement, parameters))
+
+    engine = db_session.get_bind()
+    event.listen(engine, "before_cursor_execute", _capture)
+    try:
+        call()
+    finally:
+        event.remove(engine, "before_cursor_execute", _capture)
+
+    connection = db_session.connection()
+    return [
+        " | ".join(row[-1] for row in connection.exec_driver_sql(f"EXPLAIN QUERY PLAN {statement}", parameters))
+        for statement, parameters in captured
+    ]
+
+
+@pytest.fixture
+def seeded_session(db_session):
+    user = User(username="indexed", password="secret")
+    db_session.add(user)
+    db_session.flush()
+    email = Email(email_address="indexed@example.com", is_primary=True, user_id=user.id)
+    db_session.add(email)
+    db_session.flush()
+    expires = datetime.now(timezone.utc) + timedelta(hours=1)
+    db_session.add(VerifiedEmailToken(token_hash="v-hash", expires_at=expires, email_id=email.id, user_id=user.id))
+    db_session.add(PasswordResetToken(token_hash="p-hash", expires_at=expires, user_id=user.id))
+    db_session.commit()
+    return db_session
+
+
+def test_get_tasks_uses_user_created_index(seeded_session):
+    repo = TaskRepository(seeded_session)
+    repo.create_task(TaskEntity(text="Indexed", user_id=1))
+
+    plans = _query_plans(seeded_session, lambda: repo.get_tasks(
+        user_id=1, limit=10, after=Cursor(datetime(2100, 1, 1), 1)
+    ))
+
+    assert len(plans) == 1
+    assert "ix_tasks_user_created" in plans[0]
+
+
+def test_due_and_overdue_use_open_due_index(seeded_session):
+    repo = TaskRepository(seeded_session)
+    now = datetime.now(timezone.utc)
+    repo.create_task(TaskEntity(text="Due", user_id=1, due_at=now))
+
+    plans = _query_plans(seeded_session, lambda: repo.get_tasks_due(
+        user_id=1, start=now - timedelta(days=1), end=now + timedelta(days=1), limit=10,
+        after=Cursor(datetime(2000, 1, 1), 1)
+    ))
+    assert "ix_tasks_user_open_due" in plans[0]
+    assert "TEMP B-TREE" not in plans[0]
+
+    plans = _query_plans(seeded_session, lambda: repo.get_overdue_tasks(user_id=1, now=now, limit=10))
+    assert "ix_tasks_user_open_due" in plans[0]
+    assert "TEMP B-TREE" not in plans[0]
+
+
+def test_task_stats_use_counters_and_partial_indexes(seeded_session):
+    repo = TaskRepository(seeded_session)
+    now = datetime.now(timezone.utc)
+
+    plans = _query_plans(seeded_session, lambda: repo.get_task_stats(user_id=1, now=now, day_start=now))
+    assert len(plans) == 1
+    # الإجماليات بمفتاح user_task_counters، والعدّان الزمنيان من الفهرسين الجزئيين
+    assert "SEARCH user_task_counters USING INTEGER PRIMARY KEY" in plans[0]
+    assert "ix_tasks_user_open_due" in plans[0]
+    assert "ix_tasks_user_completed_at" in plans[0]
+    assert "SCAN tasks" not in plans[0]
+
+
+def test_group_listings_use_group_indexes(seeded_session):
+    repo = GroupRepository(seeded_session)
+    repo.create_group(GroupEntity(name="Indexed group", user_id=1))
+
+    plans = _query_plans(seeded_session, lambda: repo.get_groups(user_id=1, limit=10))
+    assert "ix_groups_user_created" in plans[0]
+    # تحميل مهام المجموعات يستخدم الفهرس الجزئي على المهام الحية
+    assert "ix_tasks_group_live" in plans[1]
+
+    # التصنيف من عمود open_count دون ربط بالمهام
+    plans = _query_plans(seeded_session, lambda: repo.get_groups_uncomplete(user_id=1))
+    assert "ix_groups_user_live_created" in plans[0]
+    assert "tasks" not in plans[0]
+
+
+def test_search_starts_from_the_users_tasks(seeded_session):
+    repo = TaskRepository(seeded_session)
+    repo.create_task(TaskEntity(text="milk", user_id=1))
+
+    plans = _query_plans(seeded_session, lambda: repo.search_tasks(user_id=1, query="milk"))
+
+    # مهام المستخدم عبر فهرسه أولاً، ثم FTS5 مقيّداً بـ rowid لكل صف
+    assert plans[0].startswith("SEARCH tasks USING INDEX ix_tasks_user_")
+    assert "SCAN tasks_fts VIRTUAL TABLE INDEX 0:=M" in plans[0]
+
+
+def test_token_lookups_use_token_indexes(seeded_session):
+    repo = UserRepository(seeded_session)
+
+    plans = _query_plans(seeded_session, lambda: repo.get_password_reset_token("p-hash"))
+    assert "ix_password_reset_tokens_token_hash" in plans[0]
+
+    plans = _query_plans(seeded_session, lambda: repo.get_verified_email_token("indexed@example.com"))
+    assert "ix_verified_email_tokens_email_open" in plans[-1]
+
+
+def test_get_user_emails_use_user_index(seeded_session):
+    repo = UserRepository(seeded_session)
+
+    plans = _query_plans(seeded_session, lambda: repo.get_user("indexed"))
+
+    assert any("ix_emails_user_id" in plan for plan in plans)
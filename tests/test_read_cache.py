@@ -0,0 +1,163 @@
+# tests/test_read_cache.py
+from unittest.mock import MagicMock
+
+import pytest
+from dependency_injector import providers
+
+from app.domain.entities.task_entity import TaskEntity
+from app.services.read_cache_service import ReadCacheService
+from app.use_cases.groups.delete_group_usecase import DeleteGroupUseCase
+from app.use_cases.groups.get_group_usecase import GetGroupUseCase
+from app.use_cases.tasks.get_tasks_usecase import GetTaskUseCase
+from app.use_cases.tasks.mark_task_completed_usecase import MarkTaskCompletedUseCase
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_cache_hits_until_ttl_expires():
+    clock = FakeClock()
+    cache = ReadCacheService(ttl_seconds=10, clock=clock)
+    load = MagicMock(side_effect=["first", "second"])
+
+    assert cache.get_or_load(1, "tasks", load) == "first"
+    clock.now = 9
+    assert cache.get_or_load(1, "tasks", load) == "first"
+    clock.now = 10
+    assert cache.get_or_load(1, "tasks", load) == "second"
+
+    assert load.call_count == 2
+    assert cache.stats() == {
+        "entries": 1, "hits": 1, "misses": 2, "evictions": 0, "expirations": 1, "invalidations": 0
+    }
+
+
+def test_cache_evicts_least_recently_used_entry():
+    cache = ReadCacheService(max_entries=2)
+    cache.get_or_load(1, "a", lambda: "a")
+    cache.get_or_load(2, "b", lambda: "b")
+    cache.get_or_load(1, "a", lambda: "reloaded")
+    cache.get_or_load(3, "c", lambda: "c")
+
+    # المستخدم 2 هو الأقدم استخداماً
+    assert cache.get_or_load(1, "a", lambda: "reloaded") == "a"
+    assert cache.get_or_load(2, "b", lambda: "b again") == "b again"
+    assert cache.stats()["evictions"] == 2
+
+
+def test_invalidate_drops_only_that_users_entries():
+    cache = ReadCacheService()
+    cache.get_or_load(1, "tasks", lambda: "user 1 tasks")
+    cache.get_or_load(1, "groups", lambda: "user 1 groups")
+    cache.get_or_load(2, "tasks", lambda: "user 2 tasks")
+
+    cache.invalidate(1)
+
+    assert cache.get_or_load(1, "tasks", lambda: "fresh") == "fresh"
+    assert cache.get_or_load(1, "groups", lambda: "fresh groups") == "fresh groups"
+    assert cache.get_or_load(2, "tasks", lambda: "unused") == "user 2 tasks"
+
+    cache.invalidate(None)
+    assert cache.stats()["entries"] == 0
+
+
+def test_load_overlapping_a_write_is_not_stored():
+    cache = ReadCacheService()
+
+    def load_then_write():
+        # كتابة تنتهي بينما القراءة ما زالت جارية
+        cache.invalidate(1)
+        return "stale"
+
+    assert cache.get_or_load(1, "tasks", load_then_write) == "stale"
+    assert cache.get_or_load(1, "tasks", lambda: "fresh") == "fresh"
+
+
+def test_disabled_cache_always_loads():
+    cache = ReadCacheService(enabled=False)
+    load = MagicMock(return_value="rows")
+
+    cache.get_or_load(1, "tasks", load)
+    cache.get_or_load(1, "tasks", load)
+
+    assert load.call_count == 2
+    assert cache.stats()["misses"] == 0
+
+
+def test_get_tasks_served_from_cache_until_a_task_write():
+    cache = ReadCacheService()
+    task_repo = MagicMock()
+    task_repo.get_tasks.return_value = [TaskEntity(id=1, text="cached", user_id=1)]
+    get_tasks = GetTaskUseCase(task_repository=task_repo, read_cache=cache)
+    mark_completed = MarkTaskCompletedUseCase(task_repository=task_repo, uow=MagicMock(), read_cache=cache)
+
+    first = get_tasks.get_all_tasks(user_id=1, limit=10)
+    assert get_tasks.get_all_tasks(user_id=1, limit=10) is first
+    assert task_repo.get_tasks.call_count == 1
+
+    # صفحة أخرى مفتاح مختلف
+    get_tasks.get_all_tasks(user_id=1, limit=5)
+    assert task_repo.get_tasks.call_count == 2
+
+    mark_completed.execute(task_id=1, user_id=1)
+    get_tasks.get_all_tasks(user_id=1, limit=10)
+    assert task_repo.get_tasks.call_count == 3
+
+
+def test_group_write_invalidates_group_lists():
+    cache = ReadCacheService()
+    group_repo = MagicMock()
+    group_repo.get_groups.return_value = []
+    get_groups = GetGroupUseCase(group_repository=group_repo, read_cache=cache)
+    delete_group = DeleteGroupUseCase(group_repository=group_repo, uow=MagicMock(), read_cache=cache)
+
+    get_groups.get_all_groups(user_id=1)
+    get_groups.get_all_groups(user_id=1)
+    get_groups.get_all_groups(user_id=1, include_tasks=False)
+    assert group_repo.get_groups.call_count == 2
+
+    delete_group.execute(group_id=3, user_id=1)
+    get_groups.get_all_groups(user_id=1)
+    assert group_repo.get_groups.call_count == 3
+
+
+def test_failed_write_keeps_cache():
+    cache = ReadCacheService()
+    cache.get_or_load(1, "tasks", lambda: "cached")
+    task_repo = MagicMock()
+    task_repo.mark_task_completed.side_effect = ValueError("boom")
+    mark_completed = MarkTaskCompletedUseCase(task_repository=task_repo, uow=MagicMock(), read_cache=cache)
+
+    with pytest.raises(ValueError):
+        mark_completed.execute(task_id=1, user_id=1)
+
+    assert cache.stats()["invalidations"] == 0
+
+
+def test_list_endpoints_use_cache_and_see_writes(flask_app, auth_headers):
+    cache = ReadCacheService()
+    flask_app.container.read_cache.override(providers.Object(cache))
+    client = flask_app.test_client()
+
+    client.post("/api/task/", json={"text": "first"}, headers=auth_headers)
+    assert [task["text"] for task in client.get("/api/task/", headers=auth_headers).get_json()["data"]] == ["first"]
+    client.get("/api/task/", headers=auth_headers)
+    assert cache.stats()["hits"] == 1
+
+    task_id = client.post("/api/task/", json={"text": "second"}, headers=auth_headers).get_json()["id"]
+    assert len(client.get("/api/task/", headers=auth_headers).get_json()["data"]) == 2
+
+    client.patch(f"/api/task/complete/{task_id}", headers=auth_headers)
+    tasks = client.get("/api/task/", headers=auth_headers).get_json()["data"]
+    assert [task["is_completed"] for task in tasks] == [True, False]
+
+    group_id = client.post("/api/group/", json={"name": "home"}, headers=auth_headers).get_json()["id"]
+    client.get("/api/group/", headers=auth_headers)
+    client.put(f"/api/group/{group_id}", json={"name": "renamed"}, headers=auth_headers)
+    groups = client.get("/api/group/", headers=auth_headers).get_json()["data"]
+    assert [group["name"] for group in groups] == ["renamed"]
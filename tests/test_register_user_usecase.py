@@ -37,7 +37,7 @@ def test_register_user_success(setup_dependencies):
     token_service.generate_token.return_value = ("raw_token_abc", "token_hash_abc", datetime.now(timezone.utc) + timedelta(hours=24))
 
     # Initialize use case
-    usecase = RegisterUserUseCase(user_repo, hashing_service, token_service, mail_service, base_url)
+    usecase = RegisterUserUseCase(user_repo, MagicMock(), hashing_service, token_service, mail_service, base_url)
 
     # Execute
     created_user = usecase.execute("john_doe", "john@example.com", "StrongPass123")
@@ -59,7 +59,7 @@ def test_register_user_success(setup_dependencies):
 
 def test_register_user_missing_fields(setup_dependencies):
     user_repo, hashing_service, token_service, mail_service, base_url = setup_dependencies
-    usecase = RegisterUserUseCase(user_repo, hashing_service, token_service, mail_service, base_url)
+    usecase = RegisterUserUseCase(user_repo, MagicMock(), hashing_service, token_service, mail_service, base_url)
 
     with pytest.raises(ValueError) as exc:
         usecase.execute("", "user@example.com", "pass1234")
@@ -88,7 +88,7 @@ def test_register_user_sends_verification_email(setup_dependencies):
     user_repo.create_user.return_value = mock_user
     token_service.generate_token.return_value = ("token_raw", "token_hash", datetime.now(timezone.utc) + timedelta(hours=24))
 
-    usecase = RegisterUserUseCase(user_repo, hashing_service, token_service, mail_service, base_url)
+    usecase = RegisterUserUseCase(user_repo, MagicMock(), hashing_service, token_service, mail_service, base_url)
 
     usecase.execute("alice", "alice@example.com", "SecretPass123")
 
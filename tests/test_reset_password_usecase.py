@@ -30,7 +30,7 @@ def test_reset_password_success(setup_dependencies):
     user_repo.update_password.return_value = {"id": 10}
     user_repo.confirm_password_reset_token.return_value = True
 
-    usecase = ResetPasswordUseCase(user_repo, token_service, hashing_service)
+    usecase = ResetPasswordUseCase(user_repo, MagicMock(), token_service, hashing_service)
     result = usecase.execute("valid_raw_token", "NewPassword123")
 
     assert result is True
@@ -42,7 +42,7 @@ def test_reset_password_success(setup_dependencies):
 
 def test_missing_token_raises_error(setup_dependencies):
     user_repo, token_service, hashing_service = setup_dependencies
-    usecase = ResetPasswordUseCase(user_repo, token_service, hashing_service)
+    usecase = ResetPasswordUseCase(user_repo, MagicMock(), token_service, hashing_service)
 
     with pytest.raises(ValueError) as exc:
         usecase.execute("", "NewPassword123")
@@ -51,7 +51,7 @@ def test_missing_token_raises_error(setup_dependencies):
 
 def test_invalid_new_password_raises_error(setup_dependencies):
     user_repo, token_service, hashing_service = setup_dependencies
-    usecase = ResetPasswordUseCase(user_repo, token_service, hashing_service)
+    usecase = ResetPasswordUseCase(user_repo, MagicMock(), token_service, hashing_service)
 
     with pytest.raises(ValueError) as exc:
         usecase.execute("valid_token", "short")
@@ -62,7 +62,7 @@ def test_invalid_or_expired_token_raises_error(setup_dependencies):
     user_repo, token_service, hashing_service = setup_dependencies
     token_service.verify_token.return_value = None
 
-    usecase = ResetPasswordUseCase(user_repo, token_service, hashing_service)
+    usecase = ResetPasswordUseCase(user_repo, MagicMock(), token_service, hashing_service)
 
     with pytest.raises(ValueError) as exc:
         usecase.execute("expired_token", "ValidPass123")
@@ -73,7 +73,7 @@ def test_invalid_token_type_raises_error(setup_dependencies):
     user_repo, token_service, hashing_service = setup_dependencies
     token_service.verify_token.return_value = {"type": "wrong_type"}
 
-    usecase = ResetPasswordUseCase(user_repo, token_service, hashing_service)
+    usecase = ResetPasswordUseCase(user_repo, MagicMock(), token_service, hashing_service)
 
     with pytest.raises(ValueError) as exc:
         usecase.execute("valid_token", "ValidPass123")
@@ -86,7 +86,7 @@ def test_token_not_found_raises_error(setup_dependencies):
     token_service._hash_token.return_value = "hashed_token_123"
     user_repo.get_password_reset_token.return_value = None
 
-    usecase = ResetPasswordUseCase(user_repo, token_service, hashing_service)
+    usecase = ResetPasswordUseCase(user_repo, MagicMock(), token_service, hashing_service)
 
     with pytest.raises(ValueError) as exc:
         usecase.execute("valid_token", "ValidPass123")
@@ -99,7 +99,7 @@ def test_token_already_used_raises_error(setup_dependencies):
     token_service._hash_token.return_value = "hashed_token_123"
     user_repo.get_password_reset_token.return_value = MockToken(is_used=True)
 
-    usecase = ResetPasswordUseCase(user_repo, token_service, hashing_service)
+    usecase = ResetPasswordUseCase(user_repo, MagicMock(), token_service, hashing_service)
 
     with pytest.raises(ValueError) as exc:
         usecase.execute("valid_token", "ValidPass123")
@@ -114,7 +114,7 @@ def test_user_not_found_raises_error(setup_dependencies):
     hashing_service.hash_password.return_value = "hashed_new_password"
     user_repo.update_password.return_value = None
 
-    usecase = ResetPasswordUseCase(user_repo, token_service, hashing_service)
+    usecase = ResetPasswordUseCase(user_repo, MagicMock(), token_service, hashing_service)
 
     with pytest.raises(ValueError) as exc:
         usecase.execute("valid_token", "ValidPass123")
@@ -130,7 +130,7 @@ def test_token_confirmation_failed_raises_error(setup_dependencies):
     user_repo.update_password.return_value = {"id": 10}
     user_repo.confirm_password_reset_token.return_value = None
 
-    usecase = ResetPasswordUseCase(user_repo, token_service, hashing_service)
+    usecase = ResetPasswordUseCase(user_repo, MagicMock(), token_service, hashing_service)
 
     with pytest.raises(ValueError) as exc:
         usecase.execute("valid_token", "ValidPass123")
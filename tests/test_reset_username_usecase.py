@@ -16,7 +16,7 @@ def test_reset_username_success(setup_dependencies):
 
     user_repo.update_username.return_value = mock_user
 
-    usecase = ResetUsernameUseCase(user_repo)
+    usecase = ResetUsernameUseCase(user_repo, MagicMock())
     result = usecase.execute("old_user", "new_user123")
 
     user_repo.update_username.assert_called_once_with(
@@ -28,7 +28,7 @@ def test_reset_username_success(setup_dependencies):
 
 def test_missing_old_username_raises_error(setup_dependencies):
     user_repo = setup_dependencies
-    usecase = ResetUsernameUseCase(user_repo)
+    usecase = ResetUsernameUseCase(user_repo, MagicMock())
 
     with pytest.raises(ValueError) as exc:
         usecase.execute("", "new_user123")
@@ -37,7 +37,7 @@ def test_missing_old_username_raises_error(setup_dependencies):
 
 def test_invalid_new_username_raises_error(setup_dependencies):
     user_repo = setup_dependencies
-    usecase = ResetUsernameUseCase(user_repo)
+    usecase = ResetUsernameUseCase(user_repo, MagicMock())
 
     with pytest.raises(ValueError) as exc:
         usecase.execute("old_user", "ab")
@@ -48,7 +48,7 @@ def test_username_update_failed_raises_error(setup_dependencies):
     user_repo = setup_dependencies
     user_repo.update_username.return_value = None
 
-    usecase = ResetUsernameUseCase(user_repo)
+    usecase = ResetUsernameUseCase(user_repo, MagicMock())
 
     with pytest.raises(ValueError) as exc:
         usecase.execute("old_user", "new_user123")
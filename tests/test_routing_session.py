@@ -0,0 +1,65 @@
+# tests/test_routing_session.py
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.domain.entities.task_entity import TaskEntity
+from app.infrastructure.database.models import Base, Task
+from app.infrastructure.database.routing_session import RoutingSession
+from app.repositories.task_repository import TaskRepository
+
+
+def _seed(engine, text):
+    Base.metadata.create_all(bind=engine)
+    with sessionmaker(bind=engine)() as session:
+        session.add(Task(text=text, user_id=1))
+        session.commit()
+
+
+@pytest.fixture
+def routing_session(tmp_path):
+    # ملفا SQLite منفصلان يمثلان القاعدة الرئيسية والنسخة المتماثلة
+    primary = create_engine(f"sqlite:///{tmp_path / 'primary.db'}")
+    replica = create_engine(f"sqlite:///{tmp_path / 'replica.db'}")
+    _seed(primary, "from primary")
+    _seed(replica, "from replica")
+
+    session = sessionmaker(class_=RoutingSession, bind=primary, replica_bind=replica)()
+    try:
+        yield session
+    finally:
+        session.close()
+
+
+def test_read_only_methods_use_replica(routing_session):
+    repo = TaskRepository(routing_session)
+
+    assert [task.text for task in repo.get_tasks(user_id=1)] == ["from replica"]
+
+
+def test_reads_stick_to_primary_after_write(routing_session):
+    repo = TaskRepository(routing_session)
+    repo.get_tasks(user_id=1)
+
+    repo.create_task(TaskEntity(text="new task", user_id=1))
+
+    assert sorted(task.text for task in repo.get_tasks(user_id=1)) == ["from primary", "new task"]
+
+
+def test_core_update_pins_primary(routing_session):
+    repo = TaskRepository(routing_session)
+
+    repo.mark_task_completed(1, 1)
+
+    tasks = repo.get_tasks(user_id=1)
+    assert [task.text for task in tasks] == ["from primary"]
+    assert tasks[0].is_completed is True
+
+
+def test_without_replica_reads_use_primary(tmp_path):
+    primary = create_engine(f"sqlite:///{tmp_path / 'primary.db'}")
+    _seed(primary, "from primary")
+    session = sessionmaker(class_=RoutingSession, bind=primary)()
+
+    assert [task.text for task in TaskRepository(session).get_tasks(user_id=1)] == ["from primary"]
+    session.close()
@@ -0,0 +1,72 @@
+# tests/test_task_archive.py
+from datetime import datetime, timedelta, timezone
+from unittest.mock import MagicMock
+
+from app.domain.entities.task_entity import TaskEntity
+from app.infrastructure.database import db_connection
+from app.infrastructure.database.models import Task
+from app.repositories.task_repository import TaskRepository
+from app.use_cases.tasks.archive_tasks_usecase import ArchiveTasksUseCase
+
+
+def _seed_tasks(count):
+    old = datetime.now(timezone.utc) - timedelta(days=200)
+    with db_connection.SessionLocal() as session:
+        session.add_all([
+            Task(text=f"done {i}", user_id=1, is_completed=True, completed_at=old, created_at=old + timedelta(minutes=i))
+            for i in range(count)
+        ] + [Task(text="open", user_id=1)])
+        session.commit()
+
+
+def test_archive_cli_and_archive_endpoint(flask_app, auth_headers):
+    _seed_tasks(3)
+
+    result = flask_app.test_cli_runner().invoke(args=["archive-tasks", "--older-than-days", "90", "--batch-size", "2"])
+
+    assert result.exit_code == 0
+    assert "Archived 3 tasks finished before" in result.output
+    assert "(2 batches)" in result.output
+
+    client = flask_app.test_client()
+    live = client.get("/api/task/", headers=auth_headers).get_json()
+    assert [task["text"] for task in live["data"]] == ["open"]
+
+    first = client.get("/api/task/archive?limit=2", headers=auth_headers).get_json()
+    assert [task["text"] for task in first["data"]] == ["done 2", "done 1"]
+    assert first["next_cursor"]
+
+    second = client.get(f"/api/task/archive?limit=2&cursor={first['next_cursor']}", headers=auth_headers).get_json()
+    assert [task["text"] for task in second["data"]] == ["done 0"]
+    assert second["next_cursor"] is None
+
+
+def test_archive_usecase_reports_archived_count_and_cutoff():
+    repo = MagicMock()
+    repo.archive_tasks.side_effect = [2, 2, 1]
+    usecase = ArchiveTasksUseCase(task_repository=repo, uow=MagicMock(), older_than_days=30, batch_size=2)
+
+    report = usecase.execute()
+
+    assert report.archived == 5
+    assert report.batches == 3
+    assert datetime.now(timezone.utc) - report.cutoff >= timedelta(days=30)
+    assert repo.archive_tasks.call_args.kwargs["before"] == report.cutoff
+    assert set(report.to_dict()) == {"archived", "cutoff", "batches", "elapsed_seconds"}
+
+
+def test_archiving_the_newest_task_does_not_free_its_id(db_session):
+    repo = TaskRepository(db_session)
+    later = datetime.now(timezone.utc) + timedelta(minutes=1)
+
+    first = repo.create_task(TaskEntity(text="first", user_id=1))
+    repo.mark_task_completed(first.id, 1)
+    assert repo.archive_tasks(before=later, batch_size=10) == 1
+
+    # بدون AUTOINCREMENT يعيد SQLite استخدام معرف آخر مهمة محذوفة من tasks
+    second = repo.create_task(TaskEntity(text="second", user_id=1))
+    assert second.id != first.id
+    repo.mark_task_completed(second.id, 1)
+    assert repo.archive_tasks(before=later, batch_size=10) == 1
+
+    assert [task.text for task in repo.get_archived_tasks(user_id=1)] == ["second", "first"]
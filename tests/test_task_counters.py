@@ -0,0 +1,145 @@
+# tests/test_task_counters.py
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import update
+
+from app.constants.task_states import TASK_STATES
+from app.domain.entities.group_entity import GroupEntity
+from app.domain.entities.task_entity import TaskEntity
+from app.infrastructure.database import db_connection
+from app.infrastructure.database.models import Group, UserTaskCounter
+from app.repositories.group_repository import GroupRepository
+from app.repositories.task_repository import TaskRepository
+
+
+def _user_counters(session, user_id=1):
+    counter = session.get(UserTaskCounter, user_id, populate_existing=True)
+    return (counter.total, counter.open, counter.completed) if counter else (0, 0, 0)
+
+
+def _group_counters(session, group_id):
+    group = session.get(Group, group_id, populate_existing=True)
+    return group.task_count, group.open_count
+
+
+def test_counters_follow_every_task_write(db_session):
+    task_repo = TaskRepository(db_session)
+    group = GroupRepository(db_session).create_group(GroupEntity(name="Home", user_id=1))
+
+    first = task_repo.create_task(TaskEntity(text="first", user_id=1, group_id=group.id))
+    second, third = task_repo.create_tasks([
+        TaskEntity(text="second", user_id=1, group_id=group.id),
+        TaskEntity(text="third", user_id=1),
+    ])
+    assert _user_counters(db_session) == (3, 3, 0)
+    assert _group_counters(db_session, group.id) == (2, 2)
+
+    task_repo.mark_task_completed(first.id, 1)
+    # إعادة الإكمال لا تغيّر العدادات
+    assert task_repo.mark_task_completed(first.id, 1).is_completed is True
+    assert _user_counters(db_session) == (3, 2, 1)
+    assert _group_counters(db_session, group.id) == (2, 1)
+
+    task_repo.mark_task_uncompleted(first.id, 1)
+    task_repo.delete_task(second.id, 1)
+    assert _user_counters(db_session) == (2, 2, 0)
+    assert _group_counters(db_session, group.id) == (1, 1)
+
+    task_repo.bulk_update_state([first.id, third.id], 1, TASK_STATES["COMPLETED"])
+    assert _user_counters(db_session) == (2, 0, 2)
+    assert _group_counters(db_session, group.id) == (1, 0)
+
+    assert task_repo.find_counter_drift() == {"users": [], "groups": []}
+
+
+def test_delete_group_and_archive_update_counters(db_session):
+    task_repo = TaskRepository(db_session)
+    group_repo = GroupRepository(db_session)
+    group = group_repo.create_group(GroupEntity(name="Work", user_id=1))
+    old = datetime.now(timezone.utc) - timedelta(days=200)
+
+    task_repo.create_tasks([TaskEntity(text=f"grouped {i}", user_id=1, group_id=group.id) for i in range(3)])
+    task_repo.create_task(TaskEntity(text="old", user_id=1, is_completed=True, completed_at=old))
+    task_repo.create_task(TaskEntity(text="open", user_id=1))
+    db_session.commit()
+
+    assert group_repo.delete_group(group.id, 1) == 3
+    assert _group_counters(db_session, group.id) == (0, 0)
+    assert _user_counters(db_session) == (2, 1, 1)
+
+    assert task_repo.archive_tasks(before=datetime.now(timezone.utc) - timedelta(days=90), batch_size=10) == 1
+    assert _user_counters(db_session) == (1, 1, 0)
+    assert task_repo.find_counter_drift() == {"users": [], "groups": []}
+
+
+def test_repair_counters_fixes_only_drifted_rows(db_session):
+    task_repo = TaskRepository(db_session)
+    group = GroupRepository(db_session).create_group(GroupEntity(name="Home", user_id=1))
+    task_repo.create_task(TaskEntity(text="grouped", user_id=1, group_id=group.id))
+    task_repo.create_task(TaskEntity(text="other", user_id=2))
+    db_session.execute(update(UserTaskCounter).where(UserTaskCounter.user_id == 1).values(total=9, open=9))
+    db_session.execute(update(Group).where(Group.id == group.id).values(open_count=0))
+
+    drift = task_repo.find_counter_drift()
+
+    assert drift == {
+        "users": [{
+            "user_id": 1,
+            "stored": {"total": 9, "open": 9, "completed": 0},
+            "actual": {"total": 1, "open": 1, "completed": 0}
+        }],
+        "groups": [{
+            "group_id": group.id,
+            "stored": {"task_count": 1, "open_count": 0},
+            "actual": {"task_count": 1, "open_count": 1}
+        }]
+    }
+    assert task_repo.repair_counters(drift) == 2
+    assert _user_counters(db_session) == (1, 1, 0)
+    assert _group_counters(db_session, group.id) == (1, 1)
+    assert task_repo.find_counter_drift() == {"users": [], "groups": []}
+
+
+def test_repair_counters_skips_groups_that_no_longer_exist(db_session):
+    task_repo = TaskRepository(db_session)
+    task_repo.create_task(TaskEntity(text="orphan", user_id=1, group_id=404))
+
+    drift = task_repo.find_counter_drift()
+
+    assert drift == {
+        "users": [],
+        "groups": [{
+            "group_id": 404,
+            "stored": {"task_count": 0, "open_count": 0},
+            "actual": {"task_count": 1, "open_count": 1},
+            "orphaned": True
+        }]
+    }
+    version = task_repo.get_data_version(1)
+    assert task_repo.repair_counters(drift) == 0
+    assert task_repo.get_data_version(1) == version
+    assert db_session.get(Group, 404) is None
+
+
+def test_reconcile_cli_reports_and_repairs_drift(flask_app, auth_headers):
+    client = flask_app.test_client()
+    client.post("/api/task/", json={"text": "counted"}, headers=auth_headers)
+    with db_connection.SessionLocal() as session:
+        session.execute(update(UserTaskCounter).values(open=5))
+        session.commit()
+
+    runner = flask_app.test_cli_runner()
+    result = runner.invoke(args=["reconcile-counters", "--dry-run"])
+    assert result.exit_code == 0
+    assert "users 1: stored {'total': 1, 'open': 5, 'completed': 0}" in result.output
+    assert "Drift: 1 rows, repaired 0" in result.output
+
+    stats = client.get("/api/task/stats", headers=auth_headers).get_json()
+    assert stats["data"]["open"] == 5
+
+    result = runner.invoke(args=["reconcile-counters"])
+    assert "Drift: 1 rows, repaired 1" in result.output
+    stats = client.get("/api/task/stats", headers=auth_headers).get_json()
+    assert stats["data"]["open"] == 1
+
+    assert "Drift: 0 rows" in runner.invoke(args=["reconcile-counters"]).output
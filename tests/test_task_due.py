@@ -0,0 +1,99 @@
+# tests/test_task_due.py
+from datetime import datetime, timedelta, timezone
+from unittest.mock import MagicMock
+
+import pytest
+
+from app.constants.error_messages import ERROR_MESSAGES
+from app.domain.entities.task_entity import TaskEntity
+from app.repositories.task_repository import TaskRepository
+from app.use_cases.tasks.get_due_tasks_usecase import GetDueTasksUseCase
+from app.use_cases.tasks.get_overdue_tasks_usecase import GetOverdueTasksUseCase
+
+DAY = datetime(2025, 3, 10, tzinfo=timezone.utc)
+
+
+def _add(repo, text, due_at, **values):
+    return repo.create_task(TaskEntity(text=text, user_id=values.pop("user_id", 1), due_at=due_at,
+                                       created_at=DAY, **values))
+
+
+def test_get_tasks_due_returns_open_tasks_in_range(db_session):
+    repo = TaskRepository(db_session)
+    _add(repo, "late evening", DAY + timedelta(hours=22))
+    _add(repo, "morning", DAY + timedelta(hours=9))
+    _add(repo, "tomorrow", DAY + timedelta(days=1))
+    _add(repo, "done", DAY + timedelta(hours=10), is_completed=True)
+    _add(repo, "deleted", DAY + timedelta(hours=11), is_deleted=True)
+    _add(repo, "no date", None)
+    _add(repo, "other user", DAY + timedelta(hours=12), user_id=2)
+
+    tasks = repo.get_tasks_due(user_id=1, start=DAY, end=DAY + timedelta(days=1))
+
+    assert [task.text for task in tasks] == ["morning", "late evening"]
+
+
+def test_due_pages_follow_due_at_then_id(db_session):
+    repo = TaskRepository(db_session)
+    for index in range(5):
+        _add(repo, f"task {index}", DAY + timedelta(hours=index // 2))
+
+    usecase = GetDueTasksUseCase(repo)
+    first = usecase.execute(1, start=DAY, end=DAY + timedelta(days=1), limit=2)
+    second = usecase.execute(1, start=DAY, end=DAY + timedelta(days=1), limit=2, cursor=first.next_cursor)
+    third = usecase.execute(1, start=DAY, end=DAY + timedelta(days=1), limit=2, cursor=second.next_cursor)
+
+    assert [task.text for page in (first, second, third) for task in page.items] == [f"task {i}" for i in range(5)]
+    assert third.next_cursor is None
+
+
+def test_get_overdue_tasks_skips_future_and_closed(db_session):
+    repo = TaskRepository(db_session)
+    now = datetime.now(timezone.utc)
+    _add(repo, "last week", now - timedelta(days=7))
+    _add(repo, "yesterday", now - timedelta(days=1))
+    _add(repo, "next week", now + timedelta(days=7))
+    _add(repo, "finished", now - timedelta(days=2), is_completed=True)
+
+    page = GetOverdueTasksUseCase(repo).execute(1)
+
+    assert [task.text for task in page.items] == ["last week", "yesterday"]
+
+
+def test_due_usecase_validates_range():
+    repo = MagicMock()
+    usecase = GetDueTasksUseCase(repo)
+
+    with pytest.raises(ValueError, match=ERROR_MESSAGES["DUE_RANGE_REQUIRED"]):
+        usecase.execute(1, start="2025-03-10T00:00:00Z", end=None)
+    with pytest.raises(ValueError, match=ERROR_MESSAGES["INVALID_DUE_RANGE"]):
+        usecase.execute(1, start="2025-03-11T00:00:00Z", end="2025-03-10T00:00:00Z")
+    with pytest.raises(ValueError, match=ERROR_MESSAGES["INVALID_DATETIME"]):
+        usecase.execute(1, start="tomorrow", end="2025-03-10T00:00:00Z")
+
+    repo.get_tasks_due.assert_not_called()
+
+
+def test_due_usecase_converts_offsets_to_utc():
+    repo = MagicMock()
+    repo.get_tasks_due.return_value = []
+
+    GetDueTasksUseCase(repo).execute(1, start="2025-03-10T00:00:00+03:00", end="2025-03-11T00:00:00")
+
+    kwargs = repo.get_tasks_due.call_args.kwargs
+    assert kwargs["start"] == datetime(2025, 3, 9, 21, tzinfo=timezone.utc)
+    assert kwargs["end"] == datetime(2025, 3, 11, tzinfo=timezone.utc)
+
+
+def test_due_and_overdue_endpoints(flask_app, auth_headers):
+    client = flask_app.test_client()
+    client.post("/api/task/", json={"text": "dentist", "due_at": "2025-03-10T09:00:00+01:00"}, headers=auth_headers)
+    client.post("/api/task/", json={"text": "someday"}, headers=auth_headers)
+
+    due = client.get("/api/task/due?start=2025-03-10T00:00:00Z&end=2025-03-11T00:00:00Z", headers=auth_headers)
+    overdue = client.get("/api/task/overdue", headers=auth_headers)
+    invalid = client.get("/api/task/due?start=2025-03-11T00:00:00Z&end=2025-03-10T00:00:00Z", headers=auth_headers)
+
+    assert [task["text"] for task in due.get_json()["data"]] == ["dentist"]
+    assert [task["text"] for task in overdue.get_json()["data"]] == ["dentist"]
+    assert invalid.status_code == 400
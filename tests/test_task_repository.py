@@ -1,6 +1,10 @@
 # tests/test_task_repository.py
+from datetime import datetime, timedelta, timezone
+
 from app.repositories.task_repository import TaskRepository
 from app.domain.entities.task_entity import TaskEntity
+from app.domain.value_objects.cursor import Cursor
+from app.infrastructure.database.models import ArchivedTask, Task
 
 def test_create_and_complete_task(db_session):
     repo = TaskRepository(db_session)
@@ -40,3 +44,197 @@ def test_delete_task(db_session):
     created_task = repo.create_task(task)
     result = repo.delete_task(created_task.id, 1)
     assert result is True
+
+
+def test_get_tasks_keyset_pagination(db_session):
+    from datetime import datetime, timedelta
+    from app.domain.value_objects.cursor import Cursor
+
+    repo = TaskRepository(db_session)
+    base = datetime(2025, 1, 1)
+    for i in range(5):
+        repo.create_task(TaskEntity(text=f"Task {i}", user_id=1, created_at=base + timedelta(minutes=i)))
+    # مهمتان بنفس وقت الإنشاء للتأكد من أن المعرف يفصل بينهما
+    repo.create_task(TaskEntity(text="Twin A", user_id=1, created_at=base + timedelta(minutes=10)))
+    repo.create_task(TaskEntity(text="Twin B", user_id=1, created_at=base + timedelta(minutes=10)))
+    repo.create_task(TaskEntity(text="Other user", user_id=2, created_at=base))
+
+    first_page = repo.get_tasks(user_id=1, limit=3)
+    assert [task.text for task in first_page] == ["Twin B", "Twin A", "Task 4"]
+
+    after = Cursor(first_page[-1].created_at, first_page[-1].id)
+    second_page = repo.get_tasks(user_id=1, limit=3, after=after)
+    assert [task.text for task in second_page] == ["Task 3", "Task 2", "Task 1"]
+
+    after = Cursor(second_page[-1].created_at, second_page[-1].id)
+    assert [task.text for task in repo.get_tasks(user_id=1, limit=3, after=after)] == ["Task 0"]
+
+
+def test_task_transitions_use_single_statement(db_session, query_counter):
+    repo = TaskRepository(db_session)
+    created_task = repo.create_task(TaskEntity(text="Toggle me", user_id=1))
+
+    query_counter.clear()
+    completed = repo.mark_task_completed(created_task.id, 1)
+    assert completed.is_completed is True
+    assert completed.completed_at is not None
+    # UPDATE ... RETURNING ثم تحديث عداد المستخدم
+    assert len(query_counter) == 2
+    assert query_counter[0].startswith("UPDATE tasks")
+    assert query_counter[1].startswith("INSERT INTO user_task_counters")
+
+    query_counter.clear()
+    uncompleted = repo.mark_task_uncompleted(created_task.id, 1)
+    assert uncompleted.is_completed is False
+    assert uncompleted.completed_at is None
+    assert len(query_counter) == 2
+
+    query_counter.clear()
+    assert repo.delete_task(created_task.id, 1) is True
+    assert len(query_counter) == 2
+
+
+def test_task_transitions_check_owner_and_deleted(db_session):
+    repo = TaskRepository(db_session)
+    created_task = repo.create_task(TaskEntity(text="Owned", user_id=1))
+
+    # مستخدم آخر لا يستطيع تعديل المهمة
+    assert repo.mark_task_completed(created_task.id, 2) is None
+    assert repo.delete_task(created_task.id, 2) is None
+
+    assert repo.delete_task(created_task.id, 1) is True
+    # المهمة المحذوفة لا يمكن تعديلها أو حذفها مرة أخرى
+    assert repo.mark_task_completed(created_task.id, 1) is None
+    assert repo.mark_task_uncompleted(created_task.id, 1) is None
+    assert repo.delete_task(created_task.id, 1) is None
+
+
+def test_task_transitions_without_returning_support(db_session, monkeypatch):
+    repo = TaskRepository(db_session)
+    created_task = repo.create_task(TaskEntity(text="Fallback", user_id=1))
+    monkeypatch.setattr(db_session.get_bind().dialect, "update_returning", False)
+
+    completed = repo.mark_task_completed(created_task.id, 1)
+    assert completed.id == created_task.id
+    assert completed.is_completed is True
+    assert repo.mark_task_completed(created_task.id, 2) is None
+
+
+def test_create_tasks_returns_tasks_in_input_order(db_session, query_counter):
+    repo = TaskRepository(db_session)
+    tasks = [TaskEntity(text=f"Batch {i}", user_id=1) for i in range(20)]
+
+    query_counter.clear()
+    created = repo.create_tasks(tasks)
+
+    # PostgreSQL يُدرج الدفعة بعبارة واحدة؛ SQLite بلا عمود حارس فيُدرج SQLAlchemy صفاً لكل عبارة ليحفظ الترتيب
+    assert all(sql.startswith("INSERT INTO tasks") for sql in query_counter[:-1])
+    # عبارة واحدة لعداد المستخدم بعد الإدراج
+    assert query_counter[-1].startswith("INSERT INTO user_task_counters")
+    assert [task.text for task in created] == [f"Batch {i}" for i in range(20)]
+    assert all(task.id is not None for task in created)
+    assert [task.id for task in created] == sorted(task.id for task in created)
+
+
+def test_create_tasks_keeps_input_order_across_insert_batches(db_session):
+    repo = TaskRepository(db_session)
+    # أكثر من دفعة insertmanyvalues واحدة (1000 صف افتراضياً)
+    tasks = [
+        TaskEntity(text=f"Batch {i}", user_id=1 + i % 3, due_at=datetime(2030, 1, 1) + timedelta(minutes=i))
+        for i in range(1100)
+    ]
+
+    created = repo.create_tasks(tasks)
+
+    assert [(task.text, task.user_id, task.due_at) for task in created] == [
+        (task.text, task.user_id, task.due_at) for task in tasks
+    ]
+    stored = dict(db_session.query(Task.id, Task.text).all())
+    assert all(stored[task.id] == task.text for task in created)
+
+
+def test_create_tasks_without_insert_returning(db_session, monkeypatch):
+    repo = TaskRepository(db_session)
+    dialect = db_session.get_bind().dialect
+    monkeypatch.setattr(dialect, "insert_executemany_returning", False)
+    monkeypatch.setattr(dialect, "insert_executemany_returning_sort_by_parameter_order", False)
+
+    created = repo.create_tasks([TaskEntity(text=f"Fallback {i}", user_id=1, group_id=None) for i in range(3)])
+
+    assert [task.text for task in created] == ["Fallback 0", "Fallback 1", "Fallback 2"]
+    assert all(task.id is not None for task in created)
+    stored = dict(db_session.query(Task.id, Task.text).all())
+    assert all(stored[task.id] == task.text for task in created)
+    assert repo.get_task_stats(1, datetime.now(timezone.utc), datetime.now(timezone.utc)).total == 3
+
+
+
+def test_bulk_update_state_reports_per_id_outcomes(db_session, query_counter):
+    repo = TaskRepository(db_session)
+    open_task, done_task, deleted_task, foreign_task = repo.create_tasks([
+        TaskEntity(text="Open", user_id=1),
+        TaskEntity(text="Done", user_id=1),
+        TaskEntity(text="Deleted", user_id=1),
+        TaskEntity(text="Foreign", user_id=2),
+    ])
+    repo.mark_task_completed(done_task.id, 1)
+    repo.delete_task(deleted_task.id, 1)
+
+    query_counter.clear()
+    outcomes = repo.bulk_update_state(
+        [open_task.id, done_task.id, deleted_task.id, foreign_task.id, 999], 1, "completed"
+    )
+
+    assert outcomes == {
+        open_task.id: "updated",
+        done_task.id: "already_in_state",
+        deleted_task.id: "not_found",
+        foreign_task.id: "not_found",
+        999: "not_found",
+    }
+    assert sum(1 for statement in query_counter if statement.startswith("UPDATE")) == 1
+
+    outcomes = repo.bulk_update_state([open_task.id, deleted_task.id], 1, "deleted")
+    assert outcomes == {open_task.id: "updated", deleted_task.id: "already_in_state"}
+
+    outcomes = repo.bulk_update_state([done_task.id, open_task.id], 1, "uncompleted")
+    assert outcomes == {done_task.id: "updated", open_task.id: "not_found"}
+
+
+def test_archive_tasks_moves_old_deleted_and_completed(db_session):
+    repo = TaskRepository(db_session)
+    old = datetime.now(timezone.utc) - timedelta(days=100)
+    recent = datetime.now(timezone.utc) - timedelta(days=1)
+    db_session.add_all([
+        Task(id=1, text="old deleted", user_id=1, is_deleted=True, deleted_at=old, created_at=old),
+        Task(id=2, text="old completed", user_id=1, is_completed=True, completed_at=old, created_at=old),
+        Task(id=3, text="recent deleted", user_id=1, is_deleted=True, deleted_at=recent, created_at=old),
+        Task(id=4, text="open", user_id=1, created_at=old),
+    ])
+    db_session.flush()
+    before = datetime.now(timezone.utc) - timedelta(days=90)
+
+    assert repo.archive_tasks(before=before, batch_size=1) == 1
+    assert repo.archive_tasks(before=before, batch_size=10) == 1
+    assert repo.archive_tasks(before=before, batch_size=10) == 0
+
+    assert sorted(task.id for task in repo.get_tasks(user_id=1)) == [3, 4]
+    archived = repo.get_archived_tasks(user_id=1)
+    assert sorted(task.id for task in archived) == [1, 2]
+    assert {task.text for task in archived} == {"old deleted", "old completed"}
+
+
+def test_get_archived_tasks_keyset_pagination(db_session):
+    repo = TaskRepository(db_session)
+    base = datetime(2020, 1, 1, tzinfo=timezone.utc)
+    db_session.add_all([
+        ArchivedTask(id=i, text=f"t{i}", user_id=1, created_at=base + timedelta(minutes=i), archived_at=base)
+        for i in range(1, 6)
+    ])
+    db_session.flush()
+
+    first = repo.get_archived_tasks(user_id=1, limit=2)
+    second = repo.get_archived_tasks(user_id=1, limit=2, after=Cursor(first[-1].created_at, first[-1].id))
+
+    assert [task.id for task in first] == [5, 4]
+    assert [task.id for task in second] == [3, 2]
@@ -0,0 +1,108 @@
+# tests/test_task_search.py
+from datetime import datetime, timedelta, timezone
+from unittest.mock import MagicMock
+
+import pytest
+from sqlalchemy import delete, update
+from sqlalchemy.dialects import postgresql
+
+from app.constants.error_messages import ERROR_MESSAGES
+from app.domain.entities.task_entity import TaskEntity
+from app.infrastructure.database.models import Task
+from app.repositories.task_repository import TaskRepository
+from app.use_cases.tasks.search_tasks_usecase import SearchTasksUseCase
+
+
+def _add(repo, text, user_id=1, minutes=0):
+    return repo.create_task(TaskEntity(
+        text=text,
+        user_id=user_id,
+        created_at=datetime(2025, 1, 1, tzinfo=timezone.utc) + timedelta(minutes=minutes)
+    ))
+
+
+def test_search_matches_prefixes_and_ranks(db_session):
+    repo = TaskRepository(db_session)
+    _add(repo, "buy milk", minutes=0)
+    _add(repo, "milk milk milk for the cake", minutes=1)
+    _add(repo, "call the bank", minutes=2)
+    _add(repo, "milk", user_id=2)
+
+    results = repo.search_tasks(user_id=1, query="mil")
+
+    assert [task.text for task in results] == ["milk milk milk for the cake", "buy milk"]
+    assert [task.text for task in repo.search_tasks(user_id=1, query="BUY mi")] == ["buy milk"]
+    assert repo.search_tasks(user_id=1, query="milk bank") == []
+
+
+def test_search_supports_arabic_text(db_session):
+    repo = TaskRepository(db_session)
+    _add(repo, "مراجعة التقرير الشهري")
+
+    assert [task.text for task in repo.search_tasks(user_id=1, query="التقر")] == ["مراجعة التقرير الشهري"]
+
+
+def test_search_index_follows_writes(db_session):
+    repo = TaskRepository(db_session)
+    renamed = _add(repo, "draft report")
+    deleted = _add(repo, "draft slides")
+    archived = _add(repo, "draft budget")
+
+    db_session.execute(update(Task).where(Task.id == renamed.id).values(text="final report"))
+    repo.delete_task(deleted.id, 1)
+    db_session.execute(delete(Task).where(Task.id == archived.id))
+
+    assert repo.search_tasks(user_id=1, query="draft") == []
+    assert [task.id for task in repo.search_tasks(user_id=1, query="final")] == [renamed.id]
+
+
+def test_search_ignores_query_operators(db_session):
+    repo = TaskRepository(db_session)
+    _add(repo, "fix login bug")
+
+    assert [task.text for task in repo.search_tasks(user_id=1, query='"login" (bug* -')] == ["fix login bug"]
+
+
+def test_postgres_search_uses_indexed_expression():
+    from sqlalchemy import create_mock_engine
+
+    session = MagicMock()
+    session.get_bind.return_value = create_mock_engine("postgresql://", executor=None)
+    sql = str(TaskRepository(session)._search_statement(["milk"], user_id=1).compile(dialect=postgresql.dialect()))
+
+    # نفس شروط الفهرس المركب الجزئي ix_tasks_user_text_search
+    assert "tasks.user_id = %(user_id_1)s AND tasks.is_deleted = false" in sql
+    assert "to_tsvector('simple', tasks.text) @@ to_tsquery('simple'" in sql
+    assert "ts_rank" in sql
+
+
+def test_search_without_text_index_escapes_like_wildcards(db_session, monkeypatch):
+    repo = TaskRepository(db_session)
+    _add(repo, "abc_1")
+    _add(repo, "a_c_1")
+    _add(repo, "a_c_1 elsewhere", user_id=2)
+    monkeypatch.setattr(db_session.get_bind().dialect, "name", "other")
+
+    assert [task.text for task in repo.search_tasks(user_id=1, query="a_c")] == ["a_c_1"]
+
+
+def test_search_usecase_requires_words():
+    repo = MagicMock()
+    usecase = SearchTasksUseCase(repo)
+
+    with pytest.raises(ValueError, match=ERROR_MESSAGES["SEARCH_QUERY_REQUIRED"]):
+        usecase.execute(1, " ?! ")
+
+    repo.search_tasks.assert_not_called()
+
+
+def test_search_endpoint(flask_app, auth_headers):
+    client = flask_app.test_client()
+    client.post("/api/task/", json={"text": "water the plants"}, headers=auth_headers)
+    client.post("/api/task/", json={"text": "pay rent"}, headers=auth_headers)
+
+    found = client.get("/api/task/search?q=plan", headers=auth_headers)
+    empty = client.get("/api/task/search?q=", headers=auth_headers)
+
+    assert [task["text"] for task in found.get_json()["data"]] == ["water the plants"]
+    assert empty.status_code == 400
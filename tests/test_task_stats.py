@@ -0,0 +1,71 @@
+# tests/test_task_stats.py
+from datetime import datetime, timedelta, timezone
+from unittest.mock import MagicMock
+
+import pytest
+
+from app.constants.error_messages import ERROR_MESSAGES
+from app.domain.entities.task_entity import TaskEntity
+from app.repositories.task_repository import TaskRepository
+from app.use_cases._datetimes import start_of_day
+from app.use_cases.tasks.get_task_stats_usecase import GetTaskStatsUseCase
+
+
+def _add(repo, text, user_id=1, **values):
+    return repo.create_task(TaskEntity(text=text, user_id=user_id, created_at=datetime.now(timezone.utc), **values))
+
+
+def test_task_stats_in_one_query(db_session, query_counter):
+    repo = TaskRepository(db_session)
+    now = datetime(2025, 3, 10, 15, tzinfo=timezone.utc)
+    day_start = datetime(2025, 3, 10, tzinfo=timezone.utc)
+    _add(repo, "open")
+    _add(repo, "overdue", due_at=now - timedelta(hours=1))
+    _add(repo, "due later", due_at=now + timedelta(hours=1))
+    _add(repo, "done today", is_completed=True, completed_at=now - timedelta(hours=2))
+    _add(repo, "done yesterday", is_completed=True, completed_at=day_start - timedelta(hours=1),
+         due_at=now - timedelta(days=2))
+    _add(repo, "deleted", is_deleted=True, due_at=now - timedelta(days=1))
+    _add(repo, "other user", user_id=2)
+    query_counter.clear()
+
+    stats = repo.get_task_stats(user_id=1, now=now, day_start=day_start)
+
+    assert len(query_counter) == 1
+    assert stats.to_dict() == {"total": 5, "open": 3, "completed": 2, "overdue": 1, "completed_today": 1}
+
+
+def test_task_stats_for_user_without_tasks(db_session):
+    stats = TaskRepository(db_session).get_task_stats(
+        user_id=1, now=datetime.now(timezone.utc), day_start=datetime.now(timezone.utc)
+    )
+
+    assert stats.to_dict() == {"total": 0, "open": 0, "completed": 0, "overdue": 0, "completed_today": 0}
+
+
+def test_start_of_day_uses_user_time_zone():
+    now = datetime(2025, 3, 10, 22, 30, tzinfo=timezone.utc)
+
+    assert start_of_day(now) == datetime(2025, 3, 10, tzinfo=timezone.utc)
+    # في الرياض (UTC+3) بدأ يوم 11 مارس عند 21:00 UTC
+    assert start_of_day(now, "Asia/Riyadh") == datetime(2025, 3, 10, 21, tzinfo=timezone.utc)
+
+    with pytest.raises(ValueError, match=ERROR_MESSAGES["INVALID_TIMEZONE"]):
+        start_of_day(now, "Mars/Olympus")
+
+
+def test_task_stats_usecase_requires_user():
+    with pytest.raises(ValueError, match=ERROR_MESSAGES["USER_ID_REQUIRED"]):
+        GetTaskStatsUseCase(MagicMock()).execute(None)
+
+
+def test_task_stats_endpoint(flask_app, auth_headers):
+    client = flask_app.test_client()
+    client.post("/api/task/", json={"text": "late", "due_at": "2020-01-01T00:00:00Z"}, headers=auth_headers)
+    task_id = client.post("/api/task/", json={"text": "finish"}, headers=auth_headers).get_json()["id"]
+    client.patch(f"/api/task/complete/{task_id}", headers=auth_headers)
+
+    response = client.get("/api/task/stats?tz=Asia/Riyadh", headers=auth_headers)
+
+    assert response.get_json()["data"] == {"total": 2, "open": 1, "completed": 1, "overdue": 1, "completed_today": 1}
+    assert client.get("/api/task/stats?tz=Nowhere", headers=auth_headers).status_code == 400
@@ -2,7 +2,9 @@ import pytest
 from types import SimpleNamespace
 from datetime import datetime, timezone
 
+from app.use_cases.tasks.bulk_update_task_state_usecase import BulkUpdateTaskStateUseCase
 from app.use_cases.tasks.create_task_usecase import CreateTaskUseCase
+from app.use_cases.tasks.create_tasks_batch_usecase import CreateTasksBatchUseCase
 from app.use_cases.tasks.delete_task_usecase import DeleteTaskUseCase
 from app.use_cases.tasks.mark_task_completed_usecase import MarkTaskCompletedUseCase
 from app.use_cases.tasks.mark_task_uncompleted_usecase import MarkTaskUncompletedUseCase
@@ -15,23 +17,38 @@ def mock_task_repo(mocker):
 
 
 @pytest.fixture
-def create_task_usecase(mock_task_repo):
-    return CreateTaskUseCase(task_repository=mock_task_repo)
+def mock_uow(mocker):
+    return mocker.MagicMock()
 
 
 @pytest.fixture
-def delete_task_usecase(mock_task_repo):
-    return DeleteTaskUseCase(task_repository=mock_task_repo)
+def create_task_usecase(mock_task_repo, mock_uow):
+    return CreateTaskUseCase(task_repository=mock_task_repo, uow=mock_uow)
 
 
 @pytest.fixture
-def mark_task_completed_usecase(mock_task_repo):
-    return MarkTaskCompletedUseCase(task_repository=mock_task_repo)
+def create_tasks_batch_usecase(mock_task_repo, mock_uow):
+    return CreateTasksBatchUseCase(task_repository=mock_task_repo, uow=mock_uow, max_batch_size=3)
 
 
 @pytest.fixture
-def mark_task_uncompleted_usecase(mock_task_repo):
-    return MarkTaskUncompletedUseCase(task_repository=mock_task_repo)
+def bulk_update_task_state_usecase(mock_task_repo, mock_uow):
+    return BulkUpdateTaskStateUseCase(task_repository=mock_task_repo, uow=mock_uow, max_batch_size=3)
+
+
+@pytest.fixture
+def delete_task_usecase(mock_task_repo, mock_uow):
+    return DeleteTaskUseCase(task_repository=mock_task_repo, uow=mock_uow)
+
+
+@pytest.fixture
+def mark_task_completed_usecase(mock_task_repo, mock_uow):
+    return MarkTaskCompletedUseCase(task_repository=mock_task_repo, uow=mock_uow)
+
+
+@pytest.fixture
+def mark_task_uncompleted_usecase(mock_task_repo, mock_uow):
+    return MarkTaskUncompletedUseCase(task_repository=mock_task_repo, uow=mock_uow)
 
 
 # ---------------- Tests: Create Task ----------------
@@ -61,6 +78,33 @@ def test_create_task_success(create_task_usecase, mock_task_repo):
     mock_task_repo.create_task.assert_called_once()
 
 
+# ---------------- Tests: Create Tasks Batch ----------------
+def test_create_tasks_batch_keeps_input_order(create_tasks_batch_usecase, mock_task_repo):
+    mock_task_repo.create_tasks.side_effect = lambda tasks: tasks
+
+    result = create_tasks_batch_usecase.execute(
+        [{"text": "First"}, {"text": "Second", "group_id": 4}],
+        user_id=1
+    )
+
+    assert [task.text for task in result] == ["First", "Second"]
+    assert [task.group_id for task in result] == [None, 4]
+    assert all(task.user_id == 1 for task in result)
+    mock_task_repo.create_tasks.assert_called_once()
+
+
+def test_create_tasks_batch_rejects_too_many(create_tasks_batch_usecase, mock_task_repo):
+    with pytest.raises(ValueError):
+        create_tasks_batch_usecase.execute([{"text": str(i)} for i in range(4)], user_id=1)
+
+    mock_task_repo.create_tasks.assert_not_called()
+
+
+def test_create_tasks_batch_rejects_empty(create_tasks_batch_usecase, mock_task_repo):
+    with pytest.raises(ValueError):
+        create_tasks_batch_usecase.execute([], user_id=1)
+
+
 # ---------------- Tests: Delete Task ----------------
 def test_delete_task_success(delete_task_usecase, mock_task_repo):
     mock_task_repo.delete_task.return_value = True
@@ -128,3 +172,27 @@ def test_mark_task_uncompleted_not_found(mark_task_uncompleted_usecase, mock_tas
 
     assert result is None
     mock_task_repo.mark_task_uncompleted.assert_called_once_with(99, 1)
+
+
+# ---------------- Tests: Bulk Task State ----------------
+def test_bulk_update_task_state_deduplicates_ids(bulk_update_task_state_usecase, mock_task_repo):
+    mock_task_repo.bulk_update_state.return_value = {1: "updated", 2: "not_found"}
+
+    result = bulk_update_task_state_usecase.execute([1, 2, 1], user_id=1, state="completed")
+
+    assert result == {1: "updated", 2: "not_found"}
+    mock_task_repo.bulk_update_state.assert_called_once_with([1, 2], 1, "completed")
+
+
+def test_bulk_update_task_state_rejects_unknown_state(bulk_update_task_state_usecase, mock_task_repo):
+    with pytest.raises(ValueError):
+        bulk_update_task_state_usecase.execute([1], user_id=1, state="archived")
+
+    mock_task_repo.bulk_update_state.assert_not_called()
+
+
+def test_bulk_update_task_state_rejects_too_many(bulk_update_task_state_usecase, mock_task_repo):
+    with pytest.raises(ValueError):
+        bulk_update_task_state_usecase.execute([1, 2, 3, 4], user_id=1, state="deleted")
+
+    mock_task_repo.bulk_update_state.assert_not_called()
@@ -0,0 +1,90 @@
+# tests/test_unit_of_work.py
+from datetime import datetime, timedelta, timezone
+from unittest.mock import MagicMock
+
+import pytest
+from sqlalchemy import event, func, select
+
+from app.domain.entities.task_entity import TaskEntity
+from app.infrastructure.database.models import Task, User, VerifiedEmailToken
+from app.infrastructure.database.unit_of_work import UnitOfWork
+from app.repositories.task_repository import TaskRepository
+from app.repositories.user_repository import UserRepository
+from app.use_cases.users.register_user_usecase import RegisterUserUseCase
+
+
+@pytest.fixture
+def commits(db_session):
+    # عدّ عمليات COMMIT الفعلية على الجلسة
+    committed = []
+
+    def _after_commit(session):
+        committed.append(session)
+
+    event.listen(db_session, "after_commit", _after_commit)
+    try:
+        yield committed
+    finally:
+        event.remove(db_session, "after_commit", _after_commit)
+
+
+def _count(db_session, model):
+    return db_session.execute(select(func.count()).select_from(model)).scalar_one()
+
+
+def test_commits_once_on_success(db_session, commits):
+    repo = TaskRepository(db_session)
+
+    with UnitOfWork(db_session):
+        repo.create_task(TaskEntity(text="first", user_id=1))
+        repo.create_task(TaskEntity(text="second", user_id=1))
+
+    assert len(commits) == 1
+    assert _count(db_session, Task) == 2
+
+
+def test_rolls_back_on_error(db_session, commits):
+    repo = TaskRepository(db_session)
+
+    with pytest.raises(RuntimeError):
+        with UnitOfWork(db_session):
+            repo.create_task(TaskEntity(text="lost", user_id=1))
+            raise RuntimeError("boom")
+
+    assert commits == []
+    assert _count(db_session, Task) == 0
+
+
+def _register_usecase(db_session, token_service):
+    hashing_service = MagicMock()
+    hashing_service.hash_password.return_value = "hashed"
+    return RegisterUserUseCase(
+        UserRepository(db_session),
+        UnitOfWork(db_session),
+        hashing_service,
+        token_service,
+        MagicMock(),
+        "http://localhost:8000"
+    )
+
+
+def test_register_user_commits_user_and_token_once(db_session, commits):
+    token_service = MagicMock()
+    token_service.generate_token.return_value = ("raw", "hash", datetime.now(timezone.utc) + timedelta(hours=24))
+
+    _register_usecase(db_session, token_service).execute("alice", "alice@example.com", "SecretPass123")
+
+    assert len(commits) == 1
+    assert _count(db_session, User) == 1
+    assert _count(db_session, VerifiedEmailToken) == 1
+
+
+def test_register_user_leaves_no_orphan_user_on_failure(db_session, commits):
+    token_service = MagicMock()
+    token_service.generate_token.side_effect = RuntimeError("token backend down")
+
+    with pytest.raises(RuntimeError):
+        _register_usecase(db_session, token_service).execute("alice", "alice@example.com", "SecretPass123")
+
+    assert commits == []
+    assert _count(db_session, User) == 0
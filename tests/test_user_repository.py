@@ -1,7 +1,15 @@
 # tests/test_user_repository.py
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from app.constants.error_messages import ERROR_MESSAGES
+from app.repositories._decorator import RepositoryError
 from app.repositories.user_repository import UserRepository
 from app.domain.entities.user_entity import UserEntity
 from app.domain.entities.email_entity import EmailEntity
+from app.domain.entities.password_reset_token_entity import PasswordResetTokenEntity
+from app.domain.entities.verified_email_token_entity import VerifiedEmailTokenEntity
 
 def test_create_and_get_user(db_session):
     repo = UserRepository(db_session)
@@ -27,3 +35,138 @@ def test_create_and_get_user(db_session):
     fetched_user = repo.get_user("testuser")
     assert fetched_user.username == "testuser"
     assert fetched_user.emails[0].email_address == "test@example.com"
+
+
+def _create_user(repo, username="testuser", addresses=("test@example.com",)):
+    return repo.create_user(UserEntity(
+        id=None,
+        username=username,
+        password="hashedpassword",
+        created_at=None,
+        emails=[
+            EmailEntity(
+                id=None,
+                email_address=address,
+                is_primary=index == 0,
+                is_deleted=False,
+                deleted_at=None,
+                verified_at=None,
+                user_id=None
+            )
+            for index, address in enumerate(addresses)
+        ]
+    ))
+
+
+def test_get_user_loads_emails_in_one_query(db_session, query_counter):
+    repo = UserRepository(db_session)
+    _create_user(repo, addresses=("a@example.com", "b@example.com"))
+    db_session.expunge_all()
+    query_counter.clear()
+
+    fetched_user = repo.get_user("testuser")
+
+    assert len(query_counter) == 1
+    assert [email.email_address for email in fetched_user.emails] == ["a@example.com", "b@example.com"]
+
+
+def test_get_user_skips_deleted_emails(db_session):
+    repo = UserRepository(db_session)
+    created_user = _create_user(repo, addresses=("a@example.com", "b@example.com"))
+    repo.delete_email(created_user.emails[1].id)
+    db_session.expunge_all()
+
+    fetched_user = repo.get_user("testuser")
+
+    assert [email.email_address for email in fetched_user.emails] == ["a@example.com"]
+
+
+def test_update_username_returns_emails(db_session, query_counter):
+    repo = UserRepository(db_session)
+    _create_user(repo)
+    db_session.expunge_all()
+    query_counter.clear()
+
+    updated_user = repo.update_username("testuser", "renamed")
+
+    assert updated_user.username == "renamed"
+    assert [email.email_address for email in updated_user.emails] == ["test@example.com"]
+    # تحميل المستخدم مع بريده، التحقق من الاسم الجديد، ثم UPDATE
+    assert len(query_counter) == 3
+
+
+def test_create_user_uses_set_based_queries(db_session, query_counter):
+    repo = UserRepository(db_session)
+
+    created_user = _create_user(repo, addresses=("a@example.com", "b@example.com", "c@example.com"))
+
+    # فحص واحد للاسم والعناوين، إدراج المستخدم، ثم إدراج جميع العناوين دفعة واحدة
+    assert len(query_counter) == 3
+    assert all(email.id is not None for email in created_user.emails)
+    assert {email.user_id for email in created_user.emails} == {created_user.id}
+
+
+def test_create_user_validates_primary_email_before_queries(db_session, query_counter):
+    repo = UserRepository(db_session)
+    user = UserEntity(
+        username="nobody",
+        password="hashedpassword",
+        emails=[EmailEntity(email_address="x@example.com", is_primary=False)]
+    )
+
+    with pytest.raises(RepositoryError, match=ERROR_MESSAGES["PRIMARY_EMAIL_REQUIRED"]):
+        repo.create_user(user)
+
+    assert query_counter == []
+
+
+def test_create_user_rejects_taken_email(db_session):
+    repo = UserRepository(db_session)
+    _create_user(repo, username="first", addresses=("taken@example.com",))
+
+    with pytest.raises(RepositoryError, match=ERROR_MESSAGES["EMAIL_ALREADY_EXISTS"]):
+        _create_user(repo, username="second", addresses=("taken@example.com",))
+
+
+def test_create_user_maps_unique_violation_on_deleted_email(db_session):
+    repo = UserRepository(db_session)
+    first = _create_user(repo, username="first", addresses=("a@example.com", "old@example.com"))
+    repo.delete_email(first.emails[1].id)
+
+    # العنوان المحذوف يتجاوز الفحص المسبق لكن قيد UNIQUE يرفضه
+    with pytest.raises(RepositoryError, match=ERROR_MESSAGES["EMAIL_ALREADY_EXISTS"]):
+        _create_user(repo, username="second", addresses=("old@example.com",))
+
+
+def test_token_writes_take_one_statement(db_session, query_counter):
+    repo = UserRepository(db_session)
+    user = _create_user(repo)
+    expires_at = datetime.now(timezone.utc) + timedelta(hours=1)
+    query_counter.clear()
+
+    reset_token = repo.create_password_reset_token(PasswordResetTokenEntity(token_hash="reset", expires_at=expires_at, user_id=user.id))
+    verify_token = repo.create_verified_email_token(VerifiedEmailTokenEntity(
+        token_hash="verify", expires_at=expires_at, email_id=user.emails[0].id, user_id=user.id
+    ))
+    confirmed = repo.confirm_password_reset_token(reset_token.id)
+
+    # INSERT ... RETURNING لكل توكن ثم UPDATE ... RETURNING، دون SELECT بعد الكتابة
+    assert len(query_counter) == 3
+    assert reset_token.created_at is not None and verify_token.created_at is not None
+    assert confirmed.is_used is True and confirmed.used_at is not None
+
+    with pytest.raises(RepositoryError, match=ERROR_MESSAGES["TOKEN_CONFIRMATION_FAILED"]):
+        repo.confirm_password_reset_token(reset_token.id)
+
+
+def test_create_email_relies_on_unique_constraint(db_session, query_counter):
+    repo = UserRepository(db_session)
+    user = _create_user(repo)
+    query_counter.clear()
+
+    created = repo.create_email(EmailEntity(email_address="second@example.com", user_id=user.id))
+    assert created.id is not None
+    assert len(query_counter) == 1
+
+    with pytest.raises(RepositoryError, match=ERROR_MESSAGES["EMAIL_ALREADY_EXISTS"]):
+        repo.create_email(EmailEntity(email_address="second@example.com", user_id=user.id))
@@ -34,7 +34,7 @@ def test_execute_success(setup_dependencies):
     user_repo.get_verified_email_token.return_value = stored_token
     token_service.match_token_hash.return_value = True
 
-    usecase = VerifiedEmailUseCase(user_repo, token_service)
+    usecase = VerifiedEmailUseCase(user_repo, MagicMock(), token_service)
     result = usecase.execute(raw_token)
 
     assert result["message"] == ERROR_MESSAGES["EMAIL_VERIFIED_SUCCESS"]
@@ -46,7 +46,7 @@ def test_execute_success(setup_dependencies):
 
 def test_missing_verification_token_raises_error(setup_dependencies):
     user_repo, token_service = setup_dependencies
-    usecase = VerifiedEmailUseCase(user_repo, token_service)
+    usecase = VerifiedEmailUseCase(user_repo, MagicMock(), token_service)
 
     with pytest.raises(ValueError) as exc:
         usecase.execute("")
@@ -57,7 +57,7 @@ def test_invalid_or_expired_token_raises_error(setup_dependencies):
     user_repo, token_service = setup_dependencies
     token_service.verify_token.return_value = None
 
-    usecase = VerifiedEmailUseCase(user_repo, token_service)
+    usecase = VerifiedEmailUseCase(user_repo, MagicMock(), token_service)
     with pytest.raises(ValueError) as exc:
         usecase.execute("invalid_token")
     assert str(exc.value) == ERROR_MESSAGES["INVALID_OR_EXPIRED_TOKEN"]
@@ -71,7 +71,7 @@ def test_invalid_token_type_raises_error(setup_dependencies):
         "type": "reset_password"
     }
 
-    usecase = VerifiedEmailUseCase(user_repo, token_service)
+    usecase = VerifiedEmailUseCase(user_repo, MagicMock(), token_service)
     with pytest.raises(ValueError) as exc:
         usecase.execute("token")
     assert str(exc.value) == ERROR_MESSAGES["INVALID_TOKEN_TYPE"]
@@ -85,7 +85,7 @@ def test_missing_token_data_raises_error(setup_dependencies):
         "type": "verify_email"
     }
 
-    usecase = VerifiedEmailUseCase(user_repo, token_service)
+    usecase = VerifiedEmailUseCase(user_repo, MagicMock(), token_service)
     with pytest.raises(ValueError) as exc:
         usecase.execute("token")
     assert str(exc.value) == ERROR_MESSAGES["MISSING_TOKEN_DATA"]
@@ -100,7 +100,7 @@ def test_verification_token_not_found_raises_error(setup_dependencies):
     }
     user_repo.get_verified_email_token.return_value = None
 
-    usecase = VerifiedEmailUseCase(user_repo, token_service)
+    usecase = VerifiedEmailUseCase(user_repo, MagicMock(), token_service)
     with pytest.raises(ValueError) as exc:
         usecase.execute("token")
     assert str(exc.value) == ERROR_MESSAGES["VERIFICATION_TOKEN_NOT_FOUND"]
@@ -116,7 +116,7 @@ def test_token_mismatch_raises_error(setup_dependencies):
     user_repo.get_verified_email_token.return_value = MockToken()
     token_service.match_token_hash.return_value = False
 
-    usecase = VerifiedEmailUseCase(user_repo, token_service)
+    usecase = VerifiedEmailUseCase(user_repo, MagicMock(), token_service)
     with pytest.raises(ValueError) as exc:
         usecase.execute("token")
     assert str(exc.value) == ERROR_MESSAGES["TOKEN_MISMATCH"]
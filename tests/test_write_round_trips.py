@@ -0,0 +1,62 @@
+# tests/test_write_round_trips.py
+import pytest
+from sqlalchemy import event
+
+from app.infrastructure.database import db_connection
+
+
+@pytest.fixture
+def statements(flask_app):
+    # استعلامات SQL المنفذة أثناء الطلب (BEGIN / COMMIT لا تمر عبر cursor)
+    executed = []
+
+    def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        executed.append(statement)
+
+    event.listen(db_connection.engine, "before_cursor_execute", _before_cursor_execute)
+    try:
+        yield executed
+    finally:
+        event.remove(db_connection.engine, "before_cursor_execute", _before_cursor_execute)
+
+
+def test_create_task_is_insert_plus_counter_upsert(flask_app, auth_headers, statements):
+    response = flask_app.test_client().post("/api/task/", json={"text": "write once"}, headers=auth_headers)
+
+    assert response.status_code == 201
+    assert response.get_json()["created_at"] is not None
+    assert len(statements) == 2
+    assert statements[0].startswith("INSERT INTO tasks")
+    assert statements[1].startswith("INSERT INTO user_task_counters")
+
+
+def test_complete_task_is_update_plus_counter_upsert(flask_app, auth_headers, statements):
+    client = flask_app.test_client()
+    task_id = client.post("/api/task/", json={"text": "finish me"}, headers=auth_headers).get_json()["id"]
+    statements.clear()
+
+    response = client.patch(f"/api/task/complete/{task_id}", headers=auth_headers)
+
+    assert response.get_json()["is_completed"] is True
+    assert len(statements) == 2
+
+
+def test_create_group_is_insert_and_version_bump(flask_app, auth_headers, statements):
+    response = flask_app.test_client().post("/api/group/", json={"name": "home"}, headers=auth_headers)
+
+    assert response.status_code == 201
+    assert len(statements) == 2
+
+
+def test_update_group_is_update_and_version_bump(flask_app, auth_headers, statements):
+    client = flask_app.test_client()
+    group_id = client.post("/api/group/", json={"name": "home"}, headers=auth_headers).get_json()["id"]
+    statements.clear()
+
+    response = client.put(f"/api/group/{group_id}", json={"name": "work"}, headers=auth_headers)
+    missing = client.put("/api/group/999", json={"name": "work"}, headers=auth_headers)
+
+    assert response.get_json()["data"]["name"] == "work"
+    assert missing.status_code == 404
+    # UPDATE ... RETURNING لكل محاولة، ورفع data_version للتحديث الناجح فقط
+    assert len(statements) == 3